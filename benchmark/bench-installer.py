@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+# This file is part of Hopsworks
+# Copyright (C) 2024, Hopsworks AB. All rights reserved
+#
+# Hopsworks is free software: you can redistribute it and/or modify it under the terms of
+# the GNU Affero General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Hopsworks is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmarks install-hopsworks.py end-to-end without a cloud account.
+
+Scripted stand-ins for kubectl, helm, eksctl, aws, gcloud, az and curl (fake-cli.py)
+are put on PATH, and a fake Kubernetes API server plays back a configurable progression
+of pods and jobs once `helm upgrade` runs. For each environment the installer runs in
+its own scratch directory and the harness reports wall time, subprocess forks and API
+calls per minute during wait_for_deployment (requests plus the watch events streamed to
+the installer), failing when a regression threshold is
+exceeded. The LoadBalancer of the fake cluster points at 127.0.0.1, where the harness
+serves the Hopsworks ports (28181, 8182) over TLS, so only one benchmark runs at a time.
+
+Usage: python3 benchmark/bench-installer.py [--env AWS --env GCP] [--latency 0.05] [--jobs 12]
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+INSTALLER = os.path.join(os.path.dirname(BENCH_DIR), "install-hopsworks.py")
+FAKE_CLI = os.path.join(BENCH_DIR, "fake-cli.py")
+FAKE_TOOLS = ["kubectl", "helm", "eksctl", "aws", "gcloud", "az", "curl"]
+DEFAULT_THRESHOLDS = os.path.join(BENCH_DIR, "thresholds.json")
+
+# Menu choice and prompt answers, in the order the installer asks for them
+ENVIRONMENTS = {
+    "AWS": ["1", "bench", "bench-cluster", "bench-bucket", "m6i.2xlarge", "4"],
+    "Azure": ["2", "bench-rg", "eastus", "bench-cluster", "5", "Standard_D8_v4"],
+    "GCP": ["3", "bench-project", "europe-west1-b", "bench-cluster", "5", "n2-standard-8"],
+    "OVH": ["4", "{kubeconfig}"],
+}
+
+# (pod name, app label); the Hopsworks instance only becomes Running after the last job
+POD_TEMPLATES = [
+    ("mgmd-0", "rondb"), ("ndbmtd-0", "rondb"), ("mysqlds-0", "rondb"),
+    ("namenode-0", "namenode"), ("datanode-0", "datanode"), ("datanode-1", "datanode"),
+    ("broker-0", "kafka"), ("opensearch-master-0", "opensearch"),
+    ("hopsworks-instance-0", "hopsworks-instance"),
+]
+
+# Failures --inject-failure makes the kafka broker pod run into, as container waiting reasons or Warning events
+INJECTED_FAILURES = ["ImagePullBackOff", "CrashLoopBackOff", "FailedScheduling", "ProvisioningFailed"]
+INJECTED_FAILURES_EVENTS = {
+    "FailedScheduling": ("FailedScheduling", "Pod", "{pod}"),
+    "ProvisioningFailed": ("ProvisioningFailed", "PersistentVolumeClaim", "data-{pod}"),
+}
+
+class FakeCluster:
+    """
+    In-memory Kubernetes API for one namespace. Objects appear and progress on a timeline
+    that starts when the fake helm reports an upgrade; every change is logged as a watch
+    event with a new resourceVersion.
+    """
+    def __init__(self, namespace="hopsworks", jobs=12, job_interval=2.0, pods=len(POD_TEMPLATES),
+                 pod_interval=0.5, pod_startup=3.0, lb_delay=2.0, nodes=3, failure=None, watch_expiry=None):
+        self.namespace = namespace
+        self.job_count = jobs
+        self.job_interval = job_interval
+        self.pod_count = pods
+        self.pod_interval = pod_interval
+        self.pod_startup = pod_startup
+        self.lb_delay = lb_delay
+
+        self.lock = threading.Condition()
+        self.resource_version = 1
+        self.objects = {"pods": {}, "jobs": {}, "statefulsets": {}, "services": {}, "configmaps": {}, "events": {}}
+        self.nodes = nodes
+        self.failure = failure  # One of INJECTED_FAILURES, the broker pod never gets ready
+        self.daemonsets = {}  # name -> (created, object), pods are synthesized in daemonset_pods
+        self.events = []  # (resourceVersion, kind, type, object)
+        self.installed_at = None
+        self.requests = []  # (time, method, path)
+        self.watch_events = []  # time of every watch event streamed
+        self.watch_expiry = watch_expiry  # Seconds after which watches end with 410 Gone, forcing a relist
+        self.stopped = threading.Event()
+        self.server = None
+
+    # Timeline
+    def _desired_state(self, now):
+        desired = {"pods": {}, "jobs": {}, "statefulsets": {}, "services": {}, "events": {}}
+        if self.installed_at is None:
+            return desired
+        elapsed = now - self.installed_at
+        # Left behind by an earlier, failed install whose volume claim is gone; must not be reported
+        desired["events"]["data-previous-0.stale"] = {"reason": "ProvisioningFailed", "kind": "PersistentVolumeClaim",
+                                                      "at": self.installed_at - 600, "name": "data-previous-0"}
+        last_job = self.job_count * self.job_interval
+
+        for i in range(self.job_count):
+            complete = elapsed >= (i + 1) * self.job_interval
+            desired["jobs"][f"job-{i}"] = {"conditions": [{"type": "Complete", "status": "True"}] if complete else []}
+
+        templates = POD_TEMPLATES + [(f"worker-{i}", "worker") for i in range(max(0, self.pod_count - len(POD_TEMPLATES)))]
+        for i, (name, app) in enumerate(templates[:self.pod_count]):
+            created = i * self.pod_interval
+            if elapsed < created:
+                continue
+            ready_at = last_job if app == "hopsworks-instance" else created + self.pod_startup
+            running = elapsed >= ready_at
+            # Every pod belongs to a statefulset named after it without the ordinal
+            owner = name.rsplit("-", 1)[0]
+            desired["pods"][name] = {"app": app, "phase": "Running" if running else "Pending", "owner": owner}
+            if self.failure and app == "kafka" and elapsed >= created + 1:
+                waiting = None if self.failure in INJECTED_FAILURES_EVENTS else self.failure
+                desired["pods"][name].update(phase="Pending", waiting=waiting)
+                reason, kind, involved = INJECTED_FAILURES_EVENTS.get(self.failure, (None, None, None))
+                if reason:
+                    desired["events"][f"{name}.failure"] = {"reason": reason, "kind": kind, "at": self.installed_at + created + 1,
+                                                            "name": involved.format(pod=name), "pod": name}
+                sts_running = False
+            else:
+                sts_running = running
+            sts = desired["statefulsets"].setdefault(owner, {"app": app, "replicas": 0, "ready": 0})
+            sts["ready"] += sts_running
+
+        for i, (name, app) in enumerate(templates[:self.pod_count]):
+            desired["statefulsets"].setdefault(name.rsplit("-", 1)[0], {"app": app, "replicas": 0, "ready": 0})["replicas"] += 1
+
+        # FakeEndpoints listens there
+        ingress = [{"ip": "127.0.0.1"}] if elapsed >= self.lb_delay else []
+        desired["services"]["hopsworks-release"] = {"ingress": ingress}
+        return desired
+
+    def _render(self, kind, name, spec):
+        metadata = {"name": name, "namespace": self.namespace, "uid": f"{kind}-{name}",
+                    "resourceVersion": str(self.resource_version)}
+        if kind == "jobs":
+            return {"metadata": metadata, "status": {"conditions": spec["conditions"]}}
+        if kind == "pods":
+            metadata["labels"] = {"app": spec["app"]}
+            metadata["ownerReferences"] = [{"kind": "StatefulSet", "name": spec["owner"]}]
+            status = {"phase": spec["phase"]}
+            if spec.get("waiting"):
+                status["containerStatuses"] = [{"name": spec["app"], "restartCount": 6, "state": {"waiting": {
+                    "reason": spec["waiting"], "message": f"injected {spec['waiting']}"}}}]
+            return {"metadata": metadata, "status": status}
+        if kind == "events":
+            involved = {"kind": spec["kind"], "name": spec["name"]}
+            if spec["kind"] == "Pod":
+                involved["uid"] = f"pods-{spec['pod']}"
+            return {"metadata": metadata, "type": "Warning", "reason": spec["reason"], "involvedObject": involved,
+                    "message": f"injected {spec['reason']}",
+                    "lastTimestamp": datetime.fromtimestamp(spec["at"], timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")}
+        if kind == "statefulsets":
+            metadata["labels"] = {"app": spec["app"]}
+            return {"metadata": metadata, "spec": {"replicas": spec["replicas"]}, "status": {"readyReplicas": spec["ready"]}}
+        return {"metadata": metadata, "spec": {"type": "LoadBalancer"},
+                "status": {"loadBalancer": {"ingress": spec["ingress"]}}}
+
+    def _tick(self):
+        while not self.stopped.wait(0.05):
+            desired = self._desired_state(time.time())
+            with self.lock:
+                for kind, objects in desired.items():
+                    for name, spec in objects.items():
+                        current = self.objects[kind].get(name)
+                        if current is not None and current["_spec"] == spec:
+                            continue
+                        self.resource_version += 1
+                        obj = self._render(kind, name, spec)
+                        self.objects[kind][name] = {"_spec": spec, "object": obj}
+                        self.events.append((self.resource_version, kind, "MODIFIED" if current else "ADDED", obj))
+                        self.lock.notify_all()
+
+    def daemonset_pods(self):
+        """
+        One pod per node for every daemonset, whose images are all pulled a second after it was
+        created, except the kafka image when ImagePullBackOff is injected
+        """
+        pods = []
+        for name, (created, daemonset) in self.daemonsets.items():
+            spec = daemonset["spec"]["template"]["spec"]
+            pulled = time.time() - created >= 1
+            statuses = []
+            for i, c in enumerate(spec["containers"]):
+                if pulled and self.failure == "ImagePullBackOff" and "kafka" in c["image"]:
+                    state = {"waiting": {"reason": "ImagePullBackOff"}}
+                else:
+                    state = {"running": {}} if pulled else {"waiting": {"reason": "ContainerCreating"}}
+                statuses.append({"name": c["name"], "image": c["image"], "state": state,
+                                 "imageID": f"sha256:{i}" if "running" in state else ""})
+            for node in range(self.nodes):
+                pods.append({"metadata": {"name": f"{name}-{node}", "labels": daemonset["spec"]["selector"]["matchLabels"]},
+                             "status": {"phase": "Running" if pulled else "Pending", "containerStatuses": statuses}})
+        return pods
+
+    # API
+    def list(self, kind):
+        with self.lock:
+            return {"kind": "List", "metadata": {"resourceVersion": str(self.resource_version)},
+                    "items": [entry["object"] for entry in self.objects[kind].values()]}
+
+    def watch(self, kind, resource_version, timeout):
+        """Yields watch events after `resource_version` until `timeout` seconds have passed"""
+        deadline = time.time() + timeout
+        expires = time.time() + self.watch_expiry if self.watch_expiry else None
+        position = int(resource_version or 0)
+        while not self.stopped.is_set():
+            if expires and time.time() >= expires:
+                yield {"type": "ERROR", "object": {"kind": "Status", "status": "Failure", "reason": "Expired", "code": 410}}
+                return
+            with self.lock:
+                pending = [event for event in self.events if event[0] > position and event[1] == kind]
+                if not pending:
+                    remaining = min(deadline, expires or deadline) - time.time()
+                    if remaining <= 0:
+                        if time.time() >= deadline:
+                            return
+                        continue
+                    self.lock.wait(min(remaining, 1))
+                    continue
+            for rv, _, event_type, obj in pending:
+                position = rv
+                yield {"type": event_type, "object": obj}
+
+    def start(self):
+        cluster = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = 64 * 1024  # headers and body in one segment, flushed after each request
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, body, content_type="application/json"):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _not_found(self):
+                self._send(404, {"kind": "Status", "status": "Failure", "reason": "NotFound",
+                                 "message": f"{self.path} not found", "code": 404})
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                return json.loads(self.rfile.read(length) or b"{}")
+
+            def _stream(self, events):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for event in events:
+                        data = (json.dumps(event) + "\n").encode()
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                        self.wfile.flush()
+                        cluster.watch_events.append(time.time())
+                    self.wfile.write(b"0\r\n\r\n")
+                except (BrokenPipeError, ConnectionResetError):
+                    self.close_connection = True
+
+            def do_GET(self):
+                cluster.requests.append((time.time(), "GET", self.path))
+                url = urllib.parse.urlparse(self.path)
+                query = dict(urllib.parse.parse_qsl(url.query))
+                ns = cluster.namespace
+                collection = re.fullmatch(rf"/(?:api/v1|apis/batch/v1|apis/apps/v1)/namespaces/{ns}/(pods|jobs|statefulsets|services|configmaps|events)", url.path)
+                item = re.fullmatch(rf"/api/v1/namespaces/{ns}/(services|configmaps)/([^/]+)", url.path)
+
+                daemonset = re.fullmatch(rf"/apis/apps/v1/namespaces/{ns}/daemonsets/([^/]+)", url.path)
+                if daemonset:
+                    entry = cluster.daemonsets.get(daemonset.group(1))
+                    if not entry:
+                        return self._not_found()
+                    return self._send(200, dict(entry[1], status={"desiredNumberScheduled": cluster.nodes}))
+                if collection and collection.group(1) == "pods" and query.get("labelSelector"):
+                    return self._send(200, {"items": cluster.daemonset_pods()})
+
+                if collection and query.get("watch"):
+                    self._stream(cluster.watch(collection.group(1), query.get("resourceVersion"),
+                                               float(query.get("timeoutSeconds", 300))))
+                elif collection:
+                    self._send(200, cluster.list(collection.group(1)))
+                elif item:
+                    entry = cluster.objects[item.group(1)].get(item.group(2))
+                    self._send(200, entry["object"]) if entry else self._not_found()
+                elif url.path == "/api/v1/nodes":
+                    self._send(200, {"items": [{"metadata": {"name": f"node-{i}", "labels": {
+                        "node.kubernetes.io/instance-type": "b3-32"}},
+                        "status": {"allocatable": {"cpu": "7910m", "memory": "28Gi", "pods": "110"}}}
+                        for i in range(cluster.nodes)]})
+                elif url.path == "/api/v1/pods":
+                    # System pods, one per node
+                    self._send(200, {"items": [{"metadata": {"name": f"kube-proxy-{i}", "namespace": "kube-system"},
+                        "spec": {"nodeName": f"node-{i}", "containers": [
+                            {"name": "kube-proxy", "resources": {"requests": {"cpu": "100m", "memory": "128Mi"}}}]},
+                        "status": {"phase": "Running"}} for i in range(cluster.nodes)]})
+                elif re.fullmatch(r"/api/v1/namespaces/[^/]+", url.path):
+                    self._send(200, {"metadata": {"name": url.path.rsplit("/", 1)[1]}, "status": {"phase": "Active"}})
+                elif re.fullmatch(r"/api/v1/namespaces/[^/]+/serviceaccounts/default", url.path):
+                    self._send(200, {"metadata": {"name": "default"}})
+                elif re.fullmatch(r"/apis/apps/v1/namespaces/[^/]+/deployments/[^/]+", url.path):
+                    self._send(200, {"spec": {"replicas": 1}, "status": {"readyReplicas": 1}})
+                else:
+                    self._not_found()
+
+            def _store_configmap(self, name, created):
+                body = self._body()
+                with cluster.lock:
+                    if not created and name not in cluster.objects["configmaps"]:
+                        return self._not_found()
+                    cluster.resource_version += 1
+                    body.setdefault("metadata", {})["resourceVersion"] = str(cluster.resource_version)
+                    cluster.objects["configmaps"][name] = {"_spec": None, "object": body}
+                self._send(201 if created else 200, body)
+
+            def do_PUT(self):
+                cluster.requests.append((time.time(), "PUT", self.path))
+                if re.fullmatch(r"/apis/apps/v1/namespaces/[^/]+/daemonsets/[^/]+", self.path):
+                    self._body()  # Drain it, the connection is reused
+                    return self._not_found() if self.path.rsplit("/", 1)[1] not in cluster.daemonsets else self._send(200, {})
+                item = re.fullmatch(rf"/api/v1/namespaces/{cluster.namespace}/configmaps/([^/]+)", self.path)
+                self._store_configmap(item.group(1), created=False) if item else self._not_found()
+
+            def do_DELETE(self):
+                cluster.requests.append((time.time(), "DELETE", self.path))
+                name = self.path.rsplit("/", 1)[1]
+                if "/daemonsets/" in self.path and cluster.daemonsets.pop(name, None):
+                    return self._send(200, {"kind": "Status", "status": "Success"})
+                self._not_found()
+
+            def do_POST(self):
+                if self.path == "/_bench/helm-upgrade":
+                    if cluster.installed_at is None:
+                        cluster.installed_at = time.time()
+                    return self._send(200, {})
+                if self.headers.get("X-Amz-Target", "").endswith((".CreateRepository", ".DescribeRepositories")):
+                    # boto3 ECR calls from setup_aws_ecr, routed here with AWS_ENDPOINT_URL_ECR
+                    name = self._body().get("repositoryName") or "bench"
+                    uri = f"123456789012.dkr.ecr.us-east-1.amazonaws.com/{name}"
+                    return self._send(200, {"repository": {"repositoryName": name, "repositoryUri": uri}},
+                                      "application/x-amz-json-1.1")
+                cluster.requests.append((time.time(), "POST", self.path))
+                if re.fullmatch(r"/apis/apps/v1/namespaces/[^/]+/daemonsets", self.path):
+                    body = self._body()
+                    cluster.daemonsets[body["metadata"]["name"]] = (time.time(), body)
+                    return self._send(201, body)
+                if self.path == f"/api/v1/namespaces/{cluster.namespace}/configmaps":
+                    body = self._body()
+                    with cluster.lock:
+                        cluster.resource_version += 1
+                        cluster.objects["configmaps"][body["metadata"]["name"]] = {"_spec": None, "object": body}
+                    return self._send(201, body)
+                self._not_found()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        threading.Thread(target=self._tick, daemon=True).start()
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def stop(self):
+        self.stopped.set()
+        with self.lock:
+            self.lock.notify_all()
+        self.server.shutdown()
+
+class FakeEndpoints:
+    """The UI and API ports of the LoadBalancer: HTTPS servers on 127.0.0.1 with a throwaway self-signed certificate"""
+    PORTS = (28181, 8182)
+
+    def __init__(self, directory, delay=0.0):
+        self.directory = directory
+        self.delay = delay
+        self.servers = []
+        self.stopped = threading.Event()
+
+    def start(self):
+        cert, key = os.path.join(self.directory, "endpoint.crt"), os.path.join(self.directory, "endpoint.key")
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-keyout", key, "-out", cert,
+                        "-subj", "/CN=localhost", "-days", "1"], check=True, capture_output=True)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, like the real LoadBalancer, so --benchmark measures requests and not handshakes
+            protocol_version = "HTTP/1.1"
+            wbufsize = 64 * 1024  # headers and body in one segment, flushed after each request
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                data = b'{"status": "ok"}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        class Server(ThreadingHTTPServer):
+            request_queue_size = 128
+
+        # Like a LoadBalancer that takes a while to route, the ports only open after the delay
+        def serve():
+            if self.stopped.wait(self.delay):
+                return
+            for port in self.PORTS:
+                server = Server(("127.0.0.1", port), Handler)
+                server.daemon_threads = True
+                server.socket = context.wrap_socket(server.socket, server_side=True)
+                self.servers.append(server)
+                threading.Thread(target=server.serve_forever, daemon=True).start()
+        threading.Thread(target=serve, daemon=True).start()
+
+    def stop(self):
+        self.stopped.set()
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+
+def write_kubeconfig(path, server):
+    with open(path, "w") as f:
+        json.dump({
+            "apiVersion": "v1", "kind": "Config", "current-context": "bench",
+            "contexts": [{"name": "bench", "context": {"cluster": "bench", "user": "bench"}}],
+            "clusters": [{"name": "bench", "cluster": {"server": server}}],
+            "users": [{"name": "bench", "user": {"token": "bench-token"}}],
+        }, f)
+
+def run_environment(environment, options):
+    """Runs the installer once against the fakes and returns its measurements"""
+    scratch = tempfile.mkdtemp(prefix=f"bench-{environment.lower()}-")
+    bin_dir, home, work, state = (os.path.join(scratch, d) for d in ("bin", "home", "work", "state"))
+    if options.home:
+        home = os.path.abspath(options.home)  # Shared between runs: chart cache, install history
+    for directory in (bin_dir, home, work, state):
+        os.makedirs(directory, exist_ok=True)
+    for tool in FAKE_TOOLS:
+        os.symlink(FAKE_CLI, os.path.join(bin_dir, tool))
+
+    cluster = FakeCluster(jobs=options.jobs, job_interval=options.job_interval, pods=options.pods,
+                          pod_interval=options.pod_interval, pod_startup=options.pod_startup, lb_delay=options.lb_delay,
+                          nodes=options.nodes, failure=options.inject_failure, watch_expiry=options.watch_expiry)
+    api = cluster.start()
+    endpoints = FakeEndpoints(scratch, delay=options.endpoint_delay)
+    endpoints.start()
+    kubeconfig = os.path.join(scratch, "kubeconfig")
+    write_kubeconfig(kubeconfig, api)
+    os.makedirs(os.path.join(home, ".aws"), exist_ok=True)
+    with open(os.path.join(home, ".aws", "credentials"), "w") as f:
+        f.write("[bench]\naws_access_key_id = bench\naws_secret_access_key = bench\n")
+
+    fork_log = os.path.join(scratch, "forks.jsonl")
+    trace_file = os.path.join(scratch, "trace.json")
+    env = dict(os.environ,
+               PATH=f"{bin_dir}{os.pathsep}{os.environ['PATH']}", HOME=home, KUBECONFIG=kubeconfig,
+               BENCH_FORK_LOG=fork_log, BENCH_STATE_DIR=state, BENCH_API=api,
+               BENCH_LATENCY=str(options.latency), AWS_REGION="us-east-1", AWS_DEFAULT_REGION="us-east-1",
+               AWS_ACCESS_KEY_ID="bench", AWS_SECRET_ACCESS_KEY="bench", AWS_ENDPOINT_URL_ECR=api)
+    env.pop("AWS_PROFILE", None)
+    for tool_latency in options.tool_latency:
+        tool, seconds = tool_latency.split("=", 1)
+        env[f"BENCH_LATENCY_{tool.upper()}"] = seconds
+
+    answers = "\n".join(answer.format(kubeconfig=kubeconfig) for answer in ENVIRONMENTS[environment]) + "\n"
+    command = [sys.executable, INSTALLER, "--no-user-data", "--skip-license", "--trace", trace_file] + options.installer_arg
+    start = time.time()
+    with open(os.path.join(scratch, "installer.log"), "w") as log:
+        try:
+            result = subprocess.run(command, input=answers, text=True, cwd=work, env=env,
+                                    stdout=log, stderr=subprocess.STDOUT, timeout=options.timeout)
+            returncode = result.returncode
+        except subprocess.TimeoutExpired:
+            returncode = "timeout"
+    wall_time = time.time() - start
+    cluster.stop()
+    endpoints.stop()
+
+    with open(fork_log) as f:
+        forks = [json.loads(line) for line in f]
+    spans = []
+    if os.path.exists(trace_file):
+        with open(trace_file) as f:
+            spans = json.load(f)["spans"]
+    wait = next((span for span in spans if span["name"] == "wait_for_deployment"), None)
+    wait_calls_per_minute = None
+    if wait:
+        duration = max(wait["end"] - wait["start"], 1e-6)
+        # The informer opens its watches before the wait, what it is served while waiting counts
+        calls = (sum(1 for t, _, _ in cluster.requests if wait["start"] <= t <= wait["end"])
+                 + sum(1 for t in cluster.watch_events if wait["start"] <= t <= wait["end"]))
+        wait_calls_per_minute = calls / duration * 60
+
+    measurement = {
+        "environment": environment,
+        "exit_code": returncode,
+        "wall_time": round(wall_time, 2),
+        "forks": len(forks),
+        "run_command_calls": sum(1 for span in spans if span["cat"] == "command"),
+        "api_calls": len(cluster.requests),
+        "wait_for_deployment": round(wait["end"] - wait["start"], 2) if wait else None,
+        "wait_api_calls_per_minute": round(wait_calls_per_minute, 1) if wait_calls_per_minute is not None else None,
+        "forks_by_tool": {tool: sum(1 for fork in forks if fork["tool"] == tool) for tool in FAKE_TOOLS},
+        "scratch": scratch,
+    }
+    if not options.keep:
+        shutil.rmtree(scratch, ignore_errors=True)
+    return measurement
+
+def check_thresholds(results, thresholds):
+    """Returns a list of human readable threshold violations"""
+    violations = []
+    for result in results:
+        if result["exit_code"] != 0:
+            violations.append(f"{result['environment']}: installer exited with {result['exit_code']}")
+        limits = dict(thresholds.get("default", {}), **thresholds.get(result["environment"], {}))
+        for metric, limit in limits.items():
+            value = result.get(metric)
+            if value is not None and value > limit:
+                violations.append(f"{result['environment']}: {metric} = {value} exceeds {limit}")
+    return violations
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark install-hopsworks.py against scripted fakes")
+    parser.add_argument('--env', action='append', choices=sorted(ENVIRONMENTS), help='Environment to benchmark (repeatable, default: all)')
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds every fake CLI invocation takes')
+    parser.add_argument('--tool-latency', action='append', default=[], metavar='TOOL=SECONDS', help='Per-tool latency, e.g. eksctl=5')
+    parser.add_argument('--jobs', type=int, default=12, help='Jobs the fake chart creates')
+    parser.add_argument('--job-interval', type=float, default=1.0, help='Seconds between job completions')
+    parser.add_argument('--pods', type=int, default=len(POD_TEMPLATES), help='Pods the fake chart creates')
+    parser.add_argument('--pod-interval', type=float, default=0.5, help='Seconds between pod creations')
+    parser.add_argument('--pod-startup', type=float, default=3.0, help='Seconds a pod stays Pending')
+    parser.add_argument('--nodes', type=int, default=3, help='Nodes of the fake cluster (7.9 CPUs, 28 GiB allocatable each)')
+    parser.add_argument('--inject-failure', choices=INJECTED_FAILURES, help='Make the kafka broker pod fail this way, e.g. to try --fail-fast')
+    parser.add_argument('--watch-expiry', type=float, help='Seconds after which every watch ends with 410 Gone, so the installer has to relist')
+    parser.add_argument('--endpoint-delay', type=float, default=0.0, help='Seconds before the LoadBalancer ports accept connections')
+    parser.add_argument('--lb-delay', type=float, default=2.0, help='Seconds before the LoadBalancer gets an address')
+    parser.add_argument('--installer-arg', action='append', default=[], help='Extra installer argument, e.g. --installer-arg=--prepull-images')
+    parser.add_argument('--timeout', type=float, default=600, help='Seconds before an installer run is killed')
+    parser.add_argument('--thresholds', default=DEFAULT_THRESHOLDS, help='JSON file with regression thresholds')
+    parser.add_argument('--output', help='Write the measurements to this JSON file')
+    parser.add_argument('--home', help='HOME directory to reuse across runs instead of a fresh one, e.g. to build up install history')
+    parser.add_argument('--keep', action='store_true', help='Keep scratch directories (logs, traces) for inspection')
+    options = parser.parse_args()
+
+    results = []
+    for environment in options.env or list(ENVIRONMENTS):
+        print(f"Benchmarking {environment}...", flush=True)
+        results.append(run_environment(environment, options))
+
+    print(f"\n{'env':<6} {'exit':>5} {'wall(s)':>8} {'forks':>6} {'run_cmd':>8} {'api':>5} {'wait(s)':>8} {'api/min in wait':>16}")
+    for r in results:
+        print(f"{r['environment']:<6} {str(r['exit_code']):>5} {r['wall_time']:>8} {r['forks']:>6} {r['run_command_calls']:>8} "
+              f"{r['api_calls']:>5} {str(r['wait_for_deployment']):>8} {str(r['wait_api_calls_per_minute']):>16}")
+        if options.keep:
+            print(f"       logs and trace in {r['scratch']}")
+
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    thresholds = {}
+    if options.thresholds and os.path.exists(options.thresholds):
+        with open(options.thresholds) as f:
+            thresholds = json.load(f)
+    violations = check_thresholds(results, thresholds)
+    for violation in violations:
+        print(f"REGRESSION {violation}")
+    sys.exit(1 if violations else 0)
+
+if __name__ == "__main__":
+    main()
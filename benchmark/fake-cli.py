@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# This file is part of Hopsworks
+# Copyright (C) 2024, Hopsworks AB. All rights reserved
+#
+# Hopsworks is free software: you can redistribute it and/or modify it under the terms of
+# the GNU Affero General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Hopsworks is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+# Scripted stand-in for kubectl, helm, eksctl, aws, gcloud, az and curl, used by bench-installer.py.
+# The harness symlinks this file under each tool name; the tool is picked from argv[0].
+#
+# Environment:
+#   BENCH_FORK_LOG        every invocation is appended here as a JSON line
+#   BENCH_STATE_DIR       scratch state shared between invocations (helm repos, releases)
+#   BENCH_API             base URL of the fake API server, notified of helm installs
+#   BENCH_LATENCY         seconds every invocation takes (default 0)
+#   BENCH_LATENCY_<TOOL>  per-tool override, e.g. BENCH_LATENCY_EKSCTL=2
+#   BENCH_CHART_VERSION   version of the fake Hopsworks chart
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+import urllib.request
+
+TOOL = os.path.basename(sys.argv[0])
+ARGS = sys.argv[1:]
+STATE_DIR = os.environ.get("BENCH_STATE_DIR", ".")
+CHART_VERSION = os.environ.get("BENCH_CHART_VERSION", "4.0.0-bench")
+
+def log_invocation():
+    with open(os.environ["BENCH_FORK_LOG"], "a") as f:
+        f.write(json.dumps({"tool": TOOL, "args": ARGS, "time": time.time()}) + "\n")
+
+def simulate_latency():
+    latency = os.environ.get(f"BENCH_LATENCY_{TOOL.upper()}", os.environ.get("BENCH_LATENCY", "0"))
+    time.sleep(float(latency))
+
+def load_state(name, default):
+    path = os.path.join(STATE_DIR, f"{name}.json")
+    if not os.path.exists(path):
+        return default
+    with open(path) as f:
+        return json.load(f)
+
+def save_state(name, value):
+    with open(os.path.join(STATE_DIR, f"{name}.json"), "w") as f:
+        json.dump(value, f)
+
+def option(name, default=None):
+    """Value of `--name value` or `--name=value`"""
+    for i, arg in enumerate(ARGS):
+        if arg == name and i + 1 < len(ARGS):
+            return ARGS[i + 1]
+        if arg.startswith(name + "="):
+            return arg.split("=", 1)[1]
+    return default
+
+def chart_archive():
+    """A deterministic .tgz of a minimal hopsworks chart, so its digest is stable"""
+    files = {
+        "hopsworks/Chart.yaml": f"apiVersion: v2\nname: hopsworks\nversion: {CHART_VERSION}\n",
+        "hopsworks/values.yaml": "global:\n  _hopsworks: {}\n",
+    }
+    raw = io.BytesIO()
+    with tarfile.open(fileobj=raw, mode="w") as tar:
+        for name, content in sorted(files.items()):
+            data = content.encode()
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = 0
+            tar.addfile(info, io.BytesIO(data))
+    compressed = io.BytesIO()
+    with gzip.GzipFile(fileobj=compressed, mode="wb", mtime=0) as gz:
+        gz.write(raw.getvalue())
+    return compressed.getvalue()
+
+# Workloads `helm template` renders: (kind, name, replicas, images)
+TEMPLATE_WORKLOADS = [
+    ("StatefulSet", "mysqlds", 1, ["docker.hops.works/rondb:22.10", "docker.hops.works/init:1.0"]),
+    ("StatefulSet", "namenode", 1, ["docker.hops.works/hopsfs:3.2"]),
+    ("StatefulSet", "datanode", 2, ["docker.hops.works/hopsfs:3.2"]),
+    ("StatefulSet", "broker", 1, ["docker.hops.works/kafka:3.6"]),
+    ("StatefulSet", "opensearch-master", 1, ["docker.hops.works/opensearch:2.9"]),
+    ("StatefulSet", "hopsworks-instance", 1, ["docker.hops.works/hopsworks:4.0", "docker.hops.works/init:1.0"]),
+    ("Job", "init-db", None, ["docker.hops.works/init:1.0"]),
+]
+
+def template():
+    manifests = []
+    for kind, name, replicas, images in TEMPLATE_WORKLOADS:
+        pod_spec = {"imagePullSecrets": [{"name": "regcred"}],
+                    "initContainers": [{"name": "init", "image": image} for image in images[1:]],
+                    "containers": [{"name": name, "image": images[0],
+                                    "resources": {"requests": {"cpu": "500m", "memory": "1Gi"}}}]}
+        spec = {"template": {"spec": pod_spec}}
+        if replicas is not None:
+            spec["replicas"] = replicas
+        manifests.append(json.dumps({"apiVersion": "apps/v1", "kind": kind, "metadata": {"name": name}, "spec": spec}))
+    return "---\n" + "\n---\n".join(manifests) + "\n"
+
+def notify_api(event):
+    request = urllib.request.Request(f"{os.environ['BENCH_API']}/_bench/{event}", data=b"{}", method="POST")
+    urllib.request.urlopen(request, timeout=10).read()
+
+def kubectl():
+    if ARGS[:2] == ["config", "current-context"]:
+        return "bench\n", 0
+    if ARGS[:2] == ["get", "namespaces"]:
+        return "NAME        STATUS   AGE\nhopsworks   Active   1m\n", 0
+    if ARGS[:1] == ["get"] and "deployment" in ARGS:
+        return "NAME   READY   UP-TO-DATE   AVAILABLE\nbench   1/1     1            1\n", 0
+    return "", 0
+
+def helm():
+    repos = load_state("helm-repos", [])
+    releases = load_state("helm-releases", {})
+    cache_dir = os.path.join(STATE_DIR, "helm-cache")
+
+    if ARGS[:2] == ["env", "HELM_REPOSITORY_CACHE"]:
+        return cache_dir + "\n", 0
+    if ARGS[:2] == ["repo", "list"]:
+        return json.dumps(repos), 0
+    if ARGS[:2] == ["repo", "add"]:
+        repos = [r for r in repos if r["name"] != ARGS[2]] + [{"name": ARGS[2], "url": ARGS[3]}]
+        save_state("helm-repos", repos)
+        return f'"{ARGS[2]}" has been added to your repositories\n', 0
+    if ARGS[:2] == ["repo", "update"]:
+        os.makedirs(cache_dir, exist_ok=True)
+        digest = hashlib.sha256(chart_archive()).hexdigest()
+        with open(os.path.join(cache_dir, "hopsworks-index.yaml"), "w") as f:
+            f.write(f"apiVersion: v1\nentries:\n  hopsworks:\n  - name: hopsworks\n"
+                    f"    version: {CHART_VERSION}\n    digest: {digest}\n")
+        return "Update Complete.\n", 0
+    if ARGS[:2] == ["search", "repo"]:
+        return json.dumps([{"name": "hopsworks/hopsworks", "version": CHART_VERSION}]), 0
+    if ARGS[:1] == ["pull"]:
+        archive = chart_archive()
+        destination = option("--destination")
+        if destination:
+            with open(os.path.join(destination, f"hopsworks-{CHART_VERSION}.tgz"), "wb") as f:
+                f.write(archive)
+        else:
+            with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+                tar.extractall(".")
+        return "", 0
+    if ARGS[:1] == ["template"]:
+        return template(), 0
+    if ARGS[:1] == ["status"]:
+        release = releases.get(ARGS[1])
+        if not release:
+            return "Error: release: not found\n", 1
+        return json.dumps({"name": ARGS[1], "info": {"status": "deployed"},
+                           "chart": {"metadata": {"version": release["chart_version"]}}}), 0
+    if ARGS[:2] == ["upgrade", "--install"]:
+        releases[ARGS[2]] = {"chart_version": CHART_VERSION}
+        save_state("helm-releases", releases)
+        notify_api("helm-upgrade")
+        return f'Release "{ARGS[2]}" has been upgraded. Happy Helming!\n', 0
+    return "", 0
+
+def aws():
+    if ARGS[:2] == ["sts", "get-caller-identity"]:
+        if option("--query") == "Account":
+            return "123456789012\n", 0
+        return json.dumps({"Account": "123456789012", "Arn": "arn:aws:iam::123456789012:user/bench"}), 0
+    if ARGS[:2] == ["eks", "describe-cluster"]:
+        return "vpc-0bench\n", 0
+    return "{}\n", 0
+
+def az():
+    clusters = load_state("clusters", [])
+    if ARGS[:2] == ["aks", "show"]:
+        if option("--name") not in clusters:
+            return "ERROR: (ResourceNotFound) The Resource was not found.\n", 3
+        return "Succeeded\n", 0
+    if ARGS[:2] == ["aks", "create"]:
+        save_state("clusters", clusters + [option("--name")])
+    return "{}\n", 0
+
+def gcloud():
+    clusters = load_state("clusters", [])
+    if ARGS[:3] == ["container", "clusters", "describe"]:
+        if ARGS[3] not in clusters:
+            return f"ERROR: (gcloud.container.clusters.describe) Not found: {ARGS[3]}\n", 1
+        return "RUNNING\n", 0
+    if ARGS[:3] == ["container", "clusters", "create"]:
+        save_state("clusters", clusters + [ARGS[3]])
+    return "", 0
+
+def curl():
+    output = option("-o")
+    if output:
+        with open(output, "w") as f:
+            f.write('{"Version": "2012-10-17", "Statement": []}')
+    return "", 0
+
+def main():
+    log_invocation()
+    simulate_latency()
+    handler = {"kubectl": kubectl, "helm": helm, "aws": aws, "az": az, "gcloud": gcloud, "curl": curl}.get(TOOL)
+    output, code = handler() if handler else ("", 0)
+    (sys.stderr if code else sys.stdout).write(output)
+    sys.exit(code)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# This file is part of Hopsworks
+# Copyright (C) 2024, Hopsworks AB. All rights reserved
+#
+# Hopsworks is free software: you can redistribute it and/or modify it under the terms of
+# the GNU Affero General Public License as published by the Free Software Foundation,
+# either version 3 of the License, or (at your option) any later version.
+#
+# Hopsworks is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR
+# PURPOSE.  See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along with this program.
+# If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Checks the layouts --sizing auto picks for clusters of different shapes.
+
+Usage: python3 -m pytest benchmark/test_sizing.py
+"""
+
+import importlib.util
+import os
+
+INSTALLER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "install-hopsworks.py")
+spec = importlib.util.spec_from_file_location("install_hopsworks", INSTALLER)
+installer = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(installer)
+
+def cluster(count, cpu, memory):
+    """node_capacity() of `count` empty nodes with `cpu` cores and `memory` GiB allocatable"""
+    nodes = [{"metadata": {"name": f"node-{i}"},
+              "status": {"allocatable": {"cpu": str(cpu), "memory": f"{memory}Gi", "pods": "110"}}}
+             for i in range(count)]
+    return installer.node_capacity(nodes, [], "hopsworks")
+
+def fits(sizing, free):
+    return not installer.simulate_placement(installer.sizing_workloads(sizing), free)
+
+def test_many_small_nodes_stay_small():
+    free = cluster(10, 1.9, 7)
+    name, sizing = installer.auto_sizing(free)
+    assert name == "small"
+    assert sizing == installer.SIZING_PROFILES["small"]
+
+def test_many_small_nodes_only_get_what_fits():
+    # Plenty of nodes in total, but each one is too small for a large worker
+    free = cluster(40, 3.9, 15)
+    name, sizing = installer.auto_sizing(free)
+    assert name != "small"
+    assert installer.parse_quantity(sizing["worker_cpu"]) <= 3.9 / 2
+    assert installer.parse_quantity(sizing["worker_memory"]) <= 15 * 2**30 / 2
+    assert fits(sizing, free)
+
+def test_profile_follows_capacity():
+    assert installer.auto_sizing(cluster(5, 7.91, 28))[0] == "small"
+    assert installer.auto_sizing(cluster(6, 7.91, 28))[0] == "medium"
+    assert installer.auto_sizing(cluster(10, 7.91, 28))[0] == "large"
+    # The same node count with bigger nodes gets a bigger layout
+    assert installer.auto_sizing(cluster(5, 31.9, 124))[0] == "large"
+
+def test_large_clusters_scale_out():
+    free = cluster(30, 15.9, 62)
+    name, sizing = installer.auto_sizing(free)
+    assert name == "large"
+    assert sizing["node_groups"] > installer.SIZING_PROFILES["large"]["node_groups"]
+    assert sizing["workers"] <= installer.MAX_WORKERS
+    assert sizing["datanodes"] <= installer.MAX_DATANODES
+    assert fits(sizing, free)
+
+def test_empty_cluster():
+    assert installer.auto_sizing({}) == ("small", installer.SIZING_PROFILES["small"])
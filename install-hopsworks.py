@@ -24,10 +24,27 @@ import urllib.request
 import urllib.error
 import ssl
 import threading
+import asyncio
 import boto3
 import json
 import tempfile
+import socket
 import yaml
+import base64
+import http.client
+import urllib.parse
+import concurrent.futures
+import contextlib
+import functools
+import collections
+import random
+import hashlib
+import tarfile
+import sqlite3
+import statistics
+import re
+if sys.platform != 'win32':
+    import fcntl
 
 HOPSWORKS_LOGO = """
 ██╗  ██╗    ██████╗    ██████╗    ███████╗   ██╗    ██╗    ██████╗    ██████╗    ██╗  ██╗   ███████╗
@@ -44,17 +61,71 @@ EVALUATION_LICENSE_URL = "https://www.hopsworks.ai/evaluation-license"
 KNOWN_NONFATAL_ERRORS = [
     "invalid ingress class: IngressClass.networking.k8s.io",
 ]
+STREAM_BUFFER_LINES = 500  # Output lines kept per stream by run_command(stream=True)
 
 """ All the helm stuff here ⬇ """
+HELM_REPO_NAME = "hopsworks"
+HELM_REPO_URL = "https://nexus.hops.works/repository/hopsworks-helm"
+HELM_CHART = f"{HELM_REPO_NAME}/hopsworks"
+CHART_CACHE_DIR = os.path.expanduser("~/.cache/hopsworks-installer/charts")
+CHART_CACHE_KEEP = 3  # Unpacked chart versions kept in the cache
+HELM_INDEX_MAX_AGE = 3600  # Seconds before the repo index is refreshed again
+HISTORY_DB = os.path.expanduser("~/.cache/hopsworks-installer/history.db")
+HISTORY_RUNS = 10  # Most recent successful installs an estimate is based on
+SLOW_FACTOR = 1.5  # A phase or deployment this much slower than past ones is flagged
+ENVIRONMENTS = ["AWS", "Azure", "GCP", "OVH"]
+FLEET_DIR = "hopsworks-fleet"  # Working directories of --fleet installs, one per cluster
+FLEET_REFRESH = 15  # Seconds between fleet progress tables
+HELM_RELEASE = "hopsworks-release"
+PREPULL_DAEMONSET = "hopsworks-image-prepull"  # Short-lived DaemonSet of --prepull-images
+PREPULL_TIMEOUT = 1200  # Seconds to wait for every node to pull every image
+# Machine types the preflight check suggests, (name, vCPUs, memory GiB), smallest first
+MACHINE_TYPES = {
+    "AWS": [("m6i.xlarge", 4, 16), ("m6i.2xlarge", 8, 32), ("m6i.4xlarge", 16, 64), ("m6i.8xlarge", 32, 128)],
+    "GCP": [("n2-standard-4", 4, 16), ("n2-standard-8", 8, 32), ("n2-standard-16", 16, 64), ("n2-standard-32", 32, 128)],
+    "Azure": [("Standard_D4_v4", 4, 16), ("Standard_D8_v4", 8, 32), ("Standard_D16_v4", 16, 64), ("Standard_D32_v4", 32, 128)],
+    "OVH": [("b3-16", 4, 16), ("b3-32", 8, 32), ("b3-64", 16, 64), ("b3-128", 32, 128)],
+}
+CONTROL_PLANE_TAINTS = ("node-role.kubernetes.io/control-plane", "node-role.kubernetes.io/master")
+ALLOCATABLE_SHARE = 0.85  # Part of a new machine's capacity assumed left for pods after system reservations
+MAX_SUGGESTED_NODES = 50
+ENDPOINT_PORTS = {"UI": 28181, "API": 8182}  # Served by the LoadBalancer, over TLS
+ENDPOINT_TIMEOUT = 600  # Seconds to wait for the LoadBalancer to resolve and accept connections
+PROBE_TIMEOUT = 5
+BENCHMARK_PATHS = {"UI": "/", "API": "/hopsworks-api/api/"}  # What --benchmark requests on each endpoint
+BENCHMARK_OUTPUT = "hopsworks-benchmark.json"
+INSTALLER_STATE_CONFIGMAP = "hopsworks-installer-state"  # Holds the fingerprint of the deployed configuration
+
 HELM_BASE_CONFIG = {
     "hopsworks.service.worker.external.https.type": "LoadBalancer",
     "global._hopsworks.externalLoadBalancers.enabled": "true",
     "global._hopsworks.imagePullPolicy": "Always",
-    "hopsworks.replicaCount.worker": "1",
-    "rondb.clusterSize.activeDataReplicas": "1",
-    "hopsfs.datanode.count": "2"
 }
 
+# Layouts --sizing chooses from: Hopsworks workers, RonDB replicas and node groups, MySQL servers,
+# HopsFS datanodes and the cpu/memory each worker requests (None leaves the chart's default).
+# small is the layout installs always had, and the default
+SIZING_PROFILES = {
+    "small": {"workers": 1, "data_replicas": 1, "node_groups": None, "mysqlds": None, "datanodes": 2,
+              "worker_cpu": None, "worker_memory": None},
+    "medium": {"workers": 2, "data_replicas": 2, "node_groups": 1, "mysqlds": 2, "datanodes": 3,
+               "worker_cpu": 4, "worker_memory": "16Gi"},
+    "large": {"workers": 3, "data_replicas": 2, "node_groups": 2, "mysqlds": 3, "datanodes": 5,
+              "worker_cpu": 8, "worker_memory": "32Gi"},
+}
+# What one replica of the sized components requests, for --sizing auto to check that a layout fits;
+# workers request what the layout sets when it sets it. Rough figures of the Hopsworks chart
+SIZING_REQUESTS = {
+    "worker": {"cpu": 2, "memory": 8 * 2**30},
+    "ndbmtd": {"cpu": 2, "memory": 8 * 2**30},
+    "mysqld": {"cpu": 1, "memory": 2 * 2**30},
+    "datanode": {"cpu": 0.5, "memory": 2 * 2**30},
+}
+SIZING_SHARE = 1 / 3  # Part of the free cpu and memory --sizing auto gives the sized components, the rest of Hopsworks needs the others
+MAX_NODE_GROUPS = 4
+MAX_WORKERS = 6
+MAX_DATANODES = 12
+
 CLOUD_SPECIFIC_VALUES = {
     "AWS": {
         "global._hopsworks.cloudProvider": "AWS",
@@ -111,31 +182,930 @@ def print_colored(message, color, **kwargs):
     }
     print(f"{colors.get(color, '')}{message}{colors['reset']}", **kwargs)
 
-def run_command(command, verbose=True):
-    if verbose:
-        print_colored(f"Running: {command}", "cyan")
+class Tracer:
+    """Collects timed spans for installer phases, tasks and commands; exported with --trace"""
+    def __init__(self):
+        self.spans = []
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name, category="phase", **attrs):
+        """Times the enclosed block; the yielded dict can be filled with more attributes"""
+        record = {"name": name, "cat": category, "start": time.time(),
+                  "tid": threading.get_ident(), "args": dict(attrs)}
+        try:
+            yield record["args"]
+        except BaseException as e:
+            record["args"]["error"] = type(e).__name__
+            raise
+        finally:
+            record["end"] = time.time()
+            with self.lock:
+                self.spans.append(record)
+
+    def export(self, path):
+        """Writes the spans as JSON to `path` and in Chrome trace format next to it"""
+        with self.lock:
+            spans = sorted(self.spans, key=lambda span: span["start"])
+        origin = spans[0]["start"] if spans else time.time()
+        with open(path, 'w') as f:
+            json.dump({"origin": datetime.fromtimestamp(origin).isoformat(), "spans": [
+                dict(span, duration=round(span["end"] - span["start"], 3)) for span in spans
+            ]}, f, indent=2, default=str)
+
+        chrome_path = f"{os.path.splitext(path)[0]}.chrome.json"
+        with open(chrome_path, 'w') as f:
+            json.dump({"displayTimeUnit": "ms", "traceEvents": [{
+                "name": span["name"], "cat": span["cat"], "ph": "X", "pid": os.getpid(), "tid": span["tid"],
+                "ts": int((span["start"] - origin) * 1e6), "dur": int((span["end"] - span["start"]) * 1e6),
+                "args": span["args"]
+            } for span in spans]}, f, default=str)
+        return path, chrome_path
+
+    def print_summary(self, top=10):
+        with self.lock:
+            spans = sorted(self.spans, key=lambda span: span["end"] - span["start"], reverse=True)
+        if not spans:
+            return
+        print_colored("\nSlowest steps:", "blue")
+        print(f"  {'duration':>9}  {'type':<8} step")
+        for span in spans[:top]:
+            exit_code = span["args"].get("exit_code")
+            suffix = f"  (exit {exit_code})" if exit_code not in (None, 0) else ""
+            print(f"  {span['end'] - span['start']:>8.1f}s  {span['cat']:<8} {span['name'][:90]}{suffix}")
+
+TRACER = Tracer()
+
+def traced(func):
+    """Records every call of an installer step as a span"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with TRACER.span(func.__name__):
+            return func(*args, **kwargs)
+    return wrapper
+
+class OutputTail:
+    """
+    Bounded view of a command's output as it arrives. Only the last `max_lines` lines of
+    each stream are kept; known non-fatal errors are matched while streaming and the latest
+    line of each is kept in the returned stderr even after it scrolled out of the buffer.
+    """
+    def __init__(self, verbose, max_lines=STREAM_BUFFER_LINES):
+        self.verbose = verbose
+        self.tails = {"stdout": collections.deque(maxlen=max_lines), "stderr": collections.deque(maxlen=max_lines)}
+        self.sizes = {"stdout": 0, "stderr": 0}
+        self.nonfatal_lines = {}  # Latest line per KNOWN_NONFATAL_ERRORS entry
+
+    def feed(self, name, line):
+        self.sizes[name] += len(line.encode())
+        self.tails[name].append(line)
+        if name == "stderr":
+            err = next((err for err in KNOWN_NONFATAL_ERRORS if err in line), None)
+            if err is not None:
+                self.nonfatal_lines.pop(err, None)
+                self.nonfatal_lines[err] = line
+        if self.verbose:
+            if name == "stderr":
+                print_colored(line.rstrip('\n'), "yellow", flush=True)
+            else:
+                print(line, end='', flush=True)
+
+    def result(self, returncode, span):
+        """Returns (success, stdout, stderr) and records the exit code and sizes on the span"""
+        span.update(exit_code=returncode, stdout_bytes=self.sizes["stdout"], stderr_bytes=self.sizes["stderr"])
+        stderr = "".join(self.tails["stderr"])
+        scrolled_out = [line for line in self.nonfatal_lines.values() if line not in self.tails["stderr"]]
+        return returncode == 0, "".join(self.tails["stdout"]), "".join(scrolled_out) + stderr
+
+def stream_command(command, verbose, span, max_lines=STREAM_BUFFER_LINES):
+    """
+    Runs a command and forwards its output line by line as it arrives, see OutputTail.
+    If reading the output fails the command is killed before the error is raised.
+    """
+    process = subprocess.Popen(
+        command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors="replace", bufsize=1
+    )
+    output = OutputTail(verbose, max_lines)
+    failures = []
+
+    def pump(pipe, name):
+        try:
+            for line in pipe:
+                output.feed(name, line)
+        except Exception as e:
+            failures.append(e)
+
+    threads = [threading.Thread(target=pump, args=(pipe, name), daemon=True)
+               for pipe, name in ((process.stdout, "stdout"), (process.stderr, "stderr"))]
+    for thread in threads:
+        thread.start()
     try:
-        result = subprocess.run(
-            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
-        if verbose:
-            if result.stdout:
-                print(result.stdout)
-            if result.stderr:
-                print_colored(result.stderr, "yellow")
-        return result.returncode == 0, result.stdout, result.stderr
-    except Exception as e:
-        return False, "", str(e)
+        while any(thread.is_alive() for thread in threads) and not failures:
+            threads[0].join(0.1)
+            threads[1].join(0.1)
+        if failures:
+            raise failures[0]
+        return output.result(process.wait(), span)
+    except BaseException:
+        process.kill()
+        process.wait()
+        # Children of the shell may still hold the pipes open, do not wait on them forever
+        for thread in threads:
+            thread.join(timeout=5)
+        raise
+
+# Values of these options are replaced by redact_command() before a command is shown or traced
+SECRET_OPTIONS = re.compile(r"(--[\w-]*(?:password|passwd|token|secret)[\w-]*[= ]|--from-literal[= ][^=\s]+=)(\S+)")
+
+def redact_command(command):
+    """The command with the values of password, token, secret and --from-literal options masked"""
+    return SECRET_OPTIONS.sub(r"\1****", command)
+
+def run_command(command, verbose=True, stream=False):
+    """
+    Runs a shell command and returns (success, stdout, stderr).
+    With stream=True output is shown as it arrives and only a bounded tail is kept,
+    meant for long-running commands such as eksctl or helm installs.
+    """
+    if verbose:
+        print_colored(f"Running: {redact_command(command)}", "cyan")
+    with TRACER.span(" ".join(command.split()[:3]), "command", command=redact_command(command)) as span:
+        try:
+            if stream:
+                return stream_command(command, verbose, span)
+            result = subprocess.run(
+                command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            )
+            span.update(exit_code=result.returncode, stdout_bytes=len(result.stdout.encode()),
+                        stderr_bytes=len(result.stderr.encode()))
+            if verbose:
+                if result.stdout:
+                    print(result.stdout)
+                if result.stderr:
+                    print_colored(result.stderr, "yellow")
+            return result.returncode == 0, result.stdout, result.stderr
+        except Exception as e:
+            span["exit_code"] = -1
+            return False, "", str(e)
+
+async def run_command_async(command, verbose=True, max_lines=STREAM_BUFFER_LINES):
+    """
+    asyncio counterpart of run_command(stream=True), for commands that run on the same
+    event loop as the deployment monitor. Cancelling it kills the command.
+    """
+    if verbose:
+        print_colored(f"Running: {redact_command(command)}", "cyan")
+    with TRACER.span(" ".join(command.split()[:3]), "command", command=redact_command(command)) as span:
+        try:
+            process = await asyncio.create_subprocess_shell(
+                command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, limit=1024 * 1024
+            )
+        except OSError as e:
+            span["exit_code"] = -1
+            return False, "", str(e)
+        output = OutputTail(verbose, max_lines)
+
+        async def pump(stream, name):
+            async for line in stream:
+                output.feed(name, line.decode(errors="replace"))
+
+        try:
+            await asyncio.gather(pump(process.stdout, "stdout"), pump(process.stderr, "stderr"))
+            return output.result(await process.wait(), span)
+        except asyncio.CancelledError:
+            process.kill()
+            await process.wait()
+            raise
+
+class WaitAbort(Exception):
+    """Raised by a wait_until predicate when the condition can no longer become true"""
+
+def wait_until(predicate, description, timeout=600, initial_delay=1, max_delay=30, factor=2, jitter=0.2):
+    """
+    Polls `predicate` until it returns something truthy, backing off exponentially
+    (with jitter) between attempts and giving up after `timeout` seconds.
+    Returns the predicate's last result, so a falsy value means the deadline passed.
+    """
+    deadline = time.time() + timeout
+    delay = initial_delay
+    attempt = 0
+    with TRACER.span(f"wait: {description}", "wait", timeout=timeout) as span:
+        while True:
+            attempt += 1
+            try:
+                result = predicate()
+            except WaitAbort as e:
+                print_colored(f"Stopped waiting for {description}: {e}", "red")
+                span.update(attempts=attempt, aborted=str(e))
+                return None
+            if result:
+                span["attempts"] = attempt
+                return result
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                print_colored(f"Timed out after {timeout}s waiting for {description}.", "yellow")
+                span.update(attempts=attempt, timed_out=True)
+                return result
+            if attempt == 1:
+                print_colored(f"Waiting for {description}...", "yellow")
+            time.sleep(min(remaining, delay * random.uniform(1 - jitter, 1 + jitter)))
+            delay = min(delay * factor, max_delay)
+
+class PromptClock:
+    """Time spent waiting for answers at prompts, which run_phase leaves out of the phase timings"""
+    def __init__(self):
+        self.waited = 0.0
+
+    def input(self, prompt):
+        started = time.time()
+        try:
+            return input(prompt)
+        finally:
+            self.waited += time.time() - started
+
+PROMPTS = PromptClock()
 
 def get_user_input(prompt, options=None):
     while True:
-        response = input(prompt + " ").strip()
+        try:
+            response = PROMPTS.input(prompt + " ").strip()
+        except EOFError:
+            print_colored(f"\nNo input available for: {prompt}", "red")
+            sys.exit(1)
         if options is None or response.lower() in [option.lower() for option in options]:
             return response
         print_colored(f"Invalid input. Expected one of: {', '.join(options)}", "yellow")
 
+class TaskGraph:
+    """
+    Runs named steps on a worker pool as soon as all of their dependencies have succeeded.
+    A step fails by returning False or raising; everything downstream of it is skipped.
+    """
+    def __init__(self, name, max_workers=4, journal=None):
+        self.name = name
+        self.max_workers = max_workers
+        self.journal = journal
+        self.tasks = {}
+        self.timings = {}
+        self.failed = []
+        self.skipped = []
+        self.resumed = []
+
+    def add(self, name, func, deps=()):
+        self.tasks[name] = (func, tuple(deps))
+
+    def _check(self):
+        for name, (_, deps) in self.tasks.items():
+            for dep in deps:
+                if dep not in self.tasks:
+                    raise ValueError(f"Task '{name}' depends on unknown task '{dep}'")
+        visiting, visited = set(), set()
+        def visit(name):
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through task '{name}'")
+            if name not in visited:
+                visiting.add(name)
+                for dep in self.tasks[name][1]:
+                    visit(dep)
+                visiting.discard(name)
+                visited.add(name)
+        for name in self.tasks:
+            visit(name)
+
+    def _execute(self, name):
+        start = time.time()
+        try:
+            with TRACER.span(name, "task", graph=self.name):
+                return self.tasks[name][0]() is not False
+        except Exception as e:
+            print_colored(f"[{name}] {e}", "red")
+            return False
+        finally:
+            self.timings[name] = (start, time.time())
+
+    def run(self):
+        """Runs every task; returns True if all of them succeeded"""
+        self._check()
+        pending = dict(self.tasks)
+        succeeded = set()
+        running = {}
+        if self.journal:
+            # Steps finished by an earlier, interrupted run
+            for name in list(pending):
+                if self.journal.is_task_done(self.name, name):
+                    succeeded.add(name)
+                    self.resumed.append(name)
+                    del pending[name]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while pending or running:
+                for name, (_, deps) in list(pending.items()):
+                    if any(dep in self.failed or dep in self.skipped for dep in deps):
+                        self.skipped.append(name)
+                        del pending[name]
+                    elif all(dep in succeeded for dep in deps):
+                        running[pool.submit(self._execute, name)] = name
+                        del pending[name]
+                if not running:
+                    break
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.result():
+                        succeeded.add(name)
+                        if self.journal:
+                            self.journal.complete_task(self.name, name)
+                    else:
+                        self.failed.append(name)
+        return not self.failed and not self.skipped
+
+    def critical_path(self):
+        """The chain of dependencies that ended last, i.e. the one that bounded the total run time"""
+        if not self.timings:
+            return []
+        name = max(self.timings, key=lambda n: self.timings[n][1])
+        path = [name]
+        while True:
+            deps = [dep for dep in self.tasks[name][1] if dep in self.timings]
+            if not deps:
+                break
+            name = max(deps, key=lambda n: self.timings[n][1])
+            path.append(name)
+        return list(reversed(path))
+
+    def report(self):
+        if self.resumed:
+            print_colored(f"\n{self.name}: resumed past {', '.join(self.resumed)}", "cyan")
+        if not self.timings:
+            return
+        origin = min(start for start, _ in self.timings.values())
+        total = max(end for _, end in self.timings.values()) - origin
+        print_colored(f"\n{self.name} finished in {total:.0f}s:", "blue")
+        for name, (start, end) in sorted(self.timings.items(), key=lambda item: item[1][0]):
+            status = "failed" if name in self.failed else "ok"
+            print(f"  {name:<28} +{start - origin:>6.1f}s  {end - start:>7.1f}s  {status}")
+        for name in self.skipped:
+            print(f"  {name:<28} skipped")
+        path = self.critical_path()
+        path_time = sum(self.timings[n][1] - self.timings[n][0] for n in path)
+        print_colored(f"Critical path ({path_time:.0f}s): {' -> '.join(path)}", "cyan")
+
+class InstallJournal:
+    """
+    Persistent record of one installation: the answers given, the installer state and
+    every completed phase with the resources it produced. Written after each step so
+    `--resume` can pick up at the first incomplete phase after a dropped session.
+    """
+    VERSION = 1
+
+    def __init__(self, path, persistent=True):
+        self.path = os.path.abspath(os.path.expanduser(path))
+        # Kept in memory only, e.g. for --loadbalancer-only which must not replace a real journal
+        self.persistent = persistent
+        self.data = {"version": self.VERSION, "created": datetime.now().isoformat(),
+                     "state": {}, "answers": {}, "phases": {}, "tasks": {}}
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        with open(self.path) as f:
+            data = json.load(f)
+        if data.get("version") != self.VERSION:
+            raise ValueError(f"Unsupported journal version in {self.path}")
+        self.data = data
+
+    def save(self):
+        if not self.persistent:
+            return
+        self.data["updated"] = datetime.now().isoformat()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.data, f, indent=2, default=str)
+        os.replace(tmp_path, self.path)  # Never leave a half-written journal behind
+
+    @property
+    def state(self):
+        return self.data["state"]
+
+    @property
+    def answers(self):
+        return self.data["answers"]
+
+    def backup(self):
+        """Moves the journal file aside, returning where it went"""
+        backup_path = f"{self.path}.{datetime.now().strftime('%Y%m%d%H%M%S')}.bak"
+        os.replace(self.path, backup_path)
+        return backup_path
+
+    def is_done(self, phase):
+        return phase in self.data["phases"]
+
+    def is_complete(self):
+        return self.is_done("finalize")
+
+    def complete(self, phase, resources):
+        self.data["phases"][phase] = {"completed_at": datetime.now().isoformat(), "resources": resources}
+        self.save()
+
+    def is_task_done(self, graph, task):
+        return task in self.data["tasks"].get(graph, {})
+
+    def complete_task(self, graph, task):
+        self.data["tasks"].setdefault(graph, {})[task] = datetime.now().isoformat()
+        self.save()
+
+class InstallHistory:
+    """
+    Durations of past installations in a local SQLite database, keyed by environment, node
+    count and machine type. Used to estimate the time left while deploying and to flag
+    installations that are much slower than the usual ones.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY, environment TEXT, node_count TEXT, machine_type TEXT,
+            started TEXT, success INTEGER, deploy_seconds REAL
+        );
+        CREATE TABLE IF NOT EXISTS phases (run_id INTEGER, phase TEXT, seconds REAL);
+        CREATE TABLE IF NOT EXISTS jobs (run_id INTEGER, job TEXT, seconds REAL);
+    """
+
+    def __init__(self, path=HISTORY_DB):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=10)  # Fleet installs share the file
+        self.db.executescript(self.SCHEMA)
+
+    def record(self, key, started, success, phases, jobs=None, deploy_seconds=None):
+        """Stores one run: {phase: seconds}, and {job: seconds after helm started} if it deployed"""
+        with self.db:
+            run_id = self.db.execute(
+                "INSERT INTO runs (environment, node_count, machine_type, started, success, deploy_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?)", (*key, started, int(success), deploy_seconds)).lastrowid
+            self.db.executemany("INSERT INTO phases VALUES (?, ?, ?)",
+                                [(run_id, phase, seconds) for phase, seconds in phases.items()])
+            self.db.executemany("INSERT INTO jobs VALUES (?, ?, ?)",
+                                [(run_id, job, seconds) for job, seconds in (jobs or {}).items()])
+
+    def deployments(self, key, limit=HISTORY_RUNS):
+        """Past successful deployments as {"total": seconds until ready, "jobs": sorted completion times}"""
+        runs = self.db.execute(
+            "SELECT id, deploy_seconds FROM runs WHERE environment = ? AND node_count = ? AND machine_type = ? "
+            "AND success = 1 AND deploy_seconds IS NOT NULL ORDER BY id DESC LIMIT ?", (*key, limit)).fetchall()
+        return [{"total": total, "jobs": sorted(seconds for (seconds,) in self.db.execute(
+                    "SELECT seconds FROM jobs WHERE run_id = ?", (run_id,)))}
+                for run_id, total in runs]
+
+    def usual_phase_duration(self, key, phase, limit=HISTORY_RUNS):
+        """Median duration of `phase` in recent successful runs, None without history"""
+        durations = [seconds for (seconds,) in self.db.execute(
+            "SELECT phases.seconds FROM phases JOIN runs ON runs.id = phases.run_id "
+            "WHERE environment = ? AND node_count = ? AND machine_type = ? AND success = 1 AND phase = ? "
+            "ORDER BY runs.id DESC LIMIT ?", (*key, phase, limit))]
+        return statistics.median(durations) if durations else None
+
+def estimate_remaining(history, complete_jobs):
+    """
+    From past deployments, returns (median seconds they still needed once `complete_jobs` jobs
+    were complete, median seconds after which they had one more job complete, or were ready).
+    """
+    remaining, next_step = [], []
+    for run in history:
+        times = run["jobs"]
+        reached = times[min(complete_jobs, len(times)) - 1] if complete_jobs and times else 0
+        remaining.append(max(run["total"] - reached, 0))
+        next_step.append(times[complete_jobs] if complete_jobs < len(times) else run["total"])
+    if not remaining:
+        return None, None
+    return statistics.median(remaining), statistics.median(next_step)
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+# Kubernetes API access
+def kubeconfig_file():
+    """The kubeconfig kubectl would use: the first entry of KUBECONFIG, else ~/.kube/config"""
+    return os.path.expanduser(os.environ.get('KUBECONFIG', '').split(os.pathsep)[0] or "~/.kube/config")
+
+class KubeAPIError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+class KubeStream:
+    """Iterator over the JSON lines of a watch response; close() interrupts it from another thread"""
+    def __init__(self, lines, closer):
+        self._lines = lines
+        self._closer = closer
+        self.closed = False
+
+    def __iter__(self):
+        try:
+            for line in self._lines:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        except (OSError, ValueError, AttributeError, http.client.HTTPException):
+            if not self.closed:
+                raise
+
+    def close(self):
+        self.closed = True
+        try:
+            self._closer()
+        except Exception:
+            pass
+
+class KubeClient:
+    """
+    Minimal Kubernetes API client built on the current kubeconfig context.
+    Requests go through a small pool of keep-alive connections and JSON is decoded
+    in-process, so status loops don't fork kubectl or redo a TLS handshake per call.
+    """
+    def __init__(self, kubeconfig_path=None, pool_size=4, timeout=30):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        self._auth_lock = threading.Lock()
+        self._token = None
+        self._token_expiry = None
+        self.request_count = 0
+
+        self.kubeconfig_path = os.path.expanduser(kubeconfig_path or kubeconfig_file())
+        with open(self.kubeconfig_path) as f:
+            config = yaml.safe_load(f)
+
+        def named(section, name):
+            for entry in config.get(section) or []:
+                if entry.get('name') == name:
+                    return entry.get(section[:-1]) or {}
+            raise ValueError(f"{section[:-1]} '{name}' not found in {self.kubeconfig_path}")
+
+        context = named('contexts', config['current-context'])
+        cluster = named('clusters', context['cluster'])
+        self.user = named('users', context['user']) if context.get('user') else {}
+        if self.user.get('auth-provider'):
+            raise ValueError("auth-provider kubeconfig entries are not supported")
+
+        server = urllib.parse.urlparse(cluster['server'])
+        self.scheme = server.scheme
+        self.host = server.hostname
+        self.port = server.port or (443 if self.scheme == 'https' else 80)
+        self.base_path = server.path.rstrip('/')
+        self.ssl_context = self._build_ssl_context(cluster) if self.scheme == 'https' else None
+
+    def _build_ssl_context(self, cluster):
+        context = ssl.create_default_context()
+        if cluster.get('insecure-skip-tls-verify'):
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif cluster.get('certificate-authority-data'):
+            context.load_verify_locations(cadata=base64.b64decode(cluster['certificate-authority-data']).decode())
+        elif cluster.get('certificate-authority'):
+            context.load_verify_locations(cafile=os.path.expanduser(cluster['certificate-authority']))
+
+        # Client certificates; ssl only loads them from files
+        if self.user.get('client-certificate-data') and self.user.get('client-key-data'):
+            with tempfile.TemporaryDirectory() as tmp:
+                cert_file, key_file = os.path.join(tmp, 'client.crt'), os.path.join(tmp, 'client.key')
+                with open(cert_file, 'wb') as f:
+                    f.write(base64.b64decode(self.user['client-certificate-data']))
+                with open(key_file, 'wb') as f:
+                    f.write(base64.b64decode(self.user['client-key-data']))
+                context.load_cert_chain(cert_file, key_file)
+        elif self.user.get('client-certificate') and self.user.get('client-key'):
+            context.load_cert_chain(os.path.expanduser(self.user['client-certificate']),
+                                    os.path.expanduser(self.user['client-key']))
+        return context
+
+    def _bearer_token(self, refresh=False):
+        if self.user.get('token'):
+            return self.user['token']
+        if self.user.get('tokenFile'):
+            with open(os.path.expanduser(self.user['tokenFile'])) as f:
+                return f.read().strip()
+        if not self.user.get('exec'):
+            return None
+
+        # Exec plugins (aws eks get-token, gke-gcloud-auth-plugin, kubelogin); cache until expiry
+        with self._auth_lock:
+            if not refresh and self._token and (self._token_expiry is None or time.time() < self._token_expiry - 60):
+                return self._token
+            spec = self.user['exec']
+            env = os.environ.copy()
+            env.update({item['name']: item['value'] for item in spec.get('env') or []})
+            env['KUBERNETES_EXEC_INFO'] = json.dumps({
+                "apiVersion": spec.get('apiVersion', 'client.authentication.k8s.io/v1beta1'),
+                "kind": "ExecCredential",
+                "spec": {"interactive": False}
+            })
+            result = subprocess.run([spec['command']] + list(spec.get('args') or []),
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
+            if result.returncode != 0:
+                raise KubeAPIError(401, f"exec credential plugin failed: {result.stderr.strip()}")
+            status = json.loads(result.stdout).get('status', {})
+            self._token = status.get('token')
+            expiry = status.get('expirationTimestamp')
+            self._token_expiry = datetime.fromisoformat(expiry.replace('Z', '+00:00')).timestamp() if expiry else None
+            return self._token
+
+    def _connect(self, timeout=None):
+        timeout = timeout or self.timeout
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def _acquire(self):
+        with self._pool_lock:
+            if self._pool:
+                return self._pool.pop()
+        return self._connect()
+
+    def _release(self, conn):
+        with self._pool_lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(conn)
+                return
+        conn.close()
+
+    def _headers(self, refresh_token=False, body=None):
+        headers = {"Accept": "application/json"}
+        token = self._bearer_token(refresh=refresh_token)
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+        return headers
+
+    def _url(self, path, params=None):
+        query = urllib.parse.urlencode({k: v for k, v in (params or {}).items() if v is not None})
+        return f"{self.base_path}{path}" + (f"?{query}" if query else "")
+
+    def request(self, method, path, params=None, body=None):
+        """Sends a request over a pooled connection and returns the decoded JSON body"""
+        url = self._url(path, params)
+        payload = json.dumps(body) if body is not None else None
+        for attempt in range(3):
+            conn = self._acquire()
+            try:
+                conn.request(method, url, body=payload, headers=self._headers(refresh_token=attempt > 0, body=body))
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, ConnectionError, OSError):
+                # Stale keep-alive connection, retry on a fresh one
+                conn.close()
+                if attempt == 2:
+                    raise
+                continue
+            self.request_count += 1
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            if response.status == 401 and attempt == 0 and self.user.get('exec'):
+                continue
+            if response.status >= 400:
+                try:
+                    message = json.loads(data).get('message', data.decode(errors='replace'))
+                except ValueError:
+                    message = data.decode(errors='replace')
+                raise KubeAPIError(response.status, message)
+            return json.loads(data) if data else {}
+
+    def get(self, path, **params):
+        return self.request("GET", path, params)
+
+    def watch(self, path, resource_version, timeout_seconds=300, **params):
+        """Opens a watch on a dedicated connection, resuming from `resource_version`"""
+        params.update({"watch": "1", "allowWatchBookmarks": "true",
+                       "resourceVersion": resource_version, "timeoutSeconds": timeout_seconds})
+        conn = self._connect(timeout=timeout_seconds + 30)
+        conn.request("GET", self._url(path, params), headers=self._headers())
+        response = conn.getresponse()
+        self.request_count += 1
+        if response.status >= 400:
+            message = response.read().decode(errors='replace')
+            conn.close()
+            raise KubeAPIError(response.status, message)
+
+        def close():
+            if conn.sock:
+                conn.sock.shutdown(2)
+            conn.close()
+        return KubeStream(iter(response.readline, b''), close)
+
+class KubectlRawClient:
+    """Fallback with the KubeClient interface, for kubeconfigs KubeClient can't use; forks kubectl --raw"""
+    RAW_VERBS = {"GET": "get", "POST": "create", "PUT": "replace", "DELETE": "delete"}
+
+    def __init__(self):
+        self.request_count = 0
+
+    def request(self, method, path, params=None, body=None):
+        query = urllib.parse.urlencode({k: v for k, v in (params or {}).items() if v is not None})
+        url = path + (f"?{query}" if query else "")
+        command = ["kubectl", self.RAW_VERBS[method], "--raw", url]
+        if body is not None:
+            command += ["-f", "-"]
+        result = subprocess.run(command, input=json.dumps(body) if body is not None else None,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        self.request_count += 1
+        if result.returncode != 0:
+            status = 404 if "NotFound" in result.stderr or "not found" in result.stderr else 500
+            raise KubeAPIError(status, result.stderr.strip())
+        return json.loads(result.stdout) if result.stdout.strip() else {}
+
+    def get(self, path, **params):
+        return self.request("GET", path, params)
+
+    def watch(self, path, resource_version, timeout_seconds=300, **params):
+        params.update({"watch": "1", "allowWatchBookmarks": "true",
+                       "resourceVersion": resource_version, "timeoutSeconds": timeout_seconds})
+        url = f"{path}?{urllib.parse.urlencode(params)}"
+        process = subprocess.Popen(["kubectl", "get", "--raw", url],
+                                   stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        self.request_count += 1
+        return KubeStream(process.stdout, process.terminate)
+
+# Everything a call through the API client may raise
+KUBE_ERRORS = (KubeAPIError, OSError, http.client.HTTPException, ValueError)
+
+_kube_client = None
+_kube_client_config = None
+_kube_client_lock = threading.Lock()
+
+def get_kube_client():
+    """Returns the shared API client for the current KUBECONFIG, building it on first use"""
+    global _kube_client, _kube_client_config
+    with _kube_client_lock:
+        # Rebuilt when KUBECONFIG changes or the file is rewritten (get-credentials, eksctl)
+        path = kubeconfig_file()
+        try:
+            config = (path, os.stat(path).st_mtime)
+        except OSError:
+            config = (path, None)
+        if _kube_client is None or config != _kube_client_config:
+            try:
+                _kube_client = KubeClient()
+            except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError, ssl.SSLError) as e:
+                print_colored(f"Using kubectl for cluster access ({e})", "yellow")
+                _kube_client = KubectlRawClient()
+            _kube_client_config = config
+        return _kube_client
+
+# Helm chart cache
+@functools.lru_cache(maxsize=None)
+def helm_repo_index_path():
+    success, output, _ = run_command("helm env HELM_REPOSITORY_CACHE", verbose=False)
+    if not success or not output.strip():
+        return None
+    return os.path.join(output.strip(), f"{HELM_REPO_NAME}-index.yaml")
+
+def ensure_helm_repo(max_age=HELM_INDEX_MAX_AGE):
+    """Adds/refreshes the Hopsworks repo, unless its local index is younger than `max_age` seconds"""
+    index_path = helm_repo_index_path()
+    success, output, _ = run_command("helm repo list -o json", verbose=False)
+    try:
+        configured = success and any(repo.get('name') == HELM_REPO_NAME and repo.get('url', '').rstrip('/') == HELM_REPO_URL
+                                     for repo in json.loads(output))
+    except ValueError:
+        configured = False
+    if configured and index_path and os.path.exists(index_path) and time.time() - os.path.getmtime(index_path) < max_age:
+        print_colored("Hopsworks Helm repo index is fresh, skipping repo update.", "green")
+        return True
+
+    if not run_command(f"helm repo add {HELM_REPO_NAME} {HELM_REPO_URL} --force-update")[0]:
+        print_colored("Failed to add Hopsworks Helm repo.", "red")
+        return False
+    if not run_command(f"helm repo update {HELM_REPO_NAME}")[0]:
+        print_colored("Failed to update Helm repos.", "red")
+        return False
+    return True
+
+def latest_chart_release():
+    """Returns (version, digest) of the newest chart in the local repo index, development versions included"""
+    success, output, _ = run_command(f"helm search repo {HELM_CHART} --devel -o json", verbose=False)
+    try:
+        version = json.loads(output)[0]['version'] if success else None
+    except (ValueError, IndexError, KeyError):
+        version = None
+    if not version:
+        return None, None
+
+    digest = None
+    index_path = helm_repo_index_path()
+    if index_path and os.path.exists(index_path):
+        with open(index_path) as f:
+            index = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        for entry in (index.get('entries') or {}).get('hopsworks', []):
+            if entry.get('version') == version:
+                digest = entry.get('digest')
+                break
+    return version, digest
+
+def lock_file(path, exclusive=True, blocking=True):
+    """
+    Opens and flocks `path`, returning the open file: the lock is held until it is closed.
+    Returns None when blocking=False and another process holds a conflicting lock.
+    There is no flock on Windows: the file is returned unlocked and the cache is not pruned.
+    """
+    f = open(path, "a")
+    if sys.platform == 'win32':
+        return f
+    try:
+        fcntl.flock(f, (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | (0 if blocking else fcntl.LOCK_NB))
+    except BlockingIOError:
+        f.close()
+        return None
+    return f
+
+# Shared locks on the cached charts this process renders from, so other installs do not prune them
+CHARTS_IN_USE = {}
+
+def fetch_chart(version, digest):
+    """
+    Returns the directory of the unpacked chart, from the local cache when this
+    version/digest was pulled before, downloading and verifying it otherwise.
+    The cache is shared by concurrent installs (e.g. --fleet): fetching and pruning
+    happen under a lock, and the chart stays marked in use until the process exits.
+    """
+    key = f"hopsworks-{version}-{digest[:12] if digest else 'unverified'}"
+    target = os.path.join(CHART_CACHE_DIR, key)
+    chart_dir = os.path.join(target, "hopsworks")
+    os.makedirs(CHART_CACHE_DIR, exist_ok=True)
+    with lock_file(os.path.join(CHART_CACHE_DIR, ".lock")):
+        if digest and os.path.exists(os.path.join(chart_dir, "Chart.yaml")):
+            print_colored(f"Using cached Hopsworks chart {version} ({chart_dir})", "green")
+            os.utime(target)  # Keep it off the pruning list
+        elif not download_chart(version, digest, target):
+            return None
+        if chart_dir not in CHARTS_IN_USE:
+            CHARTS_IN_USE[chart_dir] = lock_file(f"{target}.lock", exclusive=False)
+        if sys.platform != 'win32':
+            prune_chart_cache()
+    return chart_dir
+
+def download_chart(version, digest, target):
+    """Pulls, verifies and unpacks the chart into `target`; called with the cache lock held"""
+    with tempfile.TemporaryDirectory(dir=CHART_CACHE_DIR) as tmp:
+        if not run_command(f"helm pull {HELM_CHART} --version {version} --devel --destination {tmp}")[0]:
+            return False
+        archive = os.path.join(tmp, f"hopsworks-{version}.tgz")
+        with open(archive, 'rb') as f:
+            actual = hashlib.sha256(f.read()).hexdigest()
+        if digest and actual != digest:
+            print_colored(f"Chart digest mismatch for {version} (expected {digest}, got {actual}).", "red")
+            return False
+
+        unpacked = os.path.join(tmp, "unpacked")
+        with tarfile.open(archive) as tar:
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(unpacked, filter='data')
+            else:
+                tar.extractall(unpacked)
+        if os.path.exists(target):
+            # An unverified or incomplete copy; replace it unless another install renders from it
+            in_use = lock_file(f"{target}.lock", blocking=False)
+            if in_use is None:
+                return os.path.exists(os.path.join(target, "hopsworks", "Chart.yaml"))
+            shutil.rmtree(target, ignore_errors=True)
+            in_use.close()
+        try:
+            os.rename(unpacked, target)
+        except OSError:
+            # Another process already cached it
+            return os.path.exists(os.path.join(target, "hopsworks", "Chart.yaml"))
+    return True
+
+def prune_chart_cache(keep=CHART_CACHE_KEEP):
+    """Deletes all but the `keep` most recently used charts, skipping those an install still uses"""
+    entries = [os.path.join(CHART_CACHE_DIR, name) for name in os.listdir(CHART_CACHE_DIR)
+               if name.startswith("hopsworks-") and not name.endswith(".lock")]
+    for path in sorted(entries, key=os.path.getmtime, reverse=True)[keep:]:
+        in_use = lock_file(f"{path}.lock", blocking=False)
+        if in_use is None:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        # Safe while holding the cache lock, under which in-use locks are taken
+        os.unlink(f"{path}.lock")
+        in_use.close()
+
 # Main installer
 class HopsworksInstaller:
+    # Attributes saved in the journal and restored on --resume
+    STATE_ATTRIBUTES = [
+        "environment", "kubeconfig_path", "cluster_name", "region", "zone", "namespace",
+        "installation_id", "project_id", "sa_email", "role_name", "use_managed_registry",
+        "managed_registry_info", "aws_profile", "aws_account_id", "policy_name", "resource_group"
+    ]
+    PHASES = ["prerequisites", "managed_registry", "license_and_user_data", "install", "finalize"]
+
     def __init__(self):
             # Common attributes
             self.environment = None
@@ -152,6 +1122,12 @@ class HopsworksInstaller:
             self.sa_email = None
             self.role_name = None
             
+            # Chart, see prepare_chart
+            self.chart_dir = 'hopsworks'
+            self.chart_version = None
+            self.chart_digest = None
+            self.load_balancer_address = None
+            
             # Registry handling
             self.use_managed_registry = False
             self.managed_registry_info = None
@@ -164,46 +1140,232 @@ class HopsworksInstaller:
             # Azure specific (if we need it later)
             self.resource_group = None
 
+            # Checkpoint journal, see --resume
+            self.journal = None
+            # Answers from --answers, see ask()
+            self.preset_answers = {}
+
+            # Timings of this run for the install history, see record_history
+            self.history = None
+            self._history_key = None
+            self.started_at = datetime.now().isoformat()
+            self.phase_durations = {}
+            self.deployment_timing = None
+            self.succeeded = False
+            # Layout of the deployment, see sizing()
+            self._sizing = None
+            self.custom_sizing = {}
+
     def run(self):
         print_colored(HOPSWORKS_LOGO, "white")
         self.parse_arguments()
-        self.check_required_tools()
-        self.get_deployment_environment()
-
-        if not self.args.loadbalancer_only:
-            if self.environment == "GCP":
-                self.setup_gke_prerequisites()
-            elif self.environment == "AWS":
-                self.setup_aws_prerequisites()
-            elif self.environment == "Azure":
-                self.setup_aks_prerequisites()  # This will create the cluster
+        if self.args.fleet:
+            sys.exit(0 if run_fleet(self.args.fleet, self.args.fleet_dir) else 1)
+        try:
+            self.check_required_tools()
+            self.open_journal()
+            self.open_history()
+            if not self.environment:
+                self.get_deployment_environment()
+            self.save_state()
+
+            if not self.args.loadbalancer_only:
+                self.run_phase("prerequisites", self.setup_prerequisites)
+                self.run_phase("managed_registry", self.handle_managed_registry)
+                self.run_phase("license_and_user_data", self.handle_license_and_user_data)
+                if self.journal.is_done("install") or self.run_phase("install", self.install_hopsworks):
+                    print_colored("\nHopsworks installation completed.", "green")
+                    self.run_phase("finalize", self.finalize_installation)
+                    self.succeeded = True
+                    if self.args.benchmark and not self.run_benchmark():
+                        sys.exit(1)
+                else:
+                    print_colored("Hopsworks installation failed. Please check the logs and try again.", "red")
+                    print_colored("Re-run with --resume to continue from this step.", "yellow")
+                    sys.exit(1)
             else:
-                self.setup_and_verify_kubeconfig()  # Only for other environments
-                
-            self.handle_managed_registry()
-            self.handle_license_and_user_data()
-            if self.install_hopsworks():
-                print_colored("\nHopsworks installation completed.", "green")
+                # For loadbalancer-only, we need to set up the necessary variables
+                self.namespace = self.args.namespace
+                self.setup_and_verify_kubeconfig()
                 self.finalize_installation()
+                if self.args.benchmark and not self.run_benchmark():
+                    sys.exit(1)
+        finally:
+            self.record_history()
+            if self.args.trace:
+                TRACER.print_summary()
+                trace_file, chrome_file = TRACER.export(self.args.trace)
+                print_colored(f"Trace written to {trace_file} and {chrome_file} (open the latter in chrome://tracing or Perfetto)", "cyan")
+                
+    def setup_prerequisites(self):
+        if self.environment == "GCP":
+            self.setup_gke_prerequisites()
+        elif self.environment == "AWS":
+            self.setup_aws_prerequisites()
+        elif self.environment == "Azure":
+            self.setup_aks_prerequisites()  # This will create the cluster
+        else:
+            self.setup_and_verify_kubeconfig()  # Only for other environments
+
+    def open_journal(self):
+        """
+        Loads the journal on --resume, otherwise starts a fresh one. An unfinished journal is
+        never overwritten: it is resumed or moved to a backup first.
+        """
+        if self.args.loadbalancer_only:
+            self.journal = InstallJournal(self.args.journal, persistent=False)
+            return
+        self.journal = InstallJournal(self.args.journal)
+        resume = self.args.resume
+        if not resume and self.journal.exists():
+            try:
+                self.journal.load()
+                unfinished = not self.journal.is_complete()
+            except (OSError, ValueError):
+                unfinished = True  # Unreadable, keep it for inspection
+            if unfinished:
+                print_colored(f"Found an unfinished installation in {self.journal.path}", "yellow")
+                resume = get_user_input("Do you want to resume it? (yes/no):", ["yes", "no"]).lower() == "yes"
+                if not resume:
+                    print_colored(f"Moved the previous journal to {self.journal.backup()}", "yellow")
+            self.journal = InstallJournal(self.args.journal)
+
+        if not resume:
+            return
+        try:
+            self.journal.load()
+        except (OSError, ValueError) as e:
+            print_colored(f"Cannot resume, failed to read {self.journal.path}: {e}", "red")
+            sys.exit(1)
+
+        for attr in self.STATE_ATTRIBUTES:
+            if attr in self.journal.state:
+                setattr(self, attr, self.journal.state[attr])
+        if self.aws_profile:
+            os.environ['AWS_PROFILE'] = self.aws_profile
+        if self.environment == "AWS" and self.region:
+            os.environ['AWS_REGION'] = self.region
+        if self.kubeconfig_path:
+            os.environ['KUBECONFIG'] = self.kubeconfig_path
+
+        done = [phase for phase in self.PHASES if self.journal.is_done(phase)]
+        print_colored(f"Resuming {self.environment} installation of '{self.cluster_name}' "
+                      f"(completed: {', '.join(done) or 'nothing yet'})", "cyan")
+
+    def save_state(self):
+        for attr in self.STATE_ATTRIBUTES:
+            self.journal.state[attr] = getattr(self, attr)
+        self.journal.save()
+
+    def run_phase(self, phase, func):
+        """Runs one installer phase unless the journal has it as done, then journals what it produced"""
+        if self.journal.is_done(phase):
+            print_colored(f"\nSkipping {phase.replace('_', ' ')}, already completed.", "cyan")
+            return True
+        before = {attr: getattr(self, attr) for attr in self.STATE_ATTRIBUTES}
+        started, waited = time.time(), PROMPTS.waited
+        result = func()
+        # Unattended time only, so runs compare with each other however long the prompts took
+        self.phase_durations[phase] = time.time() - started - (PROMPTS.waited - waited)
+        self.compare_with_history(phase)
+        if result is False:
+            return False
+        self.save_state()
+        resources = {attr: getattr(self, attr) for attr in self.STATE_ATTRIBUTES
+                     if getattr(self, attr) != before[attr]}
+        self.journal.complete(phase, resources)
+        return True
+
+    def open_history(self):
+        try:
+            self.history = InstallHistory()
+        except (OSError, sqlite3.Error) as e:
+            print_colored(f"Install history unavailable, no time estimates this run: {e}", "yellow")
+
+    def history_key(self):
+        """(environment, node count, machine type) from the answers, else from the nodes of the cluster"""
+        if self._history_key:
+            return self._history_key
+        node_count = self.journal.answers.get("node_count")
+        machine_type = self.journal.answers.get("machine_type")
+        if not (node_count and machine_type):
+            try:
+                nodes = get_kube_client().get("/api/v1/nodes").get('items', [])
+            except KUBE_ERRORS:
+                nodes = []
+            types = collections.Counter(
+                (node.get('metadata', {}).get('labels') or {}).get('node.kubernetes.io/instance-type') for node in nodes)
+            types.pop(None, None)
+            node_count = node_count or (len(nodes) if nodes else None)
+            machine_type = machine_type or (types.most_common(1)[0][0] if types else None)
+        key = (self.environment, str(node_count or "unknown"), machine_type or "unknown")
+        if "unknown" not in key:
+            self._history_key = key
+        return key
+
+    def compare_with_history(self, phase):
+        """Points out a phase that took far longer than it usually does"""
+        # The other phases mostly wait for answers from the user
+        if not self.history or phase not in ("prerequisites", "install"):
+            return
+        try:
+            usual = self.history.usual_phase_duration(self.history_key(), phase)
+        except sqlite3.Error:
+            return
+        took = self.phase_durations[phase]
+        if usual and took > SLOW_FACTOR * usual + 60:
+            print_colored(f"The {phase} step took {format_duration(took)}, it usually takes {format_duration(usual)} "
+                          "for this environment, node count and machine type.", "yellow")
+
+    def record_history(self):
+        if not self.history or not self.phase_durations:
+            return
+        timing = self.deployment_timing or {}
+        try:
+            self.history.record(self.history_key(), self.started_at, self.succeeded, self.phase_durations,
+                                timing.get("jobs"), timing.get("total"))
+        except sqlite3.Error as e:
+            print_colored(f"Could not record this run in the install history: {e}", "yellow")
+
+    def ask(self, key, prompt, default=None, valid=None, invalid="Invalid answer, please try again.", optional=False):
+        """
+        Prompts for an answer once per installation; answers are journaled so --resume does not ask again.
+        Answers given in the --answers file are taken without prompting. Answers rejected by `valid`
+        are asked again, or stop the installation when they come from the --answers file.
+        Optional answers missing from an unattended run fall back to the default.
+        """
+        if key in self.journal.answers:
+            return self.journal.answers[key]
+        while True:
+            if key in self.preset_answers:
+                answer = str(self.preset_answers[key]).strip() or default or ""
             else:
-                print_colored("Hopsworks installation failed. Please check the logs and try again.", "red")
+                try:
+                    answer = PROMPTS.input(prompt).strip() or default or ""
+                except EOFError:
+                    if optional:
+                        answer = default or ""
+                        break
+                    print_colored(f"\nNo answer for '{key}', add it to the --answers file.", "red")
+                    sys.exit(1)
+            if valid is None or valid(answer):
+                break
+            if key in self.preset_answers:
+                print_colored(f"{invalid} ('{key}' in {self.args.answers})", "red")
                 sys.exit(1)
-        else:
-            # For loadbalancer-only, we need to set up the necessary variables
-            self.namespace = self.args.namespace
-            self.setup_and_verify_kubeconfig()
-            self.finalize_installation()
-                
-    def construct_helm_command(self):
-            """Constructs the helm command with proper configuration"""
-            # Base helm command
-            helm_command = [
-                "helm upgrade --install hopsworks-release hopsworks/hopsworks",
-                f"--namespace={self.namespace}",
-                "--create-namespace",
-                "--values hopsworks/values.yaml"
-            ]
-            
+            print_colored(invalid, "yellow")
+        self.journal.answers[key] = answer
+        self.journal.save()
+        return answer
+
+    def forget(self, *keys):
+        """Drops journaled answers so they are asked again, e.g. after they turned out to be wrong"""
+        for key in keys:
+            self.journal.answers.pop(key, None)
+        self.journal.save()
+
+    def build_helm_values(self):
+            """Merges HELM_BASE_CONFIG with the cloud specific values, flattened to --set keys"""
             # Helper function to flatten nested dictionaries
             def flatten_dict(d, parent_key='', sep='.'):
                 items = []
@@ -215,8 +1377,9 @@ class HopsworksInstaller:
                         items.append((new_key, v))
                 return dict(items)
 
-            # Start with base config
+            # Start with base config and the replica counts and requests of --sizing
             helm_values = HELM_BASE_CONFIG.copy()
+            helm_values.update(sizing_values(self.sizing()))
             
             # Add cloud-specific values
             if self.environment in CLOUD_SPECIFIC_VALUES:
@@ -245,10 +1408,14 @@ class HopsworksInstaller:
                 helm_values.update(cloud_config)
 
             # Flatten nested structures
-            flat_values = flatten_dict(helm_values)
-            
+            return flatten_dict(helm_values)
+
+    def helm_value_flags(self):
+            """The --values and --set flags of the release, shared by helm upgrade and helm template"""
+            flags = [f"--values {os.path.join(self.chart_dir, 'values.yaml')}"]
+
             # Add each value with proper escaping and formatting
-            for key, value in flat_values.items():
+            for key, value in self.build_helm_values().items():
                 if value is None:
                     value = "null"
                 elif isinstance(value, bool):
@@ -259,7 +1426,17 @@ class HopsworksInstaller:
                     # Escape special characters in string values
                     value = f'"{str(value)}"'
                 
-                helm_command.append(f"--set {key}={value}")
+                flags.append(f"--set {key}={value}")
+            return flags
+
+    def construct_helm_command(self):
+            """Constructs the helm command with proper configuration"""
+            # Base helm command
+            helm_command = [
+                f"helm upgrade --install {HELM_RELEASE} {self.chart_dir}",
+                f"--namespace={self.namespace}",
+                "--create-namespace",
+            ] + self.helm_value_flags()
 
             # Add timeout and devel flag
             helm_command.extend([
@@ -268,15 +1445,227 @@ class HopsworksInstaller:
             ])
 
             return " ".join(helm_command)
-    def setup_aws_prerequisites(self):
-        """Setup AWS prerequisites including metrics server"""
-        print_colored("\nSetting up AWS prerequisites...", "blue")
-        
-        # 1. Basic AWS setup and verification
-        self.aws_profile = input("Enter your AWS profile name (default: default): ").strip() or "default"
-        os.environ['AWS_PROFILE'] = self.aws_profile
-        
-        # Verify AWS credentials
+
+    def sizing(self):
+        """
+        The layout of --sizing, worked out from the nodes of the cluster for auto. It is journaled,
+        so --resume keeps the layout it started with instead of sizing again.
+        """
+        if self._sizing:
+            return self._sizing
+        name = self.args.sizing
+        journaled = self.journal.answers.get("sizing") if self.journal else None
+        if journaled and journaled.get("profile") == name:
+            self._sizing = journaled["layout"]
+            print_colored(f"Sizing ({journaled['name']}, as before): {format_sizing(self._sizing)}", "cyan")
+            return self._sizing
+        profile = name
+        if name == "custom":
+            sizing = dict(SIZING_PROFILES["small"], **self.custom_sizing)
+        elif name == "auto":
+            try:
+                client = get_kube_client()
+                nodes = client.get("/api/v1/nodes").get('items', [])
+                pods = client.get("/api/v1/pods", fieldSelector="status.phase!=Succeeded,status.phase!=Failed").get('items', [])
+            except KUBE_ERRORS as e:
+                print_colored(f"Could not list the nodes to size the deployment, using the small profile: {e}", "yellow")
+                nodes = []
+            if nodes:
+                name, sizing = auto_sizing(node_capacity(nodes, pods, self.namespace))
+                name = f"auto: {name}"
+            else:
+                name, sizing = "small", SIZING_PROFILES["small"]
+        else:
+            sizing = SIZING_PROFILES[name]
+        print_colored(f"Sizing ({name}): {format_sizing(sizing)}", "cyan")
+        if self.journal:
+            self.journal.answers["sizing"] = {"profile": profile, "name": name, "layout": sizing}
+            self.journal.save()
+        self._sizing = sizing
+        return sizing
+
+    def render_chart(self):
+        """Renders the release locally with helm template; returns its manifests, or None if that failed"""
+        command = " ".join([f"helm template {HELM_RELEASE} {self.chart_dir}", f"--namespace={self.namespace}"]
+                           + self.helm_value_flags())
+        success, output, error = run_command(command, verbose=False)
+        if not success:
+            print_colored(f"Failed to render the chart: {error.strip()}", "yellow")
+            return None
+        try:
+            return [manifest for manifest in yaml.safe_load_all(output) if manifest]
+        except yaml.YAMLError as e:
+            print_colored(f"Failed to parse the rendered chart: {e}", "yellow")
+            return None
+
+    @traced
+    def preflight_check(self):
+        """
+        Simulates scheduling the rendered chart on the nodes of the cluster. Returns False when some
+        pods would find no node, so the install stops now instead of timing out on Pending pods.
+        """
+        manifests = self.render_chart()
+        if manifests is None:
+            print_colored("Skipping the scheduling preflight check.", "yellow")
+            return True
+        client = get_kube_client()
+        try:
+            nodes = client.get("/api/v1/nodes").get('items', [])
+        except KUBE_ERRORS as e:
+            print_colored(f"Could not list the nodes, skipping the scheduling preflight check: {e}", "yellow")
+            return True
+        try:
+            pods = client.get("/api/v1/pods", fieldSelector="status.phase!=Succeeded,status.phase!=Failed").get('items', [])
+        except KUBE_ERRORS:
+            pods = []  # Then only the allocatable capacity is known, the check is less strict
+
+        workloads = chart_workloads(manifests)
+        free = node_capacity(nodes, pods, self.namespace)
+        pod_count = sum(w["replicas"] for w in workloads if w["kind"] not in ("Job", "DaemonSet"))
+        requested = {name: sum(w["requests"][name] * w["replicas"] for w in workloads
+                               if w["kind"] not in ("Job", "PersistentVolumeClaim")) for name in ("cpu", "memory")}
+        storage = sum(w["storage"] for w in workloads)
+        print_colored(f"Preflight: {pod_count} pods request {requested['cpu']:.1f} CPUs, {requested['memory'] / 2**30:.1f} GiB "
+                      f"and {storage / 2**30:.0f} GiB of volumes; {len(free)} schedulable nodes have "
+                      f"{sum(n['cpu'] for n in free.values()):.1f} CPUs and "
+                      f"{sum(n['memory'] for n in free.values()) / 2**30:.1f} GiB free.", "cyan")
+
+        unschedulable = simulate_placement(workloads, free)
+        if not unschedulable:
+            print_colored("Preflight: every pod fits on the cluster.", "green")
+            return True
+
+        print_colored("Preflight: the cluster is too small, these pods would stay Pending:", "red")
+        for name, count in collections.Counter(w["name"] for w in unschedulable).items():
+            requests = next(w["requests"] for w in unschedulable if w["name"] == name)
+            print_colored(f"  {name} x{count} ({requests['cpu']:.2f} CPUs, {requests['memory'] / 2**30:.1f} GiB each)", "red")
+        suggestions = suggest_capacity(workloads, free, self.environment)
+        if suggestions:
+            print_colored("It would fit on: " + ", or ".join(suggestions), "yellow")
+        print_colored("Resize the cluster, or rerun with --skip-preflight to install anyway.", "yellow")
+        return False
+
+    @traced
+    def prepull_images(self):
+        """Pulls the images of the chart on every node at once with a short-lived DaemonSet, ahead of helm"""
+        manifests = self.render_chart()
+        if manifests is None:
+            return False
+        images, pull_secrets = chart_images(manifests)
+        if not images:
+            print_colored("No images found in the chart, nothing to pre-pull.", "yellow")
+            return False
+
+        print_colored(f"Pre-pulling {len(images)} images on every node...", "cyan")
+        client = get_kube_client()
+        path = f"/apis/apps/v1/namespaces/{self.namespace}/daemonsets"
+        daemonset = prepull_daemonset(self.namespace, images, pull_secrets)
+        try:
+            try:
+                # Replaces the one of an interrupted run, if any
+                client.request("PUT", f"{path}/{PREPULL_DAEMONSET}", body=daemonset)
+            except KubeAPIError as e:
+                if e.status != 404:
+                    raise
+                client.request("POST", path, body=daemonset)
+        except KUBE_ERRORS as e:
+            print_colored(f"Could not start the image pre-pull: {e}", "yellow")
+            return False
+
+        failed, progress = set(), None
+
+        def all_pulled():
+            nonlocal progress
+            try:
+                done, given_up, nodes, failing = prepull_status(self.namespace, len(images))
+            except KUBE_ERRORS:
+                return False
+            if failing - failed:
+                print_colored(f"Could not pull: {', '.join(sorted(failing - failed))}", "yellow")
+                failed.update(failing)
+            if (done, nodes) != progress:
+                print_colored(f"Images pulled on {done}/{nodes} nodes", "cyan")
+                progress = (done, nodes)
+            # Retrying a failed pull is up to the kubelet; no point in waiting for it here
+            if given_up and done + given_up >= nodes:
+                raise WaitAbort(f"{len(failed)} images cannot be pulled")
+            return nodes > 0 and done >= nodes
+
+        try:
+            pulled = wait_until(all_pulled, "images to be pulled on every node",
+                                timeout=PREPULL_TIMEOUT, initial_delay=2, max_delay=15)
+        finally:
+            try:
+                client.request("DELETE", f"{path}/{PREPULL_DAEMONSET}")
+            except KUBE_ERRORS as e:
+                print_colored(f"Could not delete the {PREPULL_DAEMONSET} DaemonSet, remove it by hand: {e}", "yellow")
+
+        if not pulled:
+            print_colored("Not every node has every image yet, the remaining pulls happen during the install.", "yellow")
+            return False
+        print_colored("Every node has the images.", "green")
+        return True
+
+    def helm_fingerprint(self):
+        """Hash of everything that decides what helm renders: chart version and digest, namespace and values"""
+        payload = {
+            "chart_version": self.chart_version,
+            "chart_digest": self.chart_digest,
+            "namespace": self.namespace,
+            "values": self.build_helm_values(),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def deployed_fingerprint(self):
+        """Fingerprint recorded by the last successful install, if the release is still deployed with that chart"""
+        success, output, _ = run_command(f"helm status {HELM_RELEASE} -n {self.namespace} -o json", verbose=False)
+        if not success:
+            return None
+        try:
+            release = json.loads(output)
+            if release.get('info', {}).get('status') != 'deployed':
+                return None
+            if release.get('chart', {}).get('metadata', {}).get('version') != self.chart_version:
+                return None
+            state = get_kube_client().get(f"/api/v1/namespaces/{self.namespace}/configmaps/{INSTALLER_STATE_CONFIGMAP}")
+        except KUBE_ERRORS:
+            return None
+        return state.get('data', {}).get('fingerprint')
+
+    def record_fingerprint(self, fingerprint):
+        configmap = {
+            "apiVersion": "v1",
+            "kind": "ConfigMap",
+            "metadata": {"name": INSTALLER_STATE_CONFIGMAP, "namespace": self.namespace},
+            "data": {
+                "fingerprint": fingerprint,
+                "chart_version": str(self.chart_version),
+                "installation_id": str(self.installation_id),
+                "updated": datetime.now().isoformat()
+            }
+        }
+        client = get_kube_client()
+        path = f"/api/v1/namespaces/{self.namespace}/configmaps"
+        try:
+            try:
+                client.request("PUT", f"{path}/{INSTALLER_STATE_CONFIGMAP}", body=configmap)
+            except KubeAPIError as e:
+                if e.status != 404:
+                    raise
+                client.request("POST", path, body=configmap)
+        except KUBE_ERRORS as e:
+            print_colored(f"Could not record the installed configuration: {e}", "yellow")
+
+    @traced
+    def setup_aws_prerequisites(self):
+        """Setup AWS prerequisites including metrics server"""
+        print_colored("\nSetting up AWS prerequisites...", "blue")
+        
+        # 1. Basic AWS setup and verification
+        self.aws_profile = self.ask("aws_profile", "Enter your AWS profile name (default: default): ", "default")
+        os.environ['AWS_PROFILE'] = self.aws_profile
+        
+        # Verify AWS credentials
         cmd = f"aws sts get-caller-identity --profile {self.aws_profile}"
         if not run_command(cmd, verbose=False)[0]:
             print_colored("AWS CLI not properly configured. Please run 'aws configure' first.", "red")
@@ -284,7 +1673,7 @@ class HopsworksInstaller:
         
         # Get basic info
         self.region = self.get_aws_region()
-        self.cluster_name = input("Enter your EKS cluster name: ").strip()
+        self.cluster_name = self.ask("cluster_name", "Enter your EKS cluster name: ")
         
         # Get AWS account ID
         cmd = f"aws sts get-caller-identity --query Account --output text --profile {self.aws_profile}"
@@ -294,315 +1683,353 @@ class HopsworksInstaller:
             sys.exit(1)
         self.aws_account_id = account_id.strip()
 
+        # Ask everything up front, the steps below run unattended and concurrently
+        bucket_name = self.ask("bucket_name", "Enter S3 bucket name for Hopsworks data: ")
+        instance_type = self.ask("machine_type", "Enter instance type (default: m6i.2xlarge): ", "m6i.2xlarge")
+        node_count = self.ask("node_count", "Enter number of nodes (default: 4): ", "4")
+
+        # Resource names derive from this, keep it stable across --resume
+        timestamp = self.journal.answers.setdefault("timestamp", int(time.time()))
+        self.policy_name = f"hopsworks-policy-{timestamp}"
+        alb_policy_name = f"AWSLoadBalancerControllerIAMPolicy-{self.cluster_name}-{timestamp}"
+
         # 2. Create S3 bucket
-        bucket_name = input("Enter S3 bucket name for Hopsworks data: ").strip()
-        cmd = f"aws s3 mb s3://{bucket_name} --region {self.region} --profile {self.aws_profile}"
-        if not run_command(cmd)[0]:
-            print_colored("Failed to create S3 bucket", "red")
-            sys.exit(1)
-        
+        def create_bucket():
+            cmd = f"aws s3 mb s3://{bucket_name} --region {self.region} --profile {self.aws_profile}"
+            if not run_command(cmd)[0]:
+                print_colored("Failed to create S3 bucket", "red")
+                return False
+
         # Enable versioning on the bucket
-        cmd = f"aws s3api put-bucket-versioning --bucket {bucket_name} --versioning-configuration Status=Enabled --profile {self.aws_profile}"
-        if not run_command(cmd)[0]:
-            print_colored("Failed to enable bucket versioning", "red")
-            sys.exit(1)
+        def enable_versioning():
+            cmd = f"aws s3api put-bucket-versioning --bucket {bucket_name} --versioning-configuration Status=Enabled --profile {self.aws_profile}"
+            if not run_command(cmd)[0]:
+                print_colored("Failed to enable bucket versioning", "red")
+                return False
 
         # 3. Create ECR repository
-        print_colored("\nCreating ECR repository...", "cyan")
-        repo_name = f"{self.cluster_name}/hopsworks-base"
-        cmd = f"aws ecr create-repository --repository-name {repo_name} --profile {self.aws_profile} --region {self.region}"
-        if not run_command(cmd)[0]:
-            print_colored("Failed to create ECR repository", "red")
-            sys.exit(1)
+        def create_ecr_repository():
+            print_colored("\nCreating ECR repository...", "cyan")
+            repo_name = f"{self.cluster_name}/hopsworks-base"
+            cmd = f"aws ecr create-repository --repository-name {repo_name} --profile {self.aws_profile} --region {self.region}"
+            if not run_command(cmd)[0]:
+                print_colored("Failed to create ECR repository", "red")
+                return False
 
         # 4. Create IAM policy
-        print_colored("\nCreating IAM policies...", "cyan")
-        policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "HopsworksS3Access",
-                    "Effect": "Allow",
-                    "Action": [
-                        "S3:PutObject", "S3:ListBucket", "S3:GetObject", "S3:DeleteObject",
-                        "S3:AbortMultipartUpload", "S3:ListBucketMultipartUploads",
-                        "S3:PutLifecycleConfiguration", "S3:GetLifecycleConfiguration",
-                        "S3:PutBucketVersioning", "S3:GetBucketVersioning",
-                        "S3:ListBucketVersions", "S3:DeleteObjectVersion"
-                    ],
-                    "Resource": [
-                        f"arn:aws:s3:::{bucket_name}/*",
-                        f"arn:aws:s3:::{bucket_name}"
-                    ]
-                },
-                {
-                    "Sid": "HopsworksECRAccess",
-                    "Effect": "Allow",
-                    "Action": [
-                        "ecr:GetDownloadUrlForLayer", "ecr:BatchGetImage",
-                        "ecr:CompleteLayerUpload", "ecr:UploadLayerPart",
-                        "ecr:InitiateLayerUpload", "ecr:BatchCheckLayerAvailability",
-                        "ecr:PutImage", "ecr:ListImages", "ecr:BatchDeleteImage",
-                        "ecr:GetLifecyclePolicy", "ecr:PutLifecyclePolicy",
-                        "ecr:TagResource"
-                    ],
-                    "Resource": [f"arn:aws:ecr:{self.region}:{self.aws_account_id}:repository/*/hopsworks-base"]
-                },
-                {
-                    "Sid": "HopsworksECRAuthToken",
-                    "Effect": "Allow",
-                    "Action": ["ecr:GetAuthorizationToken"],
-                    "Resource": "*"
-                },
-                {
-                    "Sid": "LoadBalancerAccess",
-                    "Effect": "Allow",
-                    "Action": [
-                        "elasticloadbalancing:*", "ec2:CreateTags", "ec2:DeleteTags",
-                        "ec2:DescribeAccountAttributes", "ec2:DescribeAddresses",
-                        "ec2:DescribeInstances", "ec2:DescribeInternetGateways",
-                        "ec2:DescribeNetworkInterfaces", "ec2:DescribeSecurityGroups",
-                        "ec2:DescribeSubnets", "ec2:DescribeTags", "ec2:DescribeVpcs",
-                        "ec2:ModifyNetworkInterfaceAttribute", 
-                        "ec2:DescribeInstanceTypes",        # Added for RSS management
-                        "ec2:DescribeInstanceTypeOfferings", # Added for RSS management
-                        "iam:CreateServiceLinkedRole", "iam:ListServerCertificates", 
-                        "cognito-idp:DescribeUserPoolClient",
-                        "acm:ListCertificates", "acm:DescribeCertificate",
-                        "waf-regional:*", "wafv2:*", "shield:*"
-                    ],
-                    "Resource": "*"
-                }
-            ]
-        }
-        
-        timestamp = int(time.time())
-        with open(f'policy-{timestamp}.json', 'w') as f:
-            json.dump(policy, f, indent=2)
+        def create_iam_policy():
+            print_colored("\nCreating IAM policies...", "cyan")
+            policy = {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Sid": "HopsworksS3Access",
+                        "Effect": "Allow",
+                        "Action": [
+                            "S3:PutObject", "S3:ListBucket", "S3:GetObject", "S3:DeleteObject",
+                            "S3:AbortMultipartUpload", "S3:ListBucketMultipartUploads",
+                            "S3:PutLifecycleConfiguration", "S3:GetLifecycleConfiguration",
+                            "S3:PutBucketVersioning", "S3:GetBucketVersioning",
+                            "S3:ListBucketVersions", "S3:DeleteObjectVersion"
+                        ],
+                        "Resource": [
+                            f"arn:aws:s3:::{bucket_name}/*",
+                            f"arn:aws:s3:::{bucket_name}"
+                        ]
+                    },
+                    {
+                        "Sid": "HopsworksECRAccess",
+                        "Effect": "Allow",
+                        "Action": [
+                            "ecr:GetDownloadUrlForLayer", "ecr:BatchGetImage",
+                            "ecr:CompleteLayerUpload", "ecr:UploadLayerPart",
+                            "ecr:InitiateLayerUpload", "ecr:BatchCheckLayerAvailability",
+                            "ecr:PutImage", "ecr:ListImages", "ecr:BatchDeleteImage",
+                            "ecr:GetLifecyclePolicy", "ecr:PutLifecyclePolicy",
+                            "ecr:TagResource"
+                        ],
+                        "Resource": [f"arn:aws:ecr:{self.region}:{self.aws_account_id}:repository/*/hopsworks-base"]
+                    },
+                    {
+                        "Sid": "HopsworksECRAuthToken",
+                        "Effect": "Allow",
+                        "Action": ["ecr:GetAuthorizationToken"],
+                        "Resource": "*"
+                    },
+                    {
+                        "Sid": "LoadBalancerAccess",
+                        "Effect": "Allow",
+                        "Action": [
+                            "elasticloadbalancing:*", "ec2:CreateTags", "ec2:DeleteTags",
+                            "ec2:DescribeAccountAttributes", "ec2:DescribeAddresses",
+                            "ec2:DescribeInstances", "ec2:DescribeInternetGateways",
+                            "ec2:DescribeNetworkInterfaces", "ec2:DescribeSecurityGroups",
+                            "ec2:DescribeSubnets", "ec2:DescribeTags", "ec2:DescribeVpcs",
+                            "ec2:ModifyNetworkInterfaceAttribute", 
+                            "ec2:DescribeInstanceTypes",        # Added for RSS management
+                            "ec2:DescribeInstanceTypeOfferings", # Added for RSS management
+                            "iam:CreateServiceLinkedRole", "iam:ListServerCertificates", 
+                            "cognito-idp:DescribeUserPoolClient",
+                            "acm:ListCertificates", "acm:DescribeCertificate",
+                            "waf-regional:*", "wafv2:*", "shield:*"
+                        ],
+                        "Resource": "*"
+                    }
+                ]
+            }
+            
+            with open(f'policy-{timestamp}.json', 'w') as f:
+                json.dump(policy, f, indent=2)
 
-        self.policy_name = f"hopsworks-policy-{timestamp}"
-        cmd = f"aws iam create-policy --policy-name {self.policy_name} --policy-document file://policy-{timestamp}.json --profile {self.aws_profile}"
-        if not run_command(cmd)[0]:
-            print_colored("Failed to create IAM policy", "red")
-            sys.exit(1)
+            cmd = f"aws iam create-policy --policy-name {self.policy_name} --policy-document file://policy-{timestamp}.json --profile {self.aws_profile}"
+            if not run_command(cmd)[0]:
+                print_colored("Failed to create IAM policy", "red")
+                return False
 
-        print_colored("Waiting for policy to propagate...", "yellow")
-        time.sleep(10)
-
-        # 5. Create EKS cluster configuration
-        print_colored("\nCreating EKS cluster configuration...", "cyan")
-        instance_type = input("Enter instance type (default: m6i.2xlarge): ").strip() or "m6i.2xlarge"
-        node_count = input("Enter number of nodes (default: 4): ").strip() or "4"
-
-        cluster_config = {
-            "apiVersion": "eksctl.io/v1alpha5",
-            "kind": "ClusterConfig",
-            "metadata": {
-                "name": self.cluster_name,
-                "region": self.region,
-                "version": "1.29"
-            },
-            "iam": {
-                "withOIDC": True,
-            },
-            "addons": [{
-                "name": "aws-ebs-csi-driver",
-                "wellKnownPolicies": {
-                    "ebsCSIController": True
-                }
-            }],
-            "managedNodeGroups": [{
-                "name": "ng-1",
-                "amiFamily": "AmazonLinux2023",
-                "instanceType": instance_type,
-                "minSize": int(node_count),
-                "maxSize": int(node_count),
-                "volumeSize": 100,
-                "ssh": {
-                    "allow": True
+        def wait_for_policy():
+            policy_arn = f"arn:aws:iam::{self.aws_account_id}:policy/{self.policy_name}"
+            cmd = f"aws iam get-policy --policy-arn {policy_arn} --profile {self.aws_profile}"
+            if not wait_until(lambda: run_command(cmd, verbose=False)[0], "IAM policy to propagate", timeout=60):
+                return False
+
+        # 5. Create EKS cluster
+        def create_eks_cluster():
+            print_colored("\nCreating EKS cluster configuration...", "cyan")
+            cluster_config = {
+                "apiVersion": "eksctl.io/v1alpha5",
+                "kind": "ClusterConfig",
+                "metadata": {
+                    "name": self.cluster_name,
+                    "region": self.region,
+                    "version": "1.29"
                 },
                 "iam": {
-                    "attachPolicyARNs": [
-                        "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
-                        "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
-                        "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly",
-                        f"arn:aws:iam::{self.aws_account_id}:policy/{self.policy_name}"
-                    ],
-                    "withAddonPolicies": {
-                        "awsLoadBalancerController": True
+                    "withOIDC": True,
+                },
+                "addons": [{
+                    "name": "aws-ebs-csi-driver",
+                    "wellKnownPolicies": {
+                        "ebsCSIController": True
                     }
-                }
-            }]
-        }
+                }],
+                "managedNodeGroups": [{
+                    "name": "ng-1",
+                    "amiFamily": "AmazonLinux2023",
+                    "instanceType": instance_type,
+                    "minSize": int(node_count),
+                    "maxSize": int(node_count),
+                    "volumeSize": 100,
+                    "ssh": {
+                        "allow": True
+                    },
+                    "iam": {
+                        "attachPolicyARNs": [
+                            "arn:aws:iam::aws:policy/AmazonEKSWorkerNodePolicy",
+                            "arn:aws:iam::aws:policy/AmazonEKS_CNI_Policy",
+                            "arn:aws:iam::aws:policy/AmazonEC2ContainerRegistryReadOnly",
+                            f"arn:aws:iam::{self.aws_account_id}:policy/{self.policy_name}"
+                        ],
+                        "withAddonPolicies": {
+                            "awsLoadBalancerController": True
+                        }
+                    }
+                }]
+            }
 
-        with open(f'eksctl-{timestamp}.yaml', 'w') as f:
-            yaml.dump(cluster_config, f)
+            with open(f'eksctl-{timestamp}.yaml', 'w') as f:
+                yaml.dump(cluster_config, f)
 
-        # 6. Create EKS cluster
-        print_colored("\nCreating EKS cluster (this will take 15-20 minutes)...", "cyan")
-        cmd = f"eksctl create cluster -f eksctl-{timestamp}.yaml --profile {self.aws_profile}"
-        if not run_command(cmd)[0]:
-            print_colored("Failed to create EKS cluster", "red")
-            sys.exit(1)
+            print_colored("\nCreating EKS cluster (this will take 15-20 minutes)...", "cyan")
+            cmd = f"eksctl create cluster -f eksctl-{timestamp}.yaml --profile {self.aws_profile}"
+            if not run_command(cmd, stream=True)[0]:
+                print_colored("Failed to create EKS cluster", "red")
+                return False
 
-        # 7. Create GP3 storage class
-        print_colored("\nCreating GP3 storage class...", "cyan")
-        storage_class = {
-            "apiVersion": "storage.k8s.io/v1",
-            "kind": "StorageClass",
-            "metadata": {
-                "name": "ebs-gp3"
-            },
-            "provisioner": "ebs.csi.aws.com",
-            "parameters": {
-                "type": "gp3",
-                "csi.storage.k8s.io/fstype": "xfs"
-            },
-            "volumeBindingMode": "WaitForFirstConsumer",
-            "reclaimPolicy": "Delete"
-        }
-        
-        with open(f'storage-class-{timestamp}.yaml', 'w') as f:
-            yaml.dump(storage_class, f)
-        
-        if not run_command(f"kubectl apply -f storage-class-{timestamp}.yaml")[0]:
-            print_colored("Failed to create GP3 storage class", "red")
-            sys.exit(1)
+        # 6. Create GP3 storage class
+        def create_storage_class():
+            print_colored("\nCreating GP3 storage class...", "cyan")
+            storage_class = {
+                "apiVersion": "storage.k8s.io/v1",
+                "kind": "StorageClass",
+                "metadata": {
+                    "name": "ebs-gp3"
+                },
+                "provisioner": "ebs.csi.aws.com",
+                "parameters": {
+                    "type": "gp3",
+                    "csi.storage.k8s.io/fstype": "xfs"
+                },
+                "volumeBindingMode": "WaitForFirstConsumer",
+                "reclaimPolicy": "Delete"
+            }
+            
+            with open(f'storage-class-{timestamp}.yaml', 'w') as f:
+                yaml.dump(storage_class, f)
+            
+            if not run_command(f"kubectl apply -f storage-class-{timestamp}.yaml")[0]:
+                print_colored("Failed to create GP3 storage class", "red")
+                return False
 
-        # 8. Set up AWS Load Balancer Controller
-        print_colored("\nSetting up AWS Load Balancer Controller...", "cyan")
-        
-        # Download and create ALB policy
-        cmd = "curl -o iam_policy_alb.json https://raw.githubusercontent.com/kubernetes-sigs/aws-load-balancer-controller/v2.7.2/docs/install/iam_policy.json"
-        if not run_command(cmd)[0]:
-            print_colored("Failed to download ALB policy", "red")
-            sys.exit(1)
+        # 7. Set up AWS Load Balancer Controller
+        def create_alb_policy():
+            print_colored("\nSetting up AWS Load Balancer Controller...", "cyan")
+            
+            # Download and create ALB policy
+            cmd = "curl -o iam_policy_alb.json https://raw.githubusercontent.com/kubernetes-sigs/aws-load-balancer-controller/v2.7.2/docs/install/iam_policy.json"
+            if not run_command(cmd)[0]:
+                print_colored("Failed to download ALB policy", "red")
+                return False
 
-        alb_policy_name = f"AWSLoadBalancerControllerIAMPolicy-{self.cluster_name}-{timestamp}"
-        cmd = f"aws iam create-policy --policy-name {alb_policy_name} --policy-document file://iam_policy_alb.json --profile {self.aws_profile}"
-        run_command(cmd)  # Ignore if policy exists
+            cmd = f"aws iam create-policy --policy-name {alb_policy_name} --policy-document file://iam_policy_alb.json --profile {self.aws_profile}"
+            run_command(cmd)  # Ignore if policy exists
 
         # Create service account with explicit role
-        print_colored("\nCreating service account for Load Balancer Controller...", "cyan")
-        cmd = (f"eksctl create iamserviceaccount "
-            f"--cluster={self.cluster_name} "
-            f"--namespace=kube-system "
-            f"--name=aws-load-balancer-controller "
-            f"--role-name=AmazonEKSLoadBalancerControllerRole-{self.cluster_name} "
-            f"--attach-policy-arn=arn:aws:iam::{self.aws_account_id}:policy/{alb_policy_name} "
-            f"--override-existing-serviceaccounts "
-            f"--approve "
-            f"--region={self.region}")
-
-        if not run_command(cmd)[0]:
-            print_colored("Failed to create service account for ALB controller", "red")
-            sys.exit(1)
+        def create_alb_service_account():
+            print_colored("\nCreating service account for Load Balancer Controller...", "cyan")
+            cmd = (f"eksctl create iamserviceaccount "
+                f"--cluster={self.cluster_name} "
+                f"--namespace=kube-system "
+                f"--name=aws-load-balancer-controller "
+                f"--role-name=AmazonEKSLoadBalancerControllerRole-{self.cluster_name} "
+                f"--attach-policy-arn=arn:aws:iam::{self.aws_account_id}:policy/{alb_policy_name} "
+                f"--override-existing-serviceaccounts "
+                f"--approve "
+                f"--region={self.region}")
+
+            if not run_command(cmd, stream=True)[0]:
+                print_colored("Failed to create service account for ALB controller", "red")
+                return False
 
         # Install AWS Load Balancer Controller
-        print_colored("\nInstalling AWS Load Balancer Controller...", "cyan")
-        cmd = (f"helm install aws-load-balancer-controller eks/aws-load-balancer-controller "
-            f"-n kube-system "
-            f"--set clusterName={self.cluster_name} "
-            f"--set serviceAccount.create=false "
-            f"--set serviceAccount.name=aws-load-balancer-controller "
-            f"--set region={self.region} "
-            f"--set vpcId=$(aws eks describe-cluster --name {self.cluster_name} --query \"cluster.resourcesVpcConfig.vpcId\" --output text --region {self.region}) "
-            f"--set image.repository=602401143452.dkr.ecr.{self.region}.amazonaws.com/amazon/aws-load-balancer-controller "
-            "--set enableServiceMutatorWebhook=false")
-
-        if not run_command(cmd)[0]:
-            print_colored("Failed to install AWS Load Balancer Controller", "red")
-            sys.exit(1)
+        def install_alb_controller():
+            print_colored("\nInstalling AWS Load Balancer Controller...", "cyan")
+            cmd = (f"helm install aws-load-balancer-controller eks/aws-load-balancer-controller "
+                f"-n kube-system "
+                f"--set clusterName={self.cluster_name} "
+                f"--set serviceAccount.create=false "
+                f"--set serviceAccount.name=aws-load-balancer-controller "
+                f"--set region={self.region} "
+                f"--set vpcId=$(aws eks describe-cluster --name {self.cluster_name} --query \"cluster.resourcesVpcConfig.vpcId\" --output text --region {self.region}) "
+                f"--set image.repository=602401143452.dkr.ecr.{self.region}.amazonaws.com/amazon/aws-load-balancer-controller "
+                "--set enableServiceMutatorWebhook=false")
 
-        # 9. Install and configure metrics server
-        print_colored("\nInstalling metrics server...", "cyan")
-        metrics_cmd = """
-        kubectl apply -f https://github.com/kubernetes-sigs/metrics-server/releases/latest/download/high-availability-1.21+.yaml && \
-        kubectl patch deployment metrics-server -n kube-system --type=json \
-        -p='[{"op": "add", "path": "/spec/template/spec/containers/0/args/-", "value": "--kubelet-insecure-tls"}]'
-        """
-        if not run_command(metrics_cmd)[0]:
-            print_colored("Failed to install metrics server. Some monitoring features might be limited.", "yellow")
-        else:
-            print_colored("Metrics server installed and patched for EKS.", "green")
-
-        # 10. Verify final deployment
-        print_colored("\nVerifying AWS Load Balancer Controller deployment...", "cyan")
-        max_retries = 12
-        for i in range(max_retries):
-            cmd = "kubectl get deployment -n kube-system aws-load-balancer-controller"
-            success, output, _ = run_command(cmd, verbose=False)
-            if success and "1/1" in output:
+            if not run_command(cmd, stream=True)[0]:
+                print_colored("Failed to install AWS Load Balancer Controller", "red")
+                return False
+
+        # 8. Install and configure metrics server
+        def install_metrics_server():
+            print_colored("\nInstalling metrics server...", "cyan")
+            metrics_cmd = """
+            kubectl apply -f https://github.com/kubernetes-sigs/metrics-server/releases/latest/download/high-availability-1.21+.yaml && \
+            kubectl patch deployment metrics-server -n kube-system --type=json \
+            -p='[{"op": "add", "path": "/spec/template/spec/containers/0/args/-", "value": "--kubelet-insecure-tls"}]'
+            """
+            if not run_command(metrics_cmd)[0]:
+                print_colored("Failed to install metrics server. Some monitoring features might be limited.", "yellow")
+            else:
+                print_colored("Metrics server installed and patched for EKS.", "green")
+
+        # 9. Verify final deployment
+        def verify_alb_controller():
+            print_colored("\nVerifying AWS Load Balancer Controller deployment...", "cyan")
+            if wait_until(lambda: deployment_ready("kube-system", "aws-load-balancer-controller"),
+                          "AWS Load Balancer Controller to be ready", timeout=120, initial_delay=2, max_delay=15):
                 print_colored("AWS Load Balancer Controller is ready!", "green")
-                break
-            if i < max_retries - 1:
-                print_colored(f"Waiting for controller to be ready (attempt {i+1}/{max_retries})...", "yellow")
-                time.sleep(10)
 
-        # 11. Cleanup temporary files
+        # Only eksctl and what needs the cluster are serialized; the rest runs alongside
+        graph = TaskGraph("AWS prerequisites", journal=self.journal)
+        graph.add("s3_bucket", create_bucket)
+        graph.add("bucket_versioning", enable_versioning, deps=["s3_bucket"])
+        graph.add("ecr_repository", create_ecr_repository)
+        graph.add("iam_policy", create_iam_policy)
+        graph.add("policy_propagation", wait_for_policy, deps=["iam_policy"])
+        graph.add("alb_policy", create_alb_policy)
+        graph.add("eks_cluster", create_eks_cluster, deps=["policy_propagation"])
+        graph.add("storage_class", create_storage_class, deps=["eks_cluster"])
+        graph.add("metrics_server", install_metrics_server, deps=["eks_cluster"])
+        graph.add("alb_service_account", create_alb_service_account, deps=["eks_cluster", "alb_policy"])
+        graph.add("alb_controller", install_alb_controller, deps=["alb_service_account"])
+        graph.add("alb_controller_ready", verify_alb_controller, deps=["alb_controller"])
+        success = graph.run()
+        graph.report()
+
+        # 10. Cleanup temporary files
         for file in [f'policy-{timestamp}.json', f'eksctl-{timestamp}.yaml', f'storage-class-{timestamp}.yaml', 'iam_policy_alb.json']:
             if os.path.exists(file):
                 os.remove(file)
 
+        if not success:
+            print_colored(f"AWS prerequisites setup failed at: {', '.join(graph.failed)}", "red")
+            print_colored("Fix the issue and re-run with --resume, completed steps will be skipped.", "yellow")
+            sys.exit(1)
+
         print_colored("\nAWS prerequisites setup completed successfully!", "green")
         return True
 
+    @traced
     def setup_gke_prerequisites(self):
         """Setup everything needed before cluster creation"""
         print_colored("\nSetting up GKE prerequisites...", "blue")
 
-        # 1. Get essential info first
-        self.project_id = input("Enter your GCP project ID: ").strip()
-        zone_input = input("Enter your GCP zone (e.g., europe-west1-b). Note: If you select a region like europe-west1, deployments will include all sub-zones (a, b, c), potentially multiplying node counts. Proceed with caution: ").strip()
+        # 1. Get essential info first, the steps below run unattended and concurrently
+        self.project_id = self.ask("project_id", "Enter your GCP project ID: ")
+        zone_input = self.ask("zone", "Enter your GCP zone (e.g., europe-west1-b). Note: If you select a region like europe-west1, deployments will include all sub-zones (a, b, c), potentially multiplying node counts. Proceed with caution: ")
         self.zone = zone_input
         self.region = '-'.join(zone_input.split('-')[:-1])  # extract region from zone
+        self.cluster_name = self.ask("cluster_name", "Enter your GKE cluster name: ", "hopsworks-cluster")
+        node_count = self.ask("node_count", "Enter number of nodes (default: 5): ", "5")
+        machine_type = self.ask("machine_type", "Enter machine type (default: n2-standard-8): ", "n2-standard-8")
 
-        # 2. Create role with timestamp to avoid collision
-        timestamp = int(time.time())
+        # Timestamp to avoid collisions; resource names derive from it, keep it stable across --resume
+        timestamp = self.journal.answers.setdefault("timestamp", int(time.time()))
         self.role_name = f"hopsworksai.instances.{timestamp}"  # Unique role name
-        print_colored(f"Creating role '{self.role_name}'...", "cyan")
+        sa_name = "hopsworksai-instances"
+        self.sa_email = f"{sa_name}@{self.project_id}.iam.gserviceaccount.com"
+        registry_name = f"hopsworks-{self.cluster_name}-{timestamp}"
 
-        role_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
-        try:
-            role_def = {
-                "title": "Hopsworks AI Instances",
-                "description": "Role for Hopsworks instances",
-                "stage": "GA",
-                "includedPermissions": [
-                    # Artifact Registry permissions
-                    "artifactregistry.repositories.create",
-                    "artifactregistry.repositories.get",
-                    "artifactregistry.repositories.uploadArtifacts",
-                    "artifactregistry.repositories.downloadArtifacts",
-                    "artifactregistry.tags.list",
-                    "artifactregistry.repositories.list"
-                ]
-            }
-            yaml.dump(role_def, role_file)
-            role_file.close()
+        # 2. Create role
+        def create_role():
+            print_colored(f"Creating role '{self.role_name}'...", "cyan")
+            role_file = tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False)
+            try:
+                role_def = {
+                    "title": "Hopsworks AI Instances",
+                    "description": "Role for Hopsworks instances",
+                    "stage": "GA",
+                    "includedPermissions": [
+                        # Artifact Registry permissions
+                        "artifactregistry.repositories.create",
+                        "artifactregistry.repositories.get",
+                        "artifactregistry.repositories.uploadArtifacts",
+                        "artifactregistry.repositories.downloadArtifacts",
+                        "artifactregistry.tags.list",
+                        "artifactregistry.repositories.list"
+                    ]
+                }
+                yaml.dump(role_def, role_file)
+                role_file.close()
 
-            success, _, error = run_command(
-                f"gcloud iam roles create {self.role_name} --project={self.project_id} --file={role_file.name}"
-            )
-            if not success:
-                print_colored(f"Failed to create role: {error}", "red")
-                sys.exit(1)
-            else:
+                success, _, error = run_command(
+                    f"gcloud iam roles create {self.role_name} --project={self.project_id} --file={role_file.name}"
+                )
+                if not success and "already exists" not in error:
+                    print_colored(f"Failed to create role: {error}", "red")
+                    return False
                 print_colored(f"Role '{self.role_name}' created successfully.", "green")
-        finally:
-            os.unlink(role_file.name)
+            finally:
+                os.unlink(role_file.name)
 
         # 3. Create/update service account
-        sa_name = "hopsworksai-instances"
-        self.sa_email = f"{sa_name}@{self.project_id}.iam.gserviceaccount.com"
-
-        # Check if SA exists first
-        success, _, _ = run_command(
-            f"gcloud iam service-accounts describe {self.sa_email} --project={self.project_id}",
-            verbose=False
-        )
-
-        if not success:
+        def create_service_account():
+            # Check if SA exists first
+            success, _, _ = run_command(
+                f"gcloud iam service-accounts describe {self.sa_email} --project={self.project_id}",
+                verbose=False
+            )
+            if success:
+                print_colored(f"Service account '{self.sa_email}' already exists.", "green")
+                return
             success, _, error = run_command(
                 f"gcloud iam service-accounts create {sa_name} "
                 f"--project={self.project_id} "
@@ -611,73 +2038,86 @@ class HopsworksInstaller:
             )
             if not success and "already exists" not in error:
                 print_colored(f"Failed to create service account: {error}", "red")
-                sys.exit(1)
-            else:
-                print_colored(f"Service account '{self.sa_email}' created.", "green")
-        else:
-            print_colored(f"Service account '{self.sa_email}' already exists.", "green")
+                return False
+            print_colored(f"Service account '{self.sa_email}' created.", "green")
 
         # 4. Update role binding
-        print_colored("Updating role binding...", "cyan")
-        # Remove existing binding if it exists
-        run_command(
-            f"gcloud projects remove-iam-policy-binding {self.project_id} "
-            f"--member=serviceAccount:{self.sa_email} "
-            f"--role=projects/{self.project_id}/roles/{self.role_name}",
-            verbose=False
-        )
-
-        success, _, error = run_command(
-            f"gcloud projects add-iam-policy-binding {self.project_id} "
-            f"--member=serviceAccount:{self.sa_email} "
-            f"--role=projects/{self.project_id}/roles/{self.role_name}"
-        )
-        if not success:
-            print_colored(f"Failed to bind role: {error}", "red")
-            sys.exit(1)
-        else:
+        def bind_role():
+            print_colored("Updating role binding...", "cyan")
+            # Remove existing binding if it exists
+            run_command(
+                f"gcloud projects remove-iam-policy-binding {self.project_id} "
+                f"--member=serviceAccount:{self.sa_email} "
+                f"--role=projects/{self.project_id}/roles/{self.role_name}",
+                verbose=False
+            )
+            success, _, error = run_command(
+                f"gcloud projects add-iam-policy-binding {self.project_id} "
+                f"--member=serviceAccount:{self.sa_email} "
+                f"--role=projects/{self.project_id}/roles/{self.role_name}"
+            )
+            if not success:
+                print_colored(f"Failed to bind role: {error}", "red")
+                return False
             print_colored(f"Role '{self.role_name}' bound to service account '{self.sa_email}'.", "green")
 
         # 5. NOW we can create the cluster with the service account
-        self.cluster_name = input("Enter your GKE cluster name: ").strip() or "hopsworks-cluster"
-        node_count = input("Enter number of nodes (default: 5): ").strip() or "5"
-        machine_type = input("Enter machine type (default: n2-standard-8): ").strip() or "n2-standard-8"
-
-        cluster_cmd = (f"gcloud container clusters create {self.cluster_name} "
-                       f"--zone={self.zone} "
-                       f"--machine-type={machine_type} "
-                       f"--num-nodes={node_count} "
-                       f"--enable-ip-alias "
-                       f"--service-account={self.sa_email}")
-        
-        print_colored("Creating GKE cluster...", "cyan")
-        if not run_command(cluster_cmd)[0]:
-            print_colored("Failed to create GKE cluster.", "red")
-            sys.exit(1)
-        else:
+        def create_cluster():
+            # Left behind by an interrupted run
+            if run_command(f"gcloud container clusters describe {self.cluster_name} --zone={self.zone} "
+                           f"--project={self.project_id} --format=value(status)", verbose=False)[0]:
+                print_colored(f"GKE cluster '{self.cluster_name}' already exists.", "green")
+                return
+            cluster_cmd = (f"gcloud container clusters create {self.cluster_name} "
+                           f"--zone={self.zone} "
+                           f"--machine-type={machine_type} "
+                           f"--num-nodes={node_count} "
+                           f"--enable-ip-alias "
+                           f"--service-account={self.sa_email}")
+            print_colored("Creating GKE cluster...", "cyan")
+            success, _, error = run_command(cluster_cmd, stream=True)
+            if not success and "already exists" not in error:
+                print_colored("Failed to create GKE cluster.", "red")
+                return False
             print_colored(f"GKE cluster '{self.cluster_name}' created.", "green")
 
         # 6. Configure kubectl
-        print_colored("Configuring kubectl...", "cyan")
-        run_command(f"gcloud container clusters get-credentials {self.cluster_name} "
-                    f"--zone={self.zone} "
-                    f"--project={self.project_id}")
+        def get_credentials():
+            print_colored("Configuring kubectl...", "cyan")
+            if not run_command(f"gcloud container clusters get-credentials {self.cluster_name} "
+                               f"--zone={self.zone} "
+                               f"--project={self.project_id}")[0]:
+                print_colored("Failed to get GKE credentials.", "red")
+                return False
 
         # 7. Setup Artifact Registry
-        registry_name = f"hopsworks-{self.cluster_name}-{timestamp}"
-        print_colored("Creating Artifact Registry repository...", "cyan")
-        success, _, error = run_command(f"gcloud artifacts repositories create {registry_name} "
-                    f"--repository-format=docker "
-                    f"--location={self.region} "
-                    f"--project={self.project_id}")
-        if not success and "already exists" not in error:
-            print_colored(f"Failed to create Artifact Registry: {error}", "red")
-            sys.exit(1)
-        else:
+        def create_registry():
+            print_colored("Creating Artifact Registry repository...", "cyan")
+            success, _, error = run_command(f"gcloud artifacts repositories create {registry_name} "
+                        f"--repository-format=docker "
+                        f"--location={self.region} "
+                        f"--project={self.project_id}")
+            if not success and "already exists" not in error:
+                print_colored(f"Failed to create Artifact Registry: {error}", "red")
+                return False
             print_colored(f"Artifact Registry repository '{registry_name}' created or already exists.", "green")
 
+        graph = TaskGraph("GKE prerequisites", journal=self.journal)
+        graph.add("iam_role", create_role)
+        graph.add("service_account", create_service_account)
+        graph.add("role_binding", bind_role, deps=["iam_role", "service_account"])
+        graph.add("gke_cluster", create_cluster, deps=["role_binding"])
+        graph.add("credentials", get_credentials, deps=["gke_cluster"])
+        graph.add("artifact_registry", create_registry)
         # Now, set up GKE authentication
-        self.setup_gke_authentication()
+        graph.add("workload_identity", self.setup_gke_authentication, deps=["credentials"])
+        success = graph.run()
+        graph.report()
+
+        if not success:
+            print_colored(f"GKE prerequisites setup failed at: {', '.join(graph.failed)}", "red")
+            print_colored("Fix the issue and re-run with --resume, completed steps will be skipped.", "yellow")
+            sys.exit(1)
 
     def setup_gke_authentication(self):
         """Setup GKE auth with proper Workload Identity"""
@@ -719,6 +2159,7 @@ class HopsworksInstaller:
         os.unlink(config_file)
         return True
 
+    @traced
     def setup_aks_prerequisites(self):
         """Setup AKS prerequisites and cluster from scratch"""
         print_colored("\nSetting up AKS prerequisites...", "blue")
@@ -728,68 +2169,79 @@ class HopsworksInstaller:
             print_colored("Please run 'az login' first.", "red")
             sys.exit(1)
 
-        # Get resource group - create if doesn't exist
-        self.resource_group = input("Enter your Azure resource group name: ").strip()
-        location = input("Enter Azure region (eg. eastus): ").strip() or "eastus"
-        
+        # Ask everything up front, the steps below run unattended
+        self.resource_group = self.ask("resource_group", "Enter your Azure resource group name: ")
+        location = self.ask("location", "Enter Azure region (eg. eastus): ", "eastus")
+        self.cluster_name = self.ask("cluster_name", "Enter your AKS cluster name: ")
+        node_count = self.ask("node_count", "Enter number of nodes (default: 5): ", "5")
+        machine_type = self.ask("machine_type", "Enter machine type (default: Standard_D8_v4): ", "Standard_D8_v4")
+
         # Check if resource group exists, create if it doesn't
-        if not run_command(f"az group show --name {self.resource_group}", verbose=False)[0]:
+        def create_resource_group():
+            if run_command(f"az group show --name {self.resource_group}", verbose=False)[0]:
+                return
             print_colored(f"Creating resource group {self.resource_group}...", "cyan")
             if not run_command(f"az group create --name {self.resource_group} --location {location}")[0]:
                 print_colored("Failed to create resource group.", "red")
-                sys.exit(1)
-
-        # Get cluster details
-        self.cluster_name = input("Enter your AKS cluster name: ").strip()
-        node_count = input("Enter number of nodes (default: 5): ").strip() or "5"
-        machine_type = input("Enter machine type (default: Standard_D8_v4): ").strip() or "Standard_D8_v4"
+                return False
 
         # Create AKS cluster with minimal config but all we need
-        print_colored("\nCreating AKS cluster (this will take 5-10 minutes)...", "cyan")
-        cluster_cmd = (
-            f"az aks create "
-            f"--resource-group {self.resource_group} "
-            f"--name {self.cluster_name} "
-            f"--node-count {node_count} "
-            f"--node-vm-size {machine_type} "
-            f"--location {location} "
-            f"--network-plugin azure "
-            f"--generate-ssh-keys "
-            f"--load-balancer-sku standard "  
-            f"--enable-managed-identity " 
-            f"--network-policy azure " 
-            f"--no-wait" 
-        )
-        
-        if not run_command(cluster_cmd)[0]:
-            print_colored("Failed to start AKS cluster creation.", "red")
-            sys.exit(1)
+        def create_cluster():
+            # Left behind by an interrupted run, cluster_ready waits for it
+            if run_command(f"az aks show --resource-group {self.resource_group} --name {self.cluster_name}",
+                           verbose=False)[0]:
+                print_colored(f"AKS cluster '{self.cluster_name}' already exists.", "green")
+                return
+            print_colored("\nCreating AKS cluster (this will take 5-10 minutes)...", "cyan")
+            cluster_cmd = (
+                f"az aks create "
+                f"--resource-group {self.resource_group} "
+                f"--name {self.cluster_name} "
+                f"--node-count {node_count} "
+                f"--node-vm-size {machine_type} "
+                f"--location {location} "
+                f"--network-plugin azure "
+                f"--generate-ssh-keys "
+                f"--load-balancer-sku standard "  
+                f"--enable-managed-identity " 
+                f"--network-policy azure " 
+                f"--no-wait" 
+            )
+            if not run_command(cluster_cmd)[0]:
+                print_colored("Failed to start AKS cluster creation.", "red")
+                return False
 
         # Wait for cluster to be ready
-        print_colored("\nWaiting for cluster to be ready...", "cyan")
-        while True:
-            success, output, _ = run_command(
-                f"az aks show --resource-group {self.resource_group} --name {self.cluster_name} --query provisioningState -o tsv",
-                verbose=False
-            )
-            if success and "Succeeded" in output:
-                break
-            print_colored("Still creating cluster...", "yellow")
-            time.sleep(30)
+        def cluster_ready():
+            print_colored("\nWaiting for cluster to be ready...", "cyan")
+            def cluster_provisioned():
+                success, output, _ = run_command(
+                    f"az aks show --resource-group {self.resource_group} --name {self.cluster_name} --query provisioningState -o tsv",
+                    verbose=False
+                )
+                if success and output.strip() in ("Failed", "Canceled"):
+                    raise WaitAbort(f"cluster provisioning state is {output.strip()}")
+                return success and "Succeeded" in output
+
+            if not wait_until(cluster_provisioned, "AKS cluster provisioning", timeout=2700, initial_delay=10, max_delay=30):
+                print_colored("AKS cluster did not become ready.", "red")
+                return False
 
         # Get credentials
-        print_colored("\nGetting kubectl credentials...", "cyan")
-        cmd = f"az aks get-credentials --resource-group {self.resource_group} --name {self.cluster_name} --overwrite-existing"
-        if not run_command(cmd)[0]:
-            print_colored("Failed to get AKS credentials.", "red")
-            sys.exit(1)
+        def get_credentials():
+            print_colored("\nGetting kubectl credentials...", "cyan")
+            cmd = f"az aks get-credentials --resource-group {self.resource_group} --name {self.cluster_name} --overwrite-existing --file {kubeconfig_file()}"
+            if not run_command(cmd)[0]:
+                print_colored("Failed to get AKS credentials.", "red")
+                return False
 
         # Create namespace and setup basic RBAC
-        print_colored(f"\nCreating namespace {self.namespace} and setting up RBAC...", "cyan")
-        run_command(f"kubectl create namespace {self.namespace}")
-        
-        # Create a more permissive service account for Hopsworks
-        sa_yaml = f"""apiVersion: v1
+        def setup_rbac():
+            print_colored(f"\nCreating namespace {self.namespace} and setting up RBAC...", "cyan")
+            run_command(f"kubectl create namespace {self.namespace} --dry-run=client -o yaml | kubectl apply -f -")
+            
+            # Create a more permissive service account for Hopsworks
+            sa_yaml = f"""apiVersion: v1
 kind: ServiceAccount
 metadata:
   name: hopsworks-sa
@@ -808,10 +2260,26 @@ subjects:
 - kind: ServiceAccount
   name: hopsworks-sa
   namespace: {self.namespace}"""
-        with open('sa.yaml', 'w') as f:
-            f.write(sa_yaml)
-        
-        run_command("kubectl apply -f sa.yaml")
+            with open('sa.yaml', 'w') as f:
+                f.write(sa_yaml)
+            
+            if not run_command("kubectl apply -f sa.yaml")[0]:
+                print_colored("Failed to create the Hopsworks service account.", "red")
+                return False
+
+        graph = TaskGraph("AKS prerequisites", journal=self.journal)
+        graph.add("resource_group", create_resource_group)
+        graph.add("aks_cluster", create_cluster, deps=["resource_group"])
+        graph.add("cluster_ready", cluster_ready, deps=["aks_cluster"])
+        graph.add("credentials", get_credentials, deps=["cluster_ready"])
+        graph.add("rbac", setup_rbac, deps=["credentials"])
+        success = graph.run()
+        graph.report()
+
+        if not success:
+            print_colored(f"AKS prerequisites setup failed at: {', '.join(graph.failed)}", "red")
+            print_colored("Fix the issue and re-run with --resume, completed steps will be skipped.", "yellow")
+            sys.exit(1)
 
         print_colored("\nAKS prerequisites setup completed successfully!", "green")
         return True
@@ -822,13 +2290,13 @@ subjects:
         
         # Get Docker registry credentials with basic validation
         while True:
-            docker_user = input("Enter your Hopsworks Docker registry username: ").strip()
+            docker_user = PROMPTS.input("Enter your Hopsworks Docker registry username: ").strip()
             if docker_user:
                 break
             print_colored("Username cannot be empty.", "yellow")
         
         while True:
-            docker_pass = input("Enter your Hopsworks Docker registry password: ").strip()
+            docker_pass = PROMPTS.input("Enter your Hopsworks Docker registry password: ").strip()
             if docker_pass:
                 break
             print_colored("Password cannot be empty.", "yellow")
@@ -902,6 +2370,7 @@ subjects:
             self.registry_secrets_created = False
             return False
         
+    @traced
     def setup_and_verify_kubeconfig(self):
         while True:
             self.kubeconfig_path, self.cluster_name, self.region = self.setup_kubeconfig()
@@ -911,6 +2380,7 @@ subjects:
                 if self.verify_kubeconfig():
                     break
             else:
+                self.forget("region", "kubeconfig")
                 print_colored("Failed to set up a valid kubeconfig.", "red")
                 if not get_user_input("Do you want to try again? (yes/no):", ["yes", "no"]).lower() == "yes":
                     sys.exit(1)
@@ -924,7 +2394,7 @@ subjects:
 
         if self.environment == "AWS":
             # Existing AWS logic
-            cluster_name = input("Enter your EKS cluster name: ").strip()
+            cluster_name = PROMPTS.input("Enter your EKS cluster name: ").strip()
             region = self.get_aws_region()
             cmd = f"aws eks get-token --cluster-name {cluster_name} --region {region}"
             if not run_command(cmd)[0]:
@@ -933,13 +2403,13 @@ subjects:
                 if not run_command(cmd)[0]:
                     print_colored("Failed to update kubeconfig.", "red")
                     return None, None, None
-            kubeconfig_path = os.path.expanduser("~/.kube/config")
+            kubeconfig_path = kubeconfig_file()
 
         elif self.environment == "GCP":
             if self.args.loadbalancer_only:
-                cluster_name = input("Enter your GKE cluster name: ").strip()
-                self.project_id = input("Enter your GCP project ID: ").strip()
-                zone_input = input("Enter your GCP zone (e.g. europe-west1-b): ").strip()
+                cluster_name = PROMPTS.input("Enter your GKE cluster name: ").strip()
+                self.project_id = PROMPTS.input("Enter your GCP project ID: ").strip()
+                zone_input = PROMPTS.input("Enter your GCP zone (e.g. europe-west1-b): ").strip()
                 self.zone = zone_input
                 self.region = '-'.join(zone_input.split('-')[:-1])  # extract region from zone
             else:
@@ -952,21 +2422,20 @@ subjects:
                 return None, None, None
 
             run_command("gcloud auth configure-docker", verbose=False)
-            kubeconfig_path = os.path.expanduser("~/.kube/config")
+            kubeconfig_path = kubeconfig_file()
 
         elif self.environment == "Azure":
-            self.resource_group = input("Enter your Azure resource group name: ").strip()
-            cluster_name = input("Enter your AKS cluster name: ").strip()
-            cmd = f"az aks get-credentials --resource-group {self.resource_group} --name {cluster_name} --overwrite-existing"
+            self.resource_group = PROMPTS.input("Enter your Azure resource group name: ").strip()
+            cluster_name = PROMPTS.input("Enter your AKS cluster name: ").strip()
+            cmd = f"az aks get-credentials --resource-group {self.resource_group} --name {cluster_name} --overwrite-existing --file {kubeconfig_file()}"
             if not run_command(cmd)[0]:
                 print_colored("Failed to get AKS credentials. Check your Azure CLI configuration and permissions.", "red")
                 return None, None, None
-            kubeconfig_path = os.path.expanduser("~/.kube/config")
+            kubeconfig_path = kubeconfig_file()
 
         else:
             # Other environments
-            kubeconfig_path = input("Enter the path to your kubeconfig file: ").strip()
-            kubeconfig_path = os.path.expanduser(kubeconfig_path)
+            kubeconfig_path = os.path.expanduser(self.ask("kubeconfig", "Enter the path to your kubeconfig file: "))
             if not os.path.exists(kubeconfig_path):
                 print_colored(f"The file {kubeconfig_path} does not exist. Check the path and try again.", "red")
                 return None, None, None
@@ -1019,27 +2488,81 @@ subjects:
         parser.add_argument('--no-user-data', action='store_true', help='Skip sending user data')
         parser.add_argument('--skip-license', action='store_true', help='Skip license agreement step')
         parser.add_argument('--namespace', default='hopsworks', help='Namespace for Hopsworks installation')
+        parser.add_argument('--resume', action='store_true', help='Resume an interrupted installation from its journal')
+        parser.add_argument('--journal', default='hopsworks-install-journal.json', help='Path of the installation journal')
+        parser.add_argument('--force-upgrade', action='store_true', help='Run helm upgrade even if the release is already deployed with the same configuration')
+        parser.add_argument('--trace', metavar='FILE', help='Write timing spans of every step and command to FILE (JSON) and a Chrome trace next to it')
+        parser.add_argument('--skip-preflight', action='store_true', help='Install even if the chart does not seem to fit on the nodes')
+        parser.add_argument('--fail-fast', action='store_true', help='Abort the installation when a pod keeps failing (image pulls, crash loops, scheduling, volumes)')
+        parser.add_argument('--sizing', choices=["auto"] + list(SIZING_PROFILES) + ["custom"],
+                            help='Replicas and resource requests of the deployment (default: small; auto sizes them from the nodes of the cluster)')
+        parser.add_argument('--sizing-file', metavar='FILE', help='YAML or JSON file with the layout of --sizing custom')
+        parser.add_argument('--prepull-images', action='store_true', help='Pull the images of the chart on every node before installing it')
+        parser.add_argument('--endpoint-timeout', type=int, default=ENDPOINT_TIMEOUT, metavar='SECONDS',
+                            help='How long to wait for the LoadBalancer ports to answer (0: do not check them)')
+        parser.add_argument('--benchmark', action='store_true', help='Load-test the UI and API endpoints once installed')
+        parser.add_argument('--benchmark-url', action='append', metavar='URL', help='Load-test this URL instead (repeatable), e.g. a local http:// stand-in')
+        parser.add_argument('--benchmark-requests', type=int, default=500, help='Requests sent to each endpoint by --benchmark')
+        parser.add_argument('--benchmark-concurrency', type=int, default=16, help='Requests in flight at once during --benchmark')
+        parser.add_argument('--benchmark-output', default=BENCHMARK_OUTPUT, help='Where --benchmark writes its results (JSON)')
+        parser.add_argument('--answers', metavar='FILE', help='YAML or JSON file with answers to the prompts, for unattended installs')
+        parser.add_argument('--fleet', metavar='SPEC', help='Install every cluster listed in the SPEC file concurrently')
+        parser.add_argument('--fleet-dir', default=FLEET_DIR, help='Where fleet installs keep their working directories and logs')
         self.args = parser.parse_args()
         self.namespace = self.args.namespace
 
+        if self.args.answers:
+            try:
+                with open(self.args.answers) as f:
+                    self.preset_answers = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError) as e:
+                print_colored(f"Failed to read answers from {self.args.answers}: {e}", "red")
+                sys.exit(1)
+
+        if self.args.sizing_file:
+            self.args.sizing = self.args.sizing or "custom"
+            try:
+                with open(self.args.sizing_file) as f:
+                    self.custom_sizing = yaml.safe_load(f) or {}
+            except (OSError, yaml.YAMLError) as e:
+                print_colored(f"Failed to read the sizing from {self.args.sizing_file}: {e}", "red")
+                sys.exit(1)
+            unknown = set(self.custom_sizing) - set(SIZING_PROFILES["small"])
+            if unknown:
+                print_colored(f"Unknown sizing keys in {self.args.sizing_file}: {', '.join(sorted(unknown))} "
+                              f"(expected {', '.join(SIZING_PROFILES['small'])})", "red")
+                sys.exit(1)
+        elif self.args.sizing == "custom":
+            print_colored("--sizing custom needs a --sizing-file.", "red")
+            sys.exit(1)
+        self.args.sizing = self.args.sizing or "small"
+
     def get_deployment_environment(self):
-        environments = ["AWS", "Azure", "GCP", "OVH"]
+        preset = self.preset_answers.get("environment")
+        if preset:
+            if preset not in ENVIRONMENTS:
+                print_colored(f"Unknown environment '{preset}', expected one of: {', '.join(ENVIRONMENTS)}", "red")
+                sys.exit(1)
+            self.environment = preset
+            return
+
         print_colored("Select your deployment environment:", "blue")
-        for i, env in enumerate(environments, 1):
+        for i, env in enumerate(ENVIRONMENTS, 1):
             print(f"{i}. {env}")
         choice = get_user_input(
             "Enter the number of your environment:",
-            [str(i) for i in range(1, len(environments) + 1)]
+            [str(i) for i in range(1, len(ENVIRONMENTS) + 1)]
         )
-        self.environment = environments[int(choice) - 1]
+        self.environment = ENVIRONMENTS[int(choice) - 1]
 
     def get_aws_region(self):
         region = os.environ.get('AWS_REGION')
         if not region:
-            region = input("Enter your AWS region (e.g., us-east-2): ").strip()
+            region = self.ask("region", "Enter your AWS region (e.g., us-east-2): ")
             os.environ['AWS_REGION'] = region
         return region
 
+    @traced
     def handle_managed_registry(self):
         if self.environment == "AWS":
             print_colored("Setting up AWS ECR (required for AWS installations)...", "blue")
@@ -1088,14 +2611,19 @@ subjects:
                 print_colored(f"Error during GCP Artifact Registry setup: {str(e)}", "red")
                 return False
 
+    @traced
     def handle_license_and_user_data(self):
         if not self.args.skip_license:
-            license_type, agreement = get_license_agreement()
+            license_type, agreement = get_license_agreement(self.ask)
+            if not agreement:
+                self.forget("agree_to_license")
+                print_colored("You must agree to the terms and conditions to proceed.", "red")
+                sys.exit(1)
         else:
             license_type, agreement = None, False
 
         if not self.args.no_user_data:
-            name, email, company = get_user_info()
+            name, email, company = get_user_info(self.ask)
             success, self.installation_id = send_user_data(name, email, company, license_type, agreement)
             if success:
                 print_colored(f"Installation ID: {self.installation_id}", "green")
@@ -1105,124 +2633,116 @@ subjects:
         else:
             self.installation_id = "debug_mode"
 
-    def install_hopsworks(self):
-        """Installs Hopsworks consistently across all cloud providers"""
-        print_colored("\nInstalling Hopsworks...", "blue")
-
-        # Setup helm repos - this part works, keep it
-        if not run_command("helm repo add hopsworks https://nexus.hops.works/repository/hopsworks-helm --force-update")[0]:
-            print_colored("Failed to add Hopsworks Helm repo.", "red")
+    def prepare_chart(self):
+        """Points self.chart_dir at an unpacked copy of the newest chart"""
+        if not ensure_helm_repo():
             return False
 
-        if not run_command("helm repo update")[0]:
-            print_colored("Failed to update Helm repos.", "red")
-            return False
+        self.chart_version, self.chart_digest = latest_chart_release()
+        if self.chart_version:
+            self.chart_dir = fetch_chart(self.chart_version, self.chart_digest)
+            if self.chart_dir:
+                return True
+            print_colored("Failed to fetch the chart into the cache, pulling it directly.", "yellow")
 
-        # Clean up and get fresh chart - this is good practice, keep it
+        # Clean up and get fresh chart
         if os.path.exists('hopsworks'):
             shutil.rmtree('hopsworks', ignore_errors=True)
-
-        if not run_command("helm pull hopsworks/hopsworks --untar --devel")[0]:
+        if not run_command(f"helm pull {HELM_CHART} --untar --devel")[0]:
             print_colored("Failed to pull Hopsworks chart.", "red")
             return False
+        self.chart_dir = os.path.abspath('hopsworks')
+        with open(os.path.join(self.chart_dir, 'Chart.yaml')) as f:
+            self.chart_version = yaml.safe_load(f).get('version')
+        return True
+
+    @traced
+    def install_hopsworks(self):
+        """Installs Hopsworks consistently across all cloud providers"""
+        print_colored("\nInstalling Hopsworks...", "blue")
+
+        # Setup helm repos and get the chart, reusing the cached copy when nothing changed
+        if not self.prepare_chart():
+            return False
+
+        # Nothing to do if the release is already deployed with this exact configuration
+        fingerprint = self.helm_fingerprint()
+        if not self.args.force_upgrade and self.deployed_fingerprint() == fingerprint:
+            state = ClusterStateCache.list_once(self.namespace)
+            if deployment_status(state["jobs"], state["pods"], state["statefulsets"])[0]:
+                print_colored(f"{HELM_RELEASE} is already deployed with this configuration (chart {self.chart_version}), "
+                              "skipping helm upgrade.", "green")
+                return True
         
+        # Fail now rather than after the deployment timeout when the cluster is too small
+        if not self.args.skip_preflight and not self.preflight_check():
+            return False
+
         # Prepare namespace - good to keep
         if not run_command(f"kubectl create namespace {self.namespace} --dry-run=client -o yaml | kubectl apply -f -")[0]:
             print_colored("Failed to create namespace", "red")
             return False
-        time.sleep(5)  # Keep the settle time
+        # Settle: the namespace is Active and its default service account exists
+        if not wait_until(lambda: namespace_ready(self.namespace), f"namespace {self.namespace} to be active",
+                          timeout=60, initial_delay=0.5, max_delay=5):
+            print_colored(f"Namespace {self.namespace} is not active yet, continuing anyway.", "yellow")
+
+        # Pull the images on every node in parallel rather than pod by pod while helm installs
+        if self.args.prepull_images:
+            self.prepull_images()
 
         # Construct helm command using our new configuration method
         helm_command = self.construct_helm_command()
 
-        # Execute helm install with progress monitoring
+        # Execute helm install with progress monitoring, then wait for actual deployment readiness
         print_colored("Starting Hopsworks installation...", "cyan")
-        stop_event = threading.Event()
-        status_thread = threading.Thread(target=periodic_status_update, args=(stop_event, self.namespace))
-        status_thread.start()
-
-        try:
-            success, output, error = run_command(helm_command)
-            if not success:
-                # Only ignore known non-fatal errors
-                if not any(err in error for err in KNOWN_NONFATAL_ERRORS):
-                    print_colored("\nHopsworks installation failed.", "red")
-                    print_colored("Error: " + error, "red")
-                    return False
-                print_colored(f"\nIgnoring expected configuration message: {error}", "yellow")
-                
-            # Wait for actual deployment readiness regardless of helm command result
-            return wait_for_deployment(self.namespace)
-        finally:
-            stop_event.set()
-            status_thread.join()
-                                        
-    def get_load_balancer_address(self):
-        """Get LoadBalancer address with more robust detection"""
-        # Try both hostname and IP - some providers might give either
-        commands = [
-            "kubectl get svc -n {ns} hopsworks-release -o jsonpath='{{.status.loadBalancer.ingress[0].hostname}}'",
-            "kubectl get svc -n {ns} hopsworks-release -o jsonpath='{{.status.loadBalancer.ingress[0].ip}}'"
-        ]
-        
-        for cmd in commands:
-            formatted_cmd = cmd.format(ns=self.namespace)
-            success, output, _ = run_command(formatted_cmd, verbose=False)
-            if success and output.strip():
-                return output.strip()
-                
-        # Fallback - check all LoadBalancer services
-        print_colored("Retrying LoadBalancer address detection...", "yellow")
-        cmd = f"kubectl get svc -n {self.namespace} -o wide | grep LoadBalancer | grep hopsworks-release"
-        success, output, _ = run_command(cmd, verbose=False)
-        
-        if success and output.strip():
-            parts = output.split()
-            if len(parts) >= 6:  # Standard kubectl output format
-                external_ip = parts[5]
-                if external_ip != '<pending>' and external_ip != '<none>':
-                    return external_ip
-        
-        # Last resort - get ALL LoadBalancer services
-        cmd = f"kubectl get svc -n {self.namespace} --field-selector type=LoadBalancer -o json"
-        success, output, _ = run_command(cmd, verbose=False)
-        if success:
-            import json
+        history = []
+        if self.history:
             try:
-                services = json.loads(output)
-                for svc in services.get('items', []):
-                    ingress = svc.get('status', {}).get('loadBalancer', {}).get('ingress', [])
-                    if ingress:
-                        return ingress[0].get('hostname') or ingress[0].get('ip')
-            except json.JSONDecodeError:
+                history = self.history.deployments(self.history_key())
+            except sqlite3.Error:
                 pass
-                
-        return None
-
+        monitor = DeploymentMonitor(self.namespace, history=history, fail_fast=self.args.fail_fast)
+        ready = monitor.run(helm_command)
+        # Found while waiting, saves finalize_installation from looking it up again
+        self.load_balancer_address = monitor.address
+        self.deployment_timing = {"jobs": monitor.job_completions, "total": monitor.ready_after}
+        if not ready:
+            return False
+        self.record_fingerprint(fingerprint)
+        return True
+                                        
+    @traced
     def finalize_installation(self):
         """Simple installation finalization focused on LoadBalancer"""
         print_colored("\nFinalizing installation...", "blue")
         
-        # Give the LoadBalancer some time to get an address
-        max_retries = 12  # 2 minutes total
-        address = None
-        
-        for i in range(max_retries):
-            address = self.get_load_balancer_address()
-            if address:
-                break
-            if i < max_retries - 1:  # Don't sleep on last iteration
-                print_colored("Waiting for LoadBalancer address...", "yellow")
-                time.sleep(10)
+        # Usually found while installing, else follow the services until the LoadBalancer gets an address
+        address = self.load_balancer_address or wait_for_load_balancer(self.namespace, timeout=120)
         
+        self.load_balancer_address = address
         if not address:
             print_colored("Failed to obtain LoadBalancer address. Manual configuration may be needed.", "red")
             print_colored("Run 'kubectl get svc -n {} hopsworks-release' to check status".format(self.namespace), "yellow")
             return
 
-        print_colored("\nHopsworks is accessible at:", "green")
-        print_colored(f"UI:    https://{address}:28181", "cyan")
-        print_colored(f"API:   https://{address}:8182", "cyan")
+        # A new LoadBalancer needs a while before its name resolves and it routes to the pods
+        probes = {}
+        def reachable():
+            probes.update({probe["port"]: probe for probe in probe_endpoints(address, ENDPOINT_PORTS.values())})
+            return all("error" not in probe for probe in probes.values())
+        ports = " and ".join(str(port) for port in ENDPOINT_PORTS.values())
+        if self.args.endpoint_timeout <= 0:
+            # E.g. an internal LoadBalancer this host cannot reach
+            print_colored("\nHopsworks will be at:", "green")
+        elif wait_until(reachable, f"{address} to accept connections on ports {ports}",
+                        timeout=self.args.endpoint_timeout, initial_delay=2, max_delay=15):
+            print_colored("\nHopsworks is accessible at:", "green")
+        else:
+            print_colored("\nHopsworks is not reachable yet, DNS or the LoadBalancer may need a few more minutes. It will be at:", "yellow")
+        for name, port in ENDPOINT_PORTS.items():
+            probe = f"  {format_probe(probes[port])}" if port in probes else ""
+            print_colored(f"{name + ':':<6} https://{address}:{port}{probe}", "cyan")
         print_colored("Login: admin@hopsworks.ai / admin", "cyan")
 
         if health_check(self.namespace):
@@ -1230,59 +2750,797 @@ subjects:
         else:
             print_colored("\nSome pods are not ready yet. Give them a few more minutes.", "yellow")
 
-# Installation utillities 
-def periodic_status_update(stop_event, namespace):
-    while not stop_event.is_set():
-        cmd = f"kubectl get pods -n {namespace} --no-headers"
-        success, output, error = run_command(cmd, verbose=False)
-        if success and output.strip():
-            pod_count = len(output.strip().split('\n'))
-            print_colored(f"\rCurrent status: {pod_count} pods created", "cyan", end='')
-        else:
-            if "No resources found" in error:
-                print_colored("\rWaiting for pods to be created... Do not panic. This will take a moment", "yellow", end='')
+    def run_benchmark(self):
+        """
+        Load-tests the UI and API endpoints (or the --benchmark-url ones) and writes the results
+        to --benchmark-output, next to those of the previous run so installs can be compared.
+        Returns False when there was nothing to benchmark or every request to an endpoint failed.
+        """
+        urls = self.args.benchmark_url
+        if not urls:
+            address = self.load_balancer_address or wait_for_load_balancer(self.namespace, 60)
+            if not address:
+                print_colored("No LoadBalancer address to benchmark, pass --benchmark-url.", "yellow")
+                return False
+            urls = [f"https://{address}:{port}{BENCHMARK_PATHS[name]}" for name, port in ENDPOINT_PORTS.items()]
+
+        output = self.args.benchmark_output
+        previous = {}
+        with contextlib.suppress(OSError, ValueError):
+            with open(output) as f:
+                previous = {result["url"]: result for result in json.load(f).get("results", [])}
+
+        results = []
+        for url in urls:
+            print_colored(f"\nBenchmarking {url} ({self.args.benchmark_requests} requests, "
+                          f"{self.args.benchmark_concurrency} at a time)...", "blue")
+            with TRACER.span(f"benchmark: {url}", "benchmark"):
+                result = load_test(url, self.args.benchmark_requests, self.args.benchmark_concurrency)
+            results.append(result)
+            latency = result["latency_ms"]
+            if latency["p50"] is None:
+                print_colored(f"  No successful requests: {result['errors']}", "red")
+                continue
+            was = previous.get(url)
+            change = (f" (previous run: p95 {was['latency_ms']['p95']} ms, {was['throughput_rps']} req/s)"
+                      if was and was["latency_ms"]["p95"] is not None else "")
+            color = "green" if result["error_rate"] == 0 else "yellow"
+            print_colored(f"  p50 {latency['p50']} ms  p95 {latency['p95']} ms  p99 {latency['p99']} ms  "
+                          f"{result['throughput_rps']} req/s  {result['error_rate']:.1%} errors{change}", color)
+
+        environment, node_count, machine_type = self.history_key()
+        report = {"date": datetime.now().isoformat(), "environment": environment, "node_count": node_count,
+                  "machine_type": machine_type, "results": results}
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+        print_colored(f"Benchmark results written to {output}", "cyan")
+        if any(result["error_rate"] >= 1 for result in results):
+            print_colored("Every request to some endpoints failed, see the errors above.", "red")
+            return False
+        return True
+
+# Deployment watching
+# Hopsworks components, matched on the labels or the name of their pods and statefulsets
+COMPONENTS = {
+    "RonDB": ("rondb", "mgmd", "ndbmtd", "mysqld"),
+    "Namenode": ("namenode",),
+    "Datanodes": ("datanode",),
+    "Kafka": ("kafka", "broker"),
+    "OpenSearch": ("opensearch",),
+    "Hopsworks": ("hopsworks-instance",),
+}
+COMPONENT_LABELS = ("app", "app.kubernetes.io/name", "app.kubernetes.io/component", "component")
+CORE_COMPONENTS = ["Hopsworks"]  # Must be ready before the installation is considered done
+JOB_COMPLETE_CONDITIONS = ("Complete", "SuccessCriteriaMet")
+# Failure signals: waiting reasons of containers, and reasons of Warning events
+CONTAINER_FAILURES = ("ErrImagePull", "ImagePullBackOff", "InvalidImageName", "CrashLoopBackOff",
+                      "CreateContainerConfigError", "CreateContainerError", "RunContainerError")
+EVENT_FAILURES = ("FailedScheduling", "ProvisioningFailed", "FailedMount", "FailedAttachVolume", "FailedCreate")
+FAIL_FAST_AFTER = 30  # Seconds a failure must last before --fail-fast aborts
+CRASH_LOOP_RESTARTS = 5  # Restarts before a crash loop counts, pods may restart while their dependencies start
+
+def job_is_complete(job):
+    conditions = job.get('status', {}).get('conditions') or []
+    return any(c.get('type') in JOB_COMPLETE_CONDITIONS and c.get('status', 'True') == 'True' for c in conditions)
+
+def pod_is_ready(pod):
+    conditions = pod.get('status', {}).get('conditions')
+    if conditions:
+        return any(c.get('type') == 'Ready' and c.get('status') == 'True' for c in conditions)
+    return pod.get('status', {}).get('phase') == 'Running'
+
+def component_of(obj):
+    """Name of the component a pod or statefulset belongs to, labels first, then its name"""
+    metadata = obj.get('metadata', {})
+    labels = metadata.get('labels') or {}
+    for candidates in ([labels.get(key, '') for key in COMPONENT_LABELS], [metadata.get('name', '')]):
+        for component, patterns in COMPONENTS.items():
+            if any(pattern in candidate for candidate in candidates for pattern in patterns):
+                return component
+    return None
+
+def component_status(pods, statefulsets=()):
+    """
+    Returns {component: (ready, total)}. Statefulsets count with their desired replicas, so
+    a component shows its full size before all of its pods exist; their pods are not counted again.
+    """
+    status = {component: [0, 0] for component in COMPONENTS}
+    for sts in statefulsets:
+        component = component_of(sts)
+        if component:
+            status[component][0] += sts.get('status', {}).get('readyReplicas', 0)
+            status[component][1] += sts.get('spec', {}).get('replicas', 1)
+    for pod in pods:
+        owners = pod.get('metadata', {}).get('ownerReferences') or []
+        if statefulsets and any(owner.get('kind') == 'StatefulSet' for owner in owners):
+            continue
+        component = component_of(pod)
+        if component:
+            status[component][0] += pod_is_ready(pod)
+            status[component][1] += 1
+    return {component: tuple(counts) for component, counts in status.items()}
+
+def format_components(components, pending_only=False):
+    """'RonDB 3/3 Kafka 0/1 ...' for the components seen so far"""
+    return " ".join(f"{name} {ready}/{total}" for name, (ready, total) in components.items()
+                    if total and not (pending_only and ready >= total))
+
+def deployment_status(jobs, pods, statefulsets=()):
+    """Returns (ready, complete_jobs, total_jobs) for lists of job, pod and statefulset objects"""
+    if not jobs:
+        return False, 0, 0
+
+    complete_jobs = sum(1 for job in jobs if job_is_complete(job))
+    components = component_status(pods, statefulsets)
+    services_ready = all(components[component][0] > 0 for component in CORE_COMPONENTS)
+
+    return services_ready and complete_jobs == len(jobs), complete_jobs, len(jobs)
+
+def event_order(event):
+    """Sort key of an event: when it last happened, then its resourceVersion for events of the same second"""
+    when = event.get('lastTimestamp') or event.get('eventTime') or event.get('metadata', {}).get('creationTimestamp') or ""
+    version = event.get('metadata', {}).get('resourceVersion', '')
+    return when, int(version) if version.isdigit() else 0
+
+def event_time(event):
+    """When an event last happened, in seconds since the epoch; None if it has no timestamp"""
+    when = (event.get('lastTimestamp') or (event.get('series') or {}).get('lastObservedTime')
+            or event.get('eventTime') or event.get('metadata', {}).get('creationTimestamp'))
+    try:
+        return datetime.fromisoformat(when.replace('Z', '+00:00')).timestamp() if when else None
+    except ValueError:
+        return None
+
+def deployment_failures(pods, events, objects=(), since=None):
+    """
+    Known failure signals in a namespace, as dicts with the object, reason, message and restarts:
+    containers waiting for one of CONTAINER_FAILURES, and objects whose latest event is a Warning
+    in EVENT_FAILURES. A later event such as Scheduled or Pulled means the object got past it.
+    Events outlive their objects by an hour: those about pods, or the kinds of `objects`, only
+    count while that very object exists, those about other kinds (volume claims, replicasets...)
+    only if they happened after `since`.
+    """
+    failures = []
+    live_pods = {}
+    for pod in pods:
+        metadata = pod.get('metadata', {})
+        live_pods[metadata.get('uid')] = pod
+        status = pod.get('status', {})
+        for container in (status.get('initContainerStatuses') or []) + (status.get('containerStatuses') or []):
+            waiting = (container.get('state') or {}).get('waiting') or {}
+            if waiting.get('reason') in CONTAINER_FAILURES:
+                failures.append({"object": f"pod/{metadata.get('name')}", "reason": waiting['reason'],
+                                 "message": f"container {container.get('name')}: {waiting.get('message') or ''}".strip(": "),
+                                 "restarts": container.get('restartCount', 0)})
+
+    live = {metadata.get('uid') for metadata in (obj.get('metadata', {}) for obj in objects)}
+    live_kinds = {obj.get('kind') for obj in objects}
+    latest = {}
+    for event in events:
+        involved = event.get('involvedObject') or {}
+        key = (involved.get('kind'), involved.get('name'), involved.get('uid'))
+        if key not in latest or event_order(event) >= event_order(latest[key]):
+            latest[key] = event
+    for (kind, name, uid), event in latest.items():
+        if event.get('type') != 'Warning' or event.get('reason') not in EVENT_FAILURES:
+            continue
+        # Pods of a statefulset come back with the same name, hence the uid
+        if kind == 'Pod' and (uid not in live_pods or pod_is_ready(live_pods[uid])):
+            continue
+        if kind in live_kinds and uid not in live:
+            continue
+        if kind != 'Pod' and kind not in live_kinds and since is not None and (event_time(event) or 0) < since:
+            continue
+        failures.append({"object": f"{(kind or 'object').lower()}/{name}", "reason": event['reason'],
+                         "message": (event.get('message') or '').strip(), "restarts": 0})
+    return failures
+
+def failure_is_fatal(failure, duration):
+    """Whether a failure seen for `duration` seconds is worth aborting the install for"""
+    if failure["reason"] == "CrashLoopBackOff":
+        return failure["restarts"] >= CRASH_LOOP_RESTARTS
+    return duration >= FAIL_FAST_AFTER
+
+class ClusterStateCache:
+    """
+    Informer-style, in-memory view of the jobs, pods, statefulsets, services and events of a namespace.
+    A single fetcher lists each resource once, then follows a watch stream from the
+    last seen resourceVersion; every status display reads from this one snapshot
+    instead of querying the API server on its own, and is woken up on every change.
+    """
+    RESOURCES = {
+        "jobs": "/apis/batch/v1/namespaces/{ns}/jobs",
+        "pods": "/api/v1/namespaces/{ns}/pods",
+        "statefulsets": "/apis/apps/v1/namespaces/{ns}/statefulsets",
+        "services": "/api/v1/namespaces/{ns}/services",
+        "events": "/api/v1/namespaces/{ns}/events",
+    }
+    WATCH_TIMEOUT = 300  # Server-side timeout, the stream is resumed right after
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+        self.objects = {kind: {} for kind in self.RESOURCES}
+        self.resource_versions = {}
+        self.synced = set()
+        self.last_error = None
+        self.generation = 0
+        self.changed = threading.Condition()
+        self.stop_event = threading.Event()
+        self.streams = {}
+        self.threads = []
+        self.listeners = []
+
+    def start(self):
+        for kind in self.RESOURCES:
+            thread = threading.Thread(target=self._watch_loop, args=(kind,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def stop(self):
+        self.stop_event.set()
+        for stream in list(self.streams.values()):
+            stream.close()
+        with self.changed:
+            self.changed.notify_all()
+
+    def snapshot(self):
+        """Returns a consistent copy of the cached objects, as a dict of kind -> list"""
+        with self.changed:
+            return {kind: list(objects.values()) for kind, objects in self.objects.items()}
+
+    @classmethod
+    def list_once(cls, namespace):
+        """One-off listing with the same shape as snapshot(), for callers that do not need to follow changes"""
+        cache = cls(namespace)
+        for kind in cls.RESOURCES:
+            cache._list(kind)
+        return cache.snapshot()
+
+    def is_synced(self, kind):
+        """True once `kind` has been listed at least once"""
+        return kind in self.synced
+
+    def wait_for_change(self, generation, timeout=None):
+        """Blocks until the view moves past `generation` or the timeout expires; returns the current generation"""
+        with self.changed:
+            self.changed.wait_for(lambda: self.generation != generation or self.stop_event.is_set(), timeout=timeout)
+            return self.generation
+
+    def add_listener(self, callback):
+        """Calls `callback()` from the fetcher threads after every change, e.g. to wake up an event loop"""
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        self.listeners.remove(callback)
+
+    def _notify(self):
+        self.generation += 1
+        self.changed.notify_all()
+        for callback in list(self.listeners):
+            callback()
+
+    def _list(self, kind):
+        path = self.RESOURCES[kind].format(ns=self.namespace)
+        try:
+            listing = get_kube_client().get(path)
+        except KUBE_ERRORS as e:
+            self.last_error = str(e)
+            return False
+        with self.changed:
+            self.objects[kind] = {item['metadata']['uid']: item for item in listing.get('items', [])}
+            self.resource_versions[kind] = listing.get('metadata', {}).get('resourceVersion', '')
+            self.synced.add(kind)
+            self.last_error = None
+            self._notify()
+        return True
+
+    def _apply(self, kind, event):
+        event_type = event.get('type')
+        obj = event.get('object') or {}
+        if event_type == 'ERROR':
+            # 410 Gone: our resourceVersion is too old, start over with a fresh list
+            if obj.get('code') == 410:
+                self.resource_versions.pop(kind, None)
+            return
+        metadata = obj.get('metadata', {})
+        with self.changed:
+            if metadata.get('resourceVersion'):
+                self.resource_versions[kind] = metadata['resourceVersion']
+            if event_type in ('ADDED', 'MODIFIED'):
+                self.objects[kind][metadata['uid']] = obj
+            elif event_type == 'DELETED':
+                self.objects[kind].pop(metadata.get('uid'), None)
+            else:  # BOOKMARK only advances the resourceVersion
+                return
+            self._notify()
+
+    def _watch_loop(self, kind):
+        while not self.stop_event.is_set():
+            if kind not in self.resource_versions and not self._list(kind):
+                self.stop_event.wait(5)
+                continue
+
+            try:
+                stream = get_kube_client().watch(self.RESOURCES[kind].format(ns=self.namespace),
+                                                 self.resource_versions[kind], timeout_seconds=self.WATCH_TIMEOUT)
+            except KUBE_ERRORS as e:
+                self.last_error = str(e)
+                self.stop_event.wait(5)
+                continue
+            self.streams[kind] = stream
+
+            try:
+                for event in stream:
+                    if self.stop_event.is_set():
+                        break
+                    self._apply(kind, event)
+                    if kind not in self.resource_versions:
+                        break  # Expired, relist
+            except (OSError, http.client.HTTPException, ValueError, KeyError):
+                pass  # Stream dropped, resume from the last resourceVersion
+            finally:
+                stream.close()
+            self.stop_event.wait(1)  # Avoid hammering the API server if the stream keeps failing
+
+def load_balancer_address(services):
+    """Address of the hopsworks-release LoadBalancer, else of any LoadBalancer, from a list of services"""
+    services = sorted(services, key=lambda svc: svc.get('metadata', {}).get('name') != HELM_RELEASE)
+    for svc in services:
+        ingress = svc.get('status', {}).get('loadBalancer', {}).get('ingress') or []
+        if ingress and (ingress[0].get('hostname') or ingress[0].get('ip')):
+            return ingress[0].get('hostname') or ingress[0].get('ip')
+    return None
+
+def wait_for_load_balancer(namespace, timeout=120):
+    """
+    Address of the LoadBalancer from one listing of the services, or else from a watch on them
+    that returns as soon as one is assigned; None if that does not happen within `timeout` seconds.
+    """
+    client = get_kube_client()
+    path = f"/api/v1/namespaces/{namespace}/services"
+    deadline = time.time() + timeout
+    services, version = {}, None
+    with TRACER.span("wait: LoadBalancer address", "wait", timeout=timeout) as span:
+        while True:
+            try:
+                if version is None:
+                    listing = client.get(path)
+                    services = {svc['metadata']['uid']: svc for svc in listing.get('items', [])}
+                    version = listing.get('metadata', {}).get('resourceVersion', '')
+                address = load_balancer_address(services.values())
+                remaining = int(deadline - time.time())
+                if address or remaining <= 0:
+                    break
+                if not span.get("watched"):
+                    print_colored("Waiting for LoadBalancer address...", "yellow")
+                    span["watched"] = True
+                stream = client.watch(path, version, timeout_seconds=remaining)
+                try:
+                    for event in stream:
+                        obj = event.get('object') or {}
+                        if event.get('type') == 'ERROR':
+                            version = None  # Expired, list again
+                            break
+                        metadata = obj.get('metadata', {})
+                        version = metadata.get('resourceVersion', version)
+                        if event.get('type') == 'DELETED':
+                            services.pop(metadata.get('uid'), None)
+                        elif event.get('type') in ('ADDED', 'MODIFIED'):
+                            services[metadata['uid']] = obj
+                            if load_balancer_address(services.values()):
+                                break
+                finally:
+                    stream.close()
+            except KUBE_ERRORS as e:
+                if time.time() >= deadline:
+                    print_colored(f"Could not read the services: {e}", "yellow")
+                    return None
+                time.sleep(2)
+                version = None
+        if not address:
+            print_colored(f"Timed out after {timeout}s waiting for LoadBalancer address.", "yellow")
+        return address
+
+def probe_endpoint(host, port, timeout=PROBE_TIMEOUT):
+    """Resolves `host` and opens a TLS connection to it; returns the dns, connect and tls times in ms, or the error"""
+    probe = {"port": port}
+    step = time.perf_counter()
+    try:
+        address = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)[0][4]
+        probe["dns"] = (time.perf_counter() - step) * 1000
+        step = time.perf_counter()
+        with socket.create_connection(address[:2], timeout=timeout) as sock:
+            probe["connect"] = (time.perf_counter() - step) * 1000
+            step = time.perf_counter()
+            # Hopsworks serves a self-signed certificate until one is configured
+            context = ssl._create_unverified_context()
+            with context.wrap_socket(sock, server_hostname=host):
+                probe["tls"] = (time.perf_counter() - step) * 1000
+    except OSError as e:  # Includes DNS (gaierror), timeouts and TLS (SSLError) failures
+        probe["error"] = str(e) or type(e).__name__
+    return probe
+
+def probe_endpoints(host, ports, timeout=PROBE_TIMEOUT):
+    """probe_endpoint for every port at once"""
+    ports = list(ports)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(ports)) as pool:
+        return list(pool.map(lambda port: probe_endpoint(host, port, timeout), ports))
+
+def load_test(url, requests=500, concurrency=16, timeout=10):
+    """
+    Sends `requests` GETs to `url` from `concurrency` workers, each on its own keep-alive
+    connection like a browser or SDK client, and returns the latency percentiles in ms,
+    the throughput and the error rate. Connection failures and answers outside 2xx/3xx, such as
+    a wrong path (404) or a rejected login (401/403), are errors.
+    """
+    parsed = urllib.parse.urlsplit(url)
+    path = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+    remaining = iter(range(requests))
+    lock = threading.Lock()
+    latencies, statuses, errors = [], collections.Counter(), collections.Counter()
+
+    def connect():
+        if parsed.scheme == "https":
+            return http.client.HTTPSConnection(parsed.hostname, parsed.port or 443, timeout=timeout,
+                                               context=ssl._create_unverified_context())
+        return http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=timeout)
+
+    def worker():
+        conn = None
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+            conn = conn or connect()
+            started = time.perf_counter()
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                conn = None
+                with lock:
+                    errors[type(e).__name__] += 1
+                continue
+            latency = (time.perf_counter() - started) * 1000
+            if response.will_close:
+                conn.close()
+                conn = None
+            with lock:
+                latencies.append(latency)
+                statuses[response.status] += 1
+                if not 200 <= response.status < 400:
+                    errors[f"HTTP {response.status}"] += 1
+        if conn:
+            conn.close()
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    duration = time.perf_counter() - started
+
+    percentiles = statistics.quantiles(latencies, n=100, method='inclusive') if len(latencies) > 1 else latencies * 99
+    return {
+        "url": url,
+        "requests": requests,
+        "concurrency": concurrency,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(latencies) / duration, 1) if duration else 0.0,
+        "error_rate": round(sum(errors.values()) / requests, 4) if requests else 0.0,
+        "errors": dict(errors),
+        "status_codes": {str(status): count for status, count in sorted(statuses.items())},
+        "latency_ms": {name: round(percentiles[index], 2) if percentiles else None
+                       for name, index in (("p50", 49), ("p95", 94), ("p99", 98))},
+    }
+
+def format_probe(probe):
+    if "error" in probe:
+        return f"(not reachable: {probe['error']})"
+    return f"(DNS {probe['dns']:.1f} ms, connect {probe['connect']:.1f} ms, TLS {probe['tls']:.1f} ms)"
+
+class DeploymentMonitor:
+    """
+    Watches an installation from one asyncio event loop. The helm command, the status
+    line, the readiness check, the '1' override key, LoadBalancer discovery and failure
+    detection are tasks on that loop; the ClusterStateCache fetcher threads only wake the
+    loop up on changes, so checks overlap without threads of their own and are all
+    cancelled on return.
+    """
+    STATUS_INTERVAL = 10  # Seconds between status lines while helm runs
+
+    def __init__(self, namespace, cache=None, timeout=2700, history=None, fail_fast=False):
+        self.namespace = namespace
+        self.fail_fast = fail_fast
+        self.failures = []  # Failure signals currently seen, see deployment_failures
+        self.owns_cache = cache is None
+        self.cache = cache or ClusterStateCache(namespace)
+        self.timeout = timeout
+        self.interactive = sys.stdin is not None and sys.stdin.isatty()
+        self.address = None
+        # Past deployments of the same shape (see InstallHistory.deployments), for the time left
+        self.history = history or []
+        self.started = None
+        self.job_completions = {}  # Job name -> seconds after the monitor started
+        self.ready_after = None
+        self.warned_slow = False
+
+    def run(self, helm_command=None):
+        """Runs `helm_command` if given, then waits for the deployment; returns True when ready or overridden"""
+        try:
+            return asyncio.run(self._main(helm_command))
+        except KeyboardInterrupt:
+            print("\n")
+            print_colored(f"Installation interrupted. Check status manually with 'kubectl get pods,jobs -n {self.namespace}'", "yellow")
+            return False
+
+    async def _main(self, helm_command):
+        loop = asyncio.get_running_loop()
+        self.started = time.time()
+        self.override = asyncio.Event()
+        self._next_change = asyncio.Event()
+
+        def wake():
+            with contextlib.suppress(RuntimeError):  # The loop is already closed
+                loop.call_soon_threadsafe(self._wake)
+
+        self.cache.add_listener(wake)
+        if self.owns_cache:
+            self.cache.start()
+        discovery = asyncio.create_task(self._discover_load_balancer())
+        detector = asyncio.create_task(self._watch_failures())
+        install = asyncio.create_task(self._install(helm_command))
+        try:
+            # The detector only returns to abort, with the failure that made it give up
+            done, _ = await asyncio.wait({install, detector}, return_when=asyncio.FIRST_COMPLETED)
+            if install in done:
+                return install.result()
+            self._abort(detector.result())
+            return False
+        finally:
+            for task in (discovery, detector, install):
+                task.cancel()
+            # Let a cancelled helm command be killed before the loop goes away
+            await asyncio.gather(install, return_exceptions=True)
+            self.cache.remove_listener(wake)
+            if self.owns_cache:
+                self.cache.stop()
+
+    def _wake(self):
+        """Wakes every task waiting for the next change; runs on the event loop"""
+        event, self._next_change = self._next_change, asyncio.Event()
+        event.set()
+
+    async def _changed(self, change, timeout=None):
+        """Waits for `change` (a _next_change taken before reading the cache) or the timeout"""
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(change.wait(), timeout)
+
+    async def _install(self, helm_command):
+        if helm_command and not await self._run_helm(helm_command):
+            return False
+        with TRACER.span("wait_for_deployment"):
+            return await self._wait_ready()
+
+    async def _watch_failures(self):
+        """Reports failure signals as soon as the cache shows them; with fail_fast, returns a fatal one"""
+        reported = set()
+        first_seen = {}
+        while True:
+            change = self._next_change
+            state = self.cache.snapshot()
+            now = time.time()
+            objects = ([dict(job, kind="Job") for job in state["jobs"]]
+                       + [dict(sts, kind="StatefulSet") for sts in state["statefulsets"]])
+            # Leftovers of an earlier install come before it, allowing for clock skew
+            self.failures = deployment_failures(state["pods"], state["events"], objects, since=self.started - 60)
+            active = {(failure["object"], failure["reason"]): failure for failure in self.failures}
+            first_seen = {key: first_seen.get(key, now) for key in active}
+            for key, failure in active.items():
+                if key not in reported:
+                    reported.add(key)
+                    message = f" - {failure['message']}" if failure['message'] else ""
+                    print_colored(f"\n{failure['object']}: {failure['reason']}{message}", "red")
+                if self.fail_fast and failure_is_fatal(failure, now - first_seen[key]):
+                    return failure
+            # Also wake up every second, a failure becomes fatal by lasting
+            await self._changed(change, timeout=1)
+
+    def _abort(self, failure):
+        print("\n")
+        print_colored(f"Aborting the installation (--fail-fast): {failure['object']} is failing with {failure['reason']}.", "red")
+        if failure['message']:
+            print_colored(failure['message'], "red")
+        hint = f"kubectl describe {failure['object']} -n {self.namespace}"
+        if failure['reason'] == "CrashLoopBackOff":
+            hint += f"' and 'kubectl logs {failure['object']} -n {self.namespace} --previous"
+        print_colored(f"Inspect it with '{hint}', fix the cause and rerun with --resume.", "yellow")
+
+    async def _run_helm(self, helm_command):
+        status = asyncio.create_task(self._report_status())
+        try:
+            success, output, error = await run_command_async(helm_command)
+        finally:
+            status.cancel()
+        print()
+        if not success:
+            # Only ignore known non-fatal errors
+            if not any(err in error for err in KNOWN_NONFATAL_ERRORS):
+                print_colored("\nHopsworks installation failed.", "red")
+                print_colored("Error: " + error, "red")
+                return False
+            print_colored(f"\nIgnoring expected configuration message: {error}", "yellow")
+        return True
+
+    async def _report_status(self):
+        while True:
+            # Reads the shared cache, the API server is only queried by its fetcher
+            pods = self.cache.snapshot()["pods"]
+            if pods:
+                print_colored(f"\rCurrent status: {len(pods)} pods created", "cyan", end='', flush=True)
+            elif self.cache.last_error and not self.cache.is_synced("pods"):
+                print_colored(f"\rError checking pod status: {self.cache.last_error.strip()}", "red", end='', flush=True)
             else:
-                print_colored(f"\rError checking pod status: {error.strip()}", "red", end='')
-        sys.stdout.flush()  # Ensure the output is displayed immediately
-        time.sleep(10)  # Update every 10 seconds
-    print()  # Print a newline when done to move to the next line
+                print_colored("\rWaiting for pods to be created... Do not panic. This will take a moment", "yellow", end='', flush=True)
+            await asyncio.sleep(self.STATUS_INTERVAL)
+
+    async def _discover_load_balancer(self):
+        """Follows the services in the cache until the LoadBalancer has an address"""
+        while self.address is None:
+            change = self._next_change
+            self.address = load_balancer_address(self.cache.snapshot()["services"])
+            if self.address is None:
+                await self._changed(change)
+        self._wake()  # Show it on the progress line
+
+    async def _wait_ready(self):
+        print_colored("\nMonitoring core services...", "blue")
+        start_time = time.time()
+        stop_listening = self._listen_for_override()
+        if self.interactive:
+            print_colored("Press '1' at any time to proceed anyway", "yellow")
+        try:
+            while not self.override.is_set():
+                # Check if we've timed out
+                if (time.time() - start_time) >= self.timeout:
+                    print_colored(f"\nTimeout after {self.timeout/60:.1f} minutes.", "yellow")
+                    state = self.cache.snapshot()
+                    pending = format_components(component_status(state["pods"], state["statefulsets"]), pending_only=True)
+                    if pending:
+                        print_colored(f"Still waiting for: {pending}", "yellow")
+                    for failure in self.failures:
+                        print_colored(f"Failing: {failure['object']} ({failure['reason']})", "red")
+                    if not self.interactive:
+                        return False
+                    print_colored("Press '1' to proceed anyway, or Ctrl+C to abort", "cyan")
+                    await self.override.wait()
+                    print_colored("\nProceeding despite timeout!", "yellow")
+                    return True
+
+                # Re-evaluated on every watch event, so we return as soon as the last job completes
+                change = self._next_change
+                state = self.cache.snapshot()
+                is_ready, complete_jobs, total_jobs = deployment_status(state["jobs"], state["pods"], state["statefulsets"])
+                components = component_status(state["pods"], state["statefulsets"])
+                for job in state["jobs"]:
+                    if job_is_complete(job):
+                        self.job_completions.setdefault(job['metadata']['name'], time.time() - self.started)
+                if is_ready:
+                    self.ready_after = time.time() - self.started
+                    print("\n")
+                    print_colored("All jobs complete and core services are ready!", "green")
+                    pending = format_components(components, pending_only=True)
+                    if pending:
+                        print_colored(f"Still starting: {pending}", "yellow")
+                    return True
+
+                elapsed = int(time.time() - start_time)
+                progress = (complete_jobs / total_jobs * 100) if total_jobs > 0 else 0
+                seen = format_components(components)
+                seen = f" | {seen}" if seen else ""
+                address = f" | LoadBalancer {self.address}" if self.address else ""
+                failing = f" | {len(self.failures)} failing" if self.failures else ""
+                hint = " | Press '1' to proceed" if self.interactive else ""
+                # Clear the rest of the line, it shrinks when components go away
+                print_colored(f"\rProgress: {progress:.1f}% ({complete_jobs}/{total_jobs} jobs){seen} | {elapsed}s elapsed"
+                              f"{self._time_left(complete_jobs)}{address}{failing}{hint}\033[K", "cyan", end='', flush=True)
+
+                # Sleep until the watch delivers a change or the key is pressed; wake up every second for the clock
+                await self._changed(change, timeout=1)
+
+            print("\n")
+            print_colored("Override accepted - proceeding anyway!", "yellow")
+            return True
+        finally:
+            stop_listening()
+
+    def _time_left(self, complete_jobs):
+        """' | ~5m00s left' from past deployments; warns once when this one falls far behind them"""
+        if not self.history:
+            return ""
+        elapsed = time.time() - self.started
+        remaining, usual_next = estimate_remaining(self.history, complete_jobs)
+        if elapsed > SLOW_FACTOR * usual_next + 60 and not self.warned_slow:
+            self.warned_slow = True
+            print_colored(f"\nSlower than usual: past installs like this one had {complete_jobs + 1} jobs complete "
+                          f"after {format_duration(usual_next)}, this one has {complete_jobs} after {format_duration(elapsed)}. "
+                          f"Check 'kubectl get pods -n {self.namespace}' for stuck pods.", "yellow")
+        # Past runs needed `remaining` from the last completion on, part of it has gone by already
+        since_last_job = elapsed - max(self.job_completions.values(), default=0)
+        left = remaining - since_last_job
+        if left <= 0:
+            return " | taking longer than usual"
+        return f" | ~{format_duration(left)} left"
+
+    def _listen_for_override(self):
+        """Sets the override when '1' is pressed; returns a function that stops listening"""
+        if not self.interactive:
+            return lambda: None
+
+        def pressed():
+            self.override.set()
+            self._wake()
+
+        if sys.platform == 'win32':
+            task = asyncio.create_task(self._poll_console(pressed))
+            return task.cancel
+
+        import termios
+        import tty
+        loop = asyncio.get_running_loop()
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        tty.setcbreak(fd)
 
-def get_license_agreement():
+        def on_input():
+            key = os.read(fd, 1)
+            if key == b'1':
+                pressed()
+            elif not key:
+                loop.remove_reader(fd)  # stdin closed
+
+        loop.add_reader(fd, on_input)
+
+        def stop():
+            loop.remove_reader(fd)
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        return stop
+
+    async def _poll_console(self, pressed):
+        # The Windows event loop cannot wait on the console, so poll it
+        import msvcrt
+        while True:
+            while msvcrt.kbhit():
+                if msvcrt.getch() == b'1':
+                    pressed()
+            await asyncio.sleep(0.1)
+
+def get_license_agreement(ask):
+    """Asks for the license with `ask`, HopsworksInstaller.ask, so --answers can give it"""
     print_colored("\nChoose a license agreement:", "blue")
     print("1. Startup Software License")
     print("2. Evaluation Agreement")
-    choice = get_user_input("Enter 1 or 2:", ["1", "2"])
+    choice = ask("license", "Enter 1 or 2: ", valid=lambda answer: answer in ("1", "2"),
+                 invalid="Invalid input. Expected one of: 1, 2")
     license_type = "Startup" if choice == "1" else "Evaluation"
     license_url = STARTUP_LICENSE_URL if choice == "1" else EVALUATION_LICENSE_URL
     print_colored(f"\nReview the {license_type} License Agreement at:", "blue")
     print_colored(license_url, "cyan")
-    agreement = get_user_input(
-        "\nDo you agree to the terms and conditions? (yes/no):", ["yes", "no"]
-    ).lower() == "yes"
-    if not agreement:
-        print_colored("You must agree to the terms and conditions to proceed.", "red")
-        sys.exit(1)
+    agreement = ask("agree_to_license", "\nDo you agree to the terms and conditions? (yes/no): ",
+                    valid=lambda answer: answer.lower() in ("yes", "no"),
+                    invalid="Invalid input. Expected one of: yes, no").lower() == "yes"
     return license_type, agreement
 
-def get_user_info():
+def get_user_info(ask):
+    """Asks for the user's details with `ask`, HopsworksInstaller.ask, so --answers can give them"""
     print_colored("\nProvide the following information:", "blue")
-    
-    while True:
-        name = input("Your name: ").strip()
-        if len(name) < 2:
-            print_colored("Sorry, We need a real name, please.", "yellow")
-            continue
-            
-        email = input("Your email address: ").strip()
-        if not '@' in email or not '.' in email or len(email) < 5:
-            print_colored("That doesn't look like an email address. Please try again", "yellow")
-            continue
-            
-        company = input("Your company name (optional): ").strip()
-            
-        # If we get here, all inputs are valid
-        break
-        
+    name = ask("name", "Your name: ", valid=lambda answer: len(answer) >= 2,
+               invalid="Sorry, We need a real name, please.")
+    email = ask("email", "Your email address: ",
+                valid=lambda answer: '@' in answer and '.' in answer and len(answer) >= 5,
+                invalid="That doesn't look like an email address. Please try again")
+    company = ask("company", "Your company name (optional): ", optional=True)
     return name, email, company
 
 def send_user_data(name, email, company, license_type, agreed_to_license):
@@ -1315,124 +3573,537 @@ def send_user_data(name, email, company, license_type, agreed_to_license):
         print_colored(f"Failed to send user data: {str(e)}", "red")
         return False, installation_id
     
-def wait_for_deployment(namespace, timeout=2700):
+def namespace_ready(namespace):
+    client = get_kube_client()
+    try:
+        ns = client.get(f"/api/v1/namespaces/{namespace}")
+        if ns.get('status', {}).get('phase') != 'Active':
+            return False
+        client.get(f"/api/v1/namespaces/{namespace}/serviceaccounts/default")
+        return True
+    except KUBE_ERRORS:
+        return False
+
+def deployment_ready(namespace, name):
+    try:
+        deployment = get_kube_client().get(f"/apis/apps/v1/namespaces/{namespace}/deployments/{name}")
+    except KUBE_ERRORS:
+        return False
+    wanted = deployment.get('spec', {}).get('replicas', 1)
+    return wanted > 0 and deployment.get('status', {}).get('readyReplicas', 0) >= wanted
+
+def health_check(namespace):
+    print_colored("\nPerforming basic health check...", "blue")
+
+    client = get_kube_client()
+    try:
+        pods = client.get(f"/api/v1/namespaces/{namespace}/pods").get('items', [])
+        statefulsets = client.get(f"/apis/apps/v1/namespaces/{namespace}/statefulsets").get('items', [])
+    except KUBE_ERRORS:
+        pods, statefulsets = [], []
+
+    # Only the core components decide; others may be optional, scaled down or named differently
+    components = component_status(pods, statefulsets)
+    for name, (ready, total) in components.items():
+        if total:
+            print_colored(f"  {name:<12} {ready}/{total} ready", "green" if ready >= total else "yellow")
+    missing = [name for name in CORE_COMPONENTS if not components[name][0]]
+    if missing:
+        print_colored(f"{', '.join(missing)} not ready. Health check failed.", "red")
+        return False
+
+    degraded = [name for name, (ready, total) in components.items() if ready < total and name not in CORE_COMPONENTS]
+    if degraded:
+        print_colored(f"Basic health check passed, but not all pods of {', '.join(degraded)} are ready yet.", "yellow")
+    else:
+        print_colored("Basic health check passed.", "green")
+    return True
+
+# Image pre-pull
+def pod_specs(manifests):
+    """Pod specs of the workloads in rendered manifests: pods, deployments, statefulsets, jobs, cronjobs..."""
+    for manifest in manifests:
+        spec = manifest.get('spec') or {}
+        while spec and 'containers' not in spec:
+            spec = ((spec.get('jobTemplate') or {}).get('spec') or (spec.get('template') or {}).get('spec') or {})
+        if spec:
+            yield spec
+
+def chart_images(manifests):
+    """Returns the images and the image pull secrets used by rendered manifests"""
+    images, pull_secrets = {}, {}
+    for spec in pod_specs(manifests):
+        for container in (spec.get('initContainers') or []) + (spec.get('containers') or []):
+            if container.get('image'):
+                images[container['image']] = True
+        for secret in spec.get('imagePullSecrets') or []:
+            if secret.get('name'):
+                pull_secrets[secret['name']] = True
+    return list(images), list(pull_secrets)
+
+def prepull_daemonset(namespace, images, pull_secrets):
     """
-    Enhanced deployment monitor that exits immediately when ready,
-    or lets you override with a keypress.
+    A DaemonSet with one container per image, so the kubelet of every node pulls all of them in
+    parallel. The containers only sleep, or fail to start when the image has no shell, either way
+    the image is on the node afterwards.
     """
-    print_colored("\nMonitoring core services...", "blue")
-    start_time = time.time()
-    
-    import threading
-    import sys
-    if sys.platform != 'win32':
-        import termios
-        import tty
+    labels = {"app": PREPULL_DAEMONSET}
+    containers = [{
+        "name": f"image-{i}",
+        "image": image,
+        "imagePullPolicy": "IfNotPresent",
+        "command": ["sh", "-c", "sleep 3600"],
+        "resources": {"requests": {"cpu": "1m", "memory": "4Mi"}, "limits": {"cpu": "10m", "memory": "16Mi"}},
+    } for i, image in enumerate(images)]
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "DaemonSet",
+        "metadata": {"name": PREPULL_DAEMONSET, "namespace": namespace, "labels": labels},
+        "spec": {
+            "selector": {"matchLabels": labels},
+            "template": {
+                "metadata": {"labels": labels},
+                "spec": {
+                    "containers": containers,
+                    "imagePullSecrets": [{"name": name} for name in pull_secrets],
+                    "tolerations": [{"operator": "Exists"}],
+                    "terminationGracePeriodSeconds": 0,
+                },
+            },
+        },
+    }
 
-    override_flag = threading.Event()
-    
-    def check_status():
-        """Check if deployment is ready"""
-        # Check jobs
-        cmd = f"kubectl get jobs -n {namespace} -o custom-columns=NAME:.metadata.name,STATUS:.status.conditions[*].type"
-        success, output, _ = run_command(cmd, verbose=False)
-        
-        if not success or not output.strip():
-            return False, 0, 0
-            
-        jobs = [line.split() for line in output.strip().split('\n')[1:]]
-        incomplete_jobs = [job[0] for job in jobs if "Complete" not in job[-1] and "SuccessCriteriaMet" not in job[-1]]
-        
-        # Check core service(s)
-        services_ready = True
-        for svc in ["hopsworks-instance"]:
-            cmd = f"kubectl get pods -n {namespace} -l app={svc} -o jsonpath='{{.items[0].status.phase}}'"
-            success, status, _ = run_command(cmd, verbose=False)
-            if not success or status.strip() != "Running":
-                services_ready = False
-                break
-                
-        total_jobs = len(jobs)
-        complete_jobs = total_jobs - len(incomplete_jobs)
-        
-        return services_ready and not incomplete_jobs, complete_jobs, total_jobs
+def image_pulled(container_status):
+    """True once the node has the image of a container, whether or not the container could start"""
+    if container_status.get('imageID'):
+        return True
+    waiting = (container_status.get('state') or {}).get('waiting')
+    return bool(container_status.get('state')) and not (
+        waiting and waiting.get('reason') in ('ContainerCreating', 'ErrImagePull', 'ImagePullBackOff'))
 
-    def key_listener():
-        """Listen for keypress to override"""
-        if sys.platform == 'win32':
-            import msvcrt
-            while not override_flag.is_set():
-                if msvcrt.kbhit():
-                    key = msvcrt.getch()
-                    if key == b'1':
-                        override_flag.set()
-                threading.Event().wait(0.1)
+def image_pull_failed(container_status):
+    return ((container_status.get('state') or {}).get('waiting') or {}).get('reason') in ('ErrImagePull', 'ImagePullBackOff')
+
+def prepull_status(namespace, image_count):
+    """
+    Returns (nodes done, nodes given up on, nodes, images that failed to pull) for the pre-pull
+    DaemonSet. A node is given up on once each of its images is either pulled or failing to pull.
+    """
+    client = get_kube_client()
+    daemonset = client.get(f"/apis/apps/v1/namespaces/{namespace}/daemonsets/{PREPULL_DAEMONSET}")
+    pods = client.get(f"/api/v1/namespaces/{namespace}/pods", labelSelector=f"app={PREPULL_DAEMONSET}").get('items', [])
+    done, given_up, failed = 0, 0, set()
+    for pod in pods:
+        statuses = pod.get('status', {}).get('containerStatuses') or []
+        pod_failed = {status.get('image') for status in statuses if image_pull_failed(status)}
+        failed.update(pod_failed)
+        if len(statuses) < image_count or not all(image_pulled(status) or image_pull_failed(status) for status in statuses):
+            continue
+        if pod_failed:
+            given_up += 1
         else:
-            old_settings = termios.tcgetattr(sys.stdin)
-            try:
-                tty.setcbreak(sys.stdin.fileno())
-                while not override_flag.is_set():
-                    if sys.stdin.read(1) == '1':
-                        override_flag.set()
-            finally:
-                termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
+            done += 1
+    return done, given_up, daemonset.get('status', {}).get('desiredNumberScheduled', 0), failed
 
-    # Start key listener in background
-    listener = threading.Thread(target=key_listener, daemon=True)
-    listener.start()
-    
-    print_colored("Press '1' at any time to proceed anyway", "yellow")
-    
+# Preflight scheduling check
+QUANTITY_SUFFIXES = {"m": 1e-3, "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18,
+                     "Ki": 2**10, "Mi": 2**20, "Gi": 2**30, "Ti": 2**40, "Pi": 2**50, "Ei": 2**60}
+
+def parse_quantity(value):
+    """A Kubernetes quantity such as 500m, 2, 1.5Gi or 1e3 as a plain number (cores, bytes...); 0 if unreadable"""
+    value = str(value).strip()
+    factor = 1
+    for suffix in sorted(QUANTITY_SUFFIXES, key=len, reverse=True):
+        if value.endswith(suffix):
+            value, factor = value[:-len(suffix)], QUANTITY_SUFFIXES[suffix]
+            break
     try:
-        while True:
-            # Check for override
-            if override_flag.is_set():
-                print("\n")
-                print_colored("Override accepted - proceeding anyway!", "yellow")
-                return True
-                
-            # Check if we've timed out
-            if (time.time() - start_time) >= timeout:
-                print_colored(f"\nTimeout after {timeout/60:.1f} minutes.", "yellow")
-                print_colored("Press '1' to proceed anyway, or Ctrl+C to abort", "cyan")
-                # Wait for override or interrupt
-                while not override_flag.is_set():
-                    time.sleep(1)
-                print_colored("\nProceeding despite timeout!", "yellow")
-                return True
-                
-            # Regular status check
-            is_ready, complete_jobs, total_jobs = check_status()
-            
-            if is_ready:
-                print("\n")
-                print_colored("All jobs complete and core services are ready!", "green")
+        return float(value) * factor
+    except ValueError:
+        return 0.0
+
+def pod_requests(spec):
+    """Effective cpu and memory requests of a pod spec: its containers, or its largest init container if more"""
+    def requests(container):
+        resources = container.get('resources') or {}
+        # Without requests Kubernetes uses the limits
+        amounts = dict(resources.get('limits') or {}, **(resources.get('requests') or {}))
+        return {name: parse_quantity(amounts.get(name, 0)) for name in ("cpu", "memory")}
+    containers = [requests(c) for c in spec.get('containers') or []]
+    total = {name: sum(c[name] for c in containers) for name in ("cpu", "memory")}
+    for container in spec.get('initContainers') or []:
+        for name, amount in requests(container).items():
+            total[name] = max(total[name], amount)
+    return total
+
+def chart_workloads(manifests):
+    """
+    The workloads of rendered manifests with their replica count, per-pod requests, node selector,
+    whether replicas must be on different nodes, and the storage their volume claim templates ask for.
+    Standalone PersistentVolumeClaims are listed as workloads without pods.
+    """
+    workloads = []
+    for manifest in manifests:
+        kind = manifest.get('kind')
+        name = f"{kind}/{(manifest.get('metadata') or {}).get('name')}"
+        spec = manifest.get('spec') or {}
+        if kind == "PersistentVolumeClaim":
+            storage = parse_quantity(((spec.get('resources') or {}).get('requests') or {}).get('storage', 0))
+            workloads.append({"name": name, "kind": kind, "replicas": 0, "storage": storage})
+            continue
+        # CronJobs run later, on their own schedule
+        if kind not in ("Pod", "Deployment", "ReplicaSet", "StatefulSet", "DaemonSet", "Job"):
+            continue
+        pod = next(pod_specs([manifest]), None)
+        if pod is None:
+            continue
+        if kind == "Job":
+            replicas = spec.get('parallelism', 1)
+        elif kind in ("Pod", "DaemonSet"):
+            replicas = 1
+        else:
+            replicas = spec.get('replicas', 1)
+        claims = spec.get('volumeClaimTemplates') or []
+        storage = sum(parse_quantity(((claim.get('spec') or {}).get('resources') or {}).get('requests', {}).get('storage', 0))
+                      for claim in claims)
+        anti_affinity = (pod.get('affinity') or {}).get('podAntiAffinity') or {}
+        workloads.append({
+            "name": name, "kind": kind, "replicas": int(replicas or 0), "requests": pod_requests(pod),
+            "node_selector": pod.get('nodeSelector') or {}, "tolerations": pod.get('tolerations') or [],
+            "spread": bool(anti_affinity.get('requiredDuringSchedulingIgnoredDuringExecution')),
+            "storage": storage * int(replicas or 0),
+        })
+    return workloads
+
+def node_capacity(nodes, pods, namespace):
+    """
+    What each node that accepts new pods has left: allocatable cpu, memory and pod slots minus the
+    requests of the pods already running there, except ours in `namespace` which an upgrade replaces.
+    Tainted nodes are kept with their NoSchedule/NoExecute taints, only pods tolerating them fit there;
+    cordoned and control-plane nodes are left out.
+    """
+    free = {}
+    for node in nodes:
+        spec = node.get('spec') or {}
+        taints = [taint for taint in spec.get('taints') or [] if taint.get('effect') in ('NoSchedule', 'NoExecute')]
+        if spec.get('unschedulable') or any(taint.get('key') in CONTROL_PLANE_TAINTS for taint in taints):
+            continue
+        allocatable = (node.get('status') or {}).get('allocatable') or {}
+        metadata = node.get('metadata') or {}
+        free[metadata.get('name')] = {
+            "cpu": parse_quantity(allocatable.get('cpu', 0)),
+            "memory": parse_quantity(allocatable.get('memory', 0)),
+            "pods": parse_quantity(allocatable.get('pods', 110)),
+            "labels": metadata.get('labels') or {},
+            "taints": taints,
+        }
+    for pod in pods:
+        node = free.get((pod.get('spec') or {}).get('nodeName'))
+        if node is None or (pod.get('metadata') or {}).get('namespace') == namespace:
+            continue
+        if (pod.get('status') or {}).get('phase') in ('Succeeded', 'Failed'):
+            continue
+        for name, amount in pod_requests(pod.get('spec') or {}).items():
+            node[name] -= amount
+        node["pods"] -= 1
+    return free
+
+def tolerates(tolerations, taint):
+    """Whether one of a pod's tolerations matches a node taint, as the scheduler matches them"""
+    for toleration in tolerations:
+        if toleration.get('effect') and toleration['effect'] != taint.get('effect'):
+            continue
+        operator = toleration.get('operator', 'Equal')
+        if not toleration.get('key'):
+            # An empty key with Exists tolerates every taint
+            if operator == 'Exists':
                 return True
-            
-            # Status update
-            elapsed = int(time.time() - start_time)
-            progress = (complete_jobs / total_jobs * 100) if total_jobs > 0 else 0
-            print_colored(f"\rProgress: {progress:.1f}% ({complete_jobs}/{total_jobs} jobs) | {elapsed}s elapsed | Press '1' to proceed", "cyan", end='')
-            
-            time.sleep(5)
-            
-    except KeyboardInterrupt:
-        print("\n")
-        print_colored("Installation interrupted. Check status manually with 'kubectl get pods,jobs -n hopsworks'", "yellow")
-        return False
-    finally:
-        override_flag.set()  # Stop the key listener
+            continue
+        if toleration['key'] == taint.get('key') and (operator == 'Exists' or toleration.get('value', '') == taint.get('value', '')):
+            return True
+    return False
 
-def health_check(namespace):
-    print_colored("\nPerforming basic health check...", "blue")
+def simulate_placement(workloads, nodes):
+    """
+    Places every pod of the workloads on the nodes like the default scheduler would spread them:
+    DaemonSets on every node first, then the largest pods first, each on the matching node with the
+    most room left. Jobs only have to fit in what is left, one at a time, as they come and go.
+    Returns the workloads of the pods that found no node, once per pod.
+    """
+    free = {name: dict(node) for name, node in nodes.items()}
+    largest = {name: max([node[name] for node in nodes.values()] + [1e-9]) for name in ("cpu", "memory")}
+    unschedulable = []
+
+    def allowed(node, workload):
+        return (all(node["labels"].get(key) == value for key, value in workload["node_selector"].items())
+                and all(tolerates(workload.get("tolerations") or [], taint) for taint in node.get("taints") or []))
+
+    def fits(node, workload):
+        return (node["pods"] >= 1 and all(node[name] >= workload["requests"][name] for name in ("cpu", "memory"))
+                and allowed(node, workload))
+
+    def place(node, workload):
+        for name in ("cpu", "memory"):
+            node[name] -= workload["requests"][name]
+        node["pods"] -= 1
+
+    for workload in workloads:
+        if workload["kind"] == "DaemonSet":
+            for node in free.values():
+                if allowed(node, workload):
+                    place(node, workload) if fits(node, workload) else unschedulable.append(workload)
 
-    cmd = f"kubectl get pods -n {namespace} -o jsonpath='{{.items[*].status.phase}}'"
-    success, output, _ = run_command(cmd, verbose=False)
-    if not success or 'Running' not in output:
-        print_colored("Not all pods are in Running state. Health check failed.", "red")
+    pods = [workload for workload in workloads if workload["kind"] not in ("DaemonSet", "Job", "PersistentVolumeClaim")
+            for _ in range(workload["replicas"])]
+    pods.sort(key=lambda w: max(w["requests"]["cpu"] / largest["cpu"], w["requests"]["memory"] / largest["memory"]),
+              reverse=True)
+    used_nodes = collections.defaultdict(set)
+    for workload in pods:
+        candidates = [name for name, node in free.items() if fits(node, workload)
+                      and not (workload["spread"] and name in used_nodes[workload["name"]])]
+        if not candidates:
+            unschedulable.append(workload)
+            continue
+        best = max(candidates, key=lambda name: free[name]["cpu"] / largest["cpu"] + free[name]["memory"] / largest["memory"])
+        place(free[best], workload)
+        used_nodes[workload["name"]].add(best)
+
+    for workload in workloads:
+        if workload["kind"] == "Job" and workload["replicas"] and not any(fits(node, workload) for node in free.values()):
+            unschedulable.extend([workload] * workload["replicas"])
+    return unschedulable
+
+def suggest_capacity(workloads, nodes, environment):
+    """Cluster sizes on which the workloads would fit: more nodes like the current ones, or nodes of a bigger machine type"""
+    suggestions = []
+    template = None
+    if nodes:
+        # The roomiest current node stands for the ones that would be added
+        template = max(nodes.values(), key=lambda node: (node["cpu"], node["memory"]))
+        for extra in range(1, MAX_SUGGESTED_NODES - len(nodes) + 1):
+            grown = dict(nodes, **{f"new-{i}": dict(template) for i in range(extra)})
+            if not simulate_placement(workloads, grown):
+                suggestions.append(f"{len(nodes) + extra} nodes like the current ones "
+                                   f"({template['cpu']:.1f} CPUs, {template['memory'] / 2**30:.1f} GiB free each)")
+                break
+    for machine_type, cpus, memory in MACHINE_TYPES.get(environment, []):
+        # Labelled like the current nodes, so node selectors still match
+        node = {"cpu": cpus * ALLOCATABLE_SHARE, "memory": memory * 2**30 * ALLOCATABLE_SHARE, "pods": 110,
+                "labels": dict(template["labels"]) if template else {}, "taints": []}
+        for count in range(1, MAX_SUGGESTED_NODES + 1):
+            if not simulate_placement(workloads, {f"node-{i}": dict(node) for i in range(count)}):
+                suggestions.append(f"{count} x {machine_type}")
+                break
+        if len(suggestions) >= 3:
+            break
+    return suggestions
+
+# Sizing profiles
+def auto_sizing(free):
+    """
+    Picks the largest layout for the schedulable nodes of node_capacity(): its sized components may
+    take SIZING_SHARE of the free cpu and memory, and every replica has to find a node. Large is scaled
+    up first with more RonDB node groups, Hopsworks workers and HopsFS datanodes as far as the cluster
+    allows, then large and medium are tried, small is left otherwise. The requests of a worker are
+    capped at half of the largest node. Returns the name of the profile and the layout.
+    """
+    if not free:
+        return "small", dict(SIZING_PROFILES["small"])
+    total = {name: sum(max(node[name], 0) for node in free.values()) for name in ("cpu", "memory")}
+    largest = max(free.values(), key=lambda node: (node["cpu"], node["memory"]))
+
+    def capped(sizing):
+        sizing = dict(sizing)
+        # Half-core and whole GiB steps keep the values readable
+        sizing["worker_cpu"] = max(0.5, min(sizing["worker_cpu"], int(largest["cpu"]) / 2))
+        memory = min(parse_quantity(sizing["worker_memory"]), largest["memory"] / 2)
+        sizing["worker_memory"] = f"{max(1, int(memory / 2**30))}Gi"
+        return sizing
+
+    def requested(sizing):
+        return {name: sum(w["requests"][name] * w["replicas"] for w in sizing_workloads(sizing)) for name in ("cpu", "memory")}
+
+    def fits(sizing):
+        needed = requested(sizing)
+        return (all(needed[name] <= total[name] * SIZING_SHARE for name in needed)
+                and not simulate_placement(sizing_workloads(sizing), free))
+
+    large = capped(SIZING_PROFILES["large"])
+    needed = requested(large)
+    # How many times over the large layout fits, bounded by where all of its counts are at their maximum
+    scale = min(MAX_WORKERS, int(min(total[name] * SIZING_SHARE / needed[name] for name in needed)))
+    candidates = []
+    for factor in range(scale, 1, -1):
+        workers = min(MAX_WORKERS, large["workers"] * factor)
+        scaled = dict(large, node_groups=min(MAX_NODE_GROUPS, large["node_groups"] * factor), workers=workers,
+                      mysqlds=workers, datanodes=min(MAX_DATANODES, large["datanodes"] * factor))
+        if not candidates or scaled != candidates[-1][1]:
+            candidates.append(("large", scaled))
+    candidates += [("large", large), ("medium", capped(SIZING_PROFILES["medium"]))]
+    for name, sizing in candidates:
+        if fits(sizing):
+            return name, sizing
+    return "small", dict(SIZING_PROFILES["small"])
+
+def sizing_workloads(sizing):
+    """The components a layout sizes as chart_workloads() lists workloads, requesting SIZING_REQUESTS per replica"""
+    worker = dict(SIZING_REQUESTS["worker"])
+    if sizing.get("worker_cpu"):
+        worker["cpu"] = parse_quantity(sizing["worker_cpu"])
+    if sizing.get("worker_memory"):
+        worker["memory"] = parse_quantity(sizing["worker_memory"])
+    # (replicas, requests, whether replicas must be on different nodes)
+    components = {
+        "worker": (sizing["workers"], worker, False),
+        "ndbmtd": (sizing["data_replicas"] * (sizing.get("node_groups") or 1), SIZING_REQUESTS["ndbmtd"], True),
+        "mysqld": (sizing.get("mysqlds") or 1, SIZING_REQUESTS["mysqld"], False),
+        "datanode": (sizing["datanodes"], SIZING_REQUESTS["datanode"], True),
+    }
+    return [{"name": f"StatefulSet/{name}", "kind": "StatefulSet", "replicas": int(replicas), "requests": dict(requests),
+             "node_selector": {}, "tolerations": [], "spread": spread, "storage": 0}
+            for name, (replicas, requests, spread) in components.items()]
+
+def sizing_values(sizing):
+    """The helm values of a layout; what it leaves as None keeps the chart's default and is not set"""
+    values = {
+        "hopsworks.replicaCount.worker": str(sizing["workers"]),
+        "rondb.clusterSize.activeDataReplicas": str(sizing["data_replicas"]),
+        "hopsfs.datanode.count": str(sizing["datanodes"]),
+    }
+    if sizing.get("node_groups"):
+        values["rondb.clusterSize.numNodeGroups"] = str(sizing["node_groups"])
+    if sizing.get("mysqlds"):
+        values["rondb.clusterSize.minNumMySQLServers"] = str(sizing["mysqlds"])
+    if sizing.get("worker_cpu"):
+        values["hopsworks.resources.requests.cpu"] = str(sizing["worker_cpu"])
+    if sizing.get("worker_memory"):
+        values["hopsworks.resources.requests.memory"] = str(sizing["worker_memory"])
+    return values
+
+def format_sizing(sizing):
+    """A layout in one line"""
+    requests = (f", {sizing['worker_cpu']} CPUs and {sizing['worker_memory']} each"
+                if sizing.get("worker_cpu") and sizing.get("worker_memory") else "")
+    node_groups = f" x {sizing['node_groups']} node groups" if sizing.get("node_groups") else ""
+    mysqlds = f" with {sizing['mysqlds']} MySQL servers" if sizing.get("mysqlds") else ""
+    return (f"{sizing['workers']} Hopsworks workers{requests}, RonDB {sizing['data_replicas']} replicas"
+            f"{node_groups}{mysqlds}, {sizing['datanodes']} HopsFS datanodes")
+
+# Fleet installs
+def load_fleet_spec(path):
+    """Reads a --fleet spec and checks that every cluster has a unique name and a known environment"""
+    with open(path) as f:
+        spec = yaml.safe_load(f) or {}
+    clusters = spec.get("clusters") or []
+    if not clusters:
+        raise ValueError("the spec lists no clusters")
+    names = [cluster.get("name") for cluster in clusters]
+    if not all(names) or len(set(names)) != len(names):
+        raise ValueError("every cluster needs a unique name")
+    for cluster in clusters:
+        if cluster.get("environment") not in ENVIRONMENTS:
+            raise ValueError(f"cluster '{cluster['name']}' needs an environment, one of: {', '.join(ENVIRONMENTS)}")
+    return spec
+
+class FleetInstall:
+    """
+    One cluster of a fleet: an unattended installer process with its own working directory,
+    KUBECONFIG, journal and log, answering its prompts from the spec.
+    """
+    def __init__(self, cluster, spec, fleet_dir):
+        self.name = cluster["name"]
+        self.environment = cluster["environment"]
+        self.workdir = os.path.abspath(os.path.join(fleet_dir, self.name))
+        self.log_path = os.path.join(self.workdir, "install.log")
+        self.journal_path = os.path.join(self.workdir, "hopsworks-install-journal.json")
+        # Spec-wide settings first, then the cluster's own
+        self.answers = dict(spec.get("answers") or {}, **(cluster.get("answers") or {}), environment=self.environment)
+        self.args = [str(arg) for arg in (spec.get("args") or []) + (cluster.get("args") or [])]
+        self.env = dict(os.environ, KUBECONFIG=os.path.join(self.workdir, "kubeconfig"))
+        if "region" in self.answers:
+            self.env["AWS_REGION"] = str(self.answers["region"])
+        self.env.update({key: str(value) for key, value in dict(spec.get("env") or {}, **(cluster.get("env") or {})).items()})
+        self.started = None
+        self.finished = None
+        self.returncode = None
+
+    def run(self):
+        os.makedirs(self.workdir, exist_ok=True)
+        answers_path = os.path.join(self.workdir, "answers.json")
+        with open(answers_path, 'w') as f:
+            json.dump(self.answers, f, indent=2)
+        command = [sys.executable, os.path.abspath(__file__), "--answers", answers_path,
+                   "--journal", self.journal_path] + self.args
+        if os.path.exists(self.journal_path):
+            command.append("--resume")  # Rerunning a fleet picks up where each install stopped
+
+        self.started = time.time()
+        try:
+            with open(self.log_path, 'a') as log:
+                self.returncode = subprocess.run(command, cwd=self.workdir, env=self.env, stdin=subprocess.DEVNULL,
+                                                 stdout=log, stderr=subprocess.STDOUT).returncode
+        except OSError as e:
+            print_colored(f"Failed to start the installation of {self.name}: {e}", "red")
+            self.returncode = -1
+        self.finished = time.time()
+        return self.returncode == 0
+
+    def status(self):
+        """Returns (state, completed phases, current phase), read from the install's journal"""
+        journal = InstallJournal(self.journal_path)
+        try:
+            journal.load()
+            done = [phase for phase in HopsworksInstaller.PHASES if journal.is_done(phase)]
+        except (OSError, ValueError):
+            done = []
+        current = next((phase for phase in HopsworksInstaller.PHASES if phase not in done), "")
+        if self.started is None:
+            state = "queued"
+        elif self.returncode is None:
+            state = "running"
+        else:
+            state = "done" if self.returncode == 0 else f"failed ({self.returncode})"
+        return state, len(done), current if self.returncode is None else ""
+
+def print_fleet_table(installs):
+    now = time.time()
+    print_colored(f"\n{'cluster':<20} {'env':<6} {'status':<12} {'phases':>6}  {'current step':<22} {'elapsed':>8}", "blue")
+    for install in installs:
+        state, done, current = install.status()
+        elapsed = int((install.finished or now) - install.started) if install.started else 0
+        color = {"done": "green", "running": "cyan", "queued": "white"}.get(state, "red")
+        print_colored(f"{install.name[:20]:<20} {install.environment:<6} {state:<12} "
+                      f"{done:>2}/{len(HopsworksInstaller.PHASES):<3}  {current.replace('_', ' '):<22} "
+                      f"{elapsed // 60:>4}m{elapsed % 60:02d}s", color)
+
+def run_fleet(spec_path, fleet_dir=FLEET_DIR):
+    """Installs every cluster of a fleet spec concurrently; returns True when all of them succeeded"""
+    try:
+        spec = load_fleet_spec(spec_path)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print_colored(f"Invalid fleet spec {spec_path}: {e}", "red")
         return False
 
-    print_colored("Basic health check passed.", "green")
+    installs = [FleetInstall(cluster, spec, fleet_dir) for cluster in spec["clusters"]]
+    parallel = int(spec.get("parallel") or len(installs))
+    print_colored(f"Installing {len(installs)} clusters, {parallel} at a time. "
+                  f"Logs are in {os.path.join(fleet_dir, '<cluster>', 'install.log')}", "blue")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as pool:
+        pending = {pool.submit(install.run) for install in installs}
+        while pending:
+            print_fleet_table(installs)
+            _, pending = concurrent.futures.wait(pending, timeout=FLEET_REFRESH,
+                                                 return_when=concurrent.futures.FIRST_COMPLETED)
+    print_fleet_table(installs)
+
+    failed = [install for install in installs if install.returncode != 0]
+    if failed:
+        print_colored(f"\n{len(failed)} of {len(installs)} installations failed:", "red")
+        for install in failed:
+            print_colored(f"  {install.name}: see {install.log_path}; run --fleet again to resume it", "red")
+        return False
+    print_colored(f"\nAll {len(installs)} installations completed.", "green")
     return True
 
 if __name__ == "__main__":
@@ -45,6 +45,99 @@ resource_exists() {
     fi
 }
 
+# Deletions run as background jobs so independent resources go at the same time.
+# start_deletion <kind> <name> <location> <command...> starts one, wait_deletions waits
+# for all started ones (up to DELETE_TIMEOUT seconds) and checks that each is really gone.
+DELETE_TIMEOUT=${DELETE_TIMEOUT:-1800}
+POLL_INTERVAL=${POLL_INTERVAL:-10}
+JOB_LOGS=$(mktemp -d)
+trap 'rm -rf "$JOB_LOGS"' EXIT
+JOB_COUNT=0
+JOB_PIDS=(); JOB_KINDS=(); JOB_NAMES=(); JOB_LOCATIONS=(); JOB_OUTPUTS=()
+GONE=(); LEFT=()
+
+start_deletion() {
+    local kind="$1" name="$2" location="$3"
+    shift 3
+    JOB_COUNT=$((JOB_COUNT + 1))
+    ("$@") >"$JOB_LOGS/$JOB_COUNT.log" 2>&1 &
+    JOB_PIDS+=("$!"); JOB_KINDS+=("$kind"); JOB_NAMES+=("$name"); JOB_LOCATIONS+=("$location")
+    JOB_OUTPUTS+=("$JOB_LOGS/$JOB_COUNT.log")
+    echo "Deleting $kind $name..."
+}
+
+# Succeeds when the resource can no longer be found
+resource_gone() {
+    local kind="$1" name="$2" group="$3"
+    case "$kind" in
+        cluster) ! az aks show --name "$name" --resource-group "$group" >/dev/null 2>&1;;
+        "load balancer") ! az network lb show --name "$name" --resource-group "$group" >/dev/null 2>&1;;
+        "public IP") ! az network public-ip show --name "$name" --resource-group "$group" >/dev/null 2>&1;;
+        NSG) ! az network nsg show --name "$name" --resource-group "$group" >/dev/null 2>&1;;
+        VNet) ! az network vnet show --name "$name" --resource-group "$group" >/dev/null 2>&1;;
+        "managed identity") ! az identity show --name "$name" --resource-group "$group" >/dev/null 2>&1;;
+        "resource group") [ "$(az group exists --name "$name" 2>/dev/null)" = "false" ];;
+    esac
+}
+
+wait_deletions() {
+    local started=$SECONDS timed_out="" running i pid status
+    while true; do
+        running=0
+        for pid in "${JOB_PIDS[@]}"; do
+            kill -0 "$pid" 2>/dev/null && running=$((running + 1))
+        done
+        [ "$running" -eq 0 ] && break
+        if [ $((SECONDS - started)) -ge "$DELETE_TIMEOUT" ]; then
+            echo -e "${RED}Timed out after ${DELETE_TIMEOUT}s waiting for $running deletion(s)${NC}"
+            timed_out="timed out after ${DELETE_TIMEOUT}s"
+            for pid in "${JOB_PIDS[@]}"; do
+                pkill -P "$pid" 2>/dev/null
+                kill "$pid" 2>/dev/null
+            done
+            break
+        fi
+        echo "Waiting for $running of ${#JOB_PIDS[@]} deletion(s)... ($((SECONDS - started))s)"
+        sleep "$POLL_INTERVAL"
+    done
+
+    for i in "${!JOB_PIDS[@]}"; do
+        status=0
+        wait "${JOB_PIDS[$i]}" 2>/dev/null || status=$?
+        local label="${JOB_KINDS[$i]} ${JOB_NAMES[$i]}"
+        if resource_gone "${JOB_KINDS[$i]}" "${JOB_NAMES[$i]}" "${JOB_LOCATIONS[$i]}"; then
+            GONE+=("$label")
+            echo -e "${GREEN}Deleted $label${NC}"
+        else
+            local reason="still present"
+            [ "$status" -ne 0 ] && reason=$(grep -v '^\s*$' "${JOB_OUTPUTS[$i]}" | tail -n 1)
+            [ "$status" -gt 128 ] && [ -n "$timed_out" ] && reason="$timed_out"
+            LEFT+=("$label: ${reason:-exit code $status}")
+            echo -e "${RED}Could not delete $label: ${reason:-exit code $status}${NC}"
+        fi
+    done
+    JOB_PIDS=(); JOB_KINDS=(); JOB_NAMES=(); JOB_LOCATIONS=(); JOB_OUTPUTS=()
+}
+
+# Starts the deletion without blocking the shell and waits for it like `az aks delete` would
+delete_cluster() {
+    az aks delete --name "$1" --resource-group "$RESOURCE_GROUP" --yes --no-wait &&
+        az aks wait --deleted --name "$1" --resource-group "$RESOURCE_GROUP" --timeout "$DELETE_TIMEOUT"
+}
+
+print_summary() {
+    echo -e "\n${GREEN}Confirmed gone (${#GONE[@]}):${NC}"
+    for resource in "${GONE[@]}"; do
+        echo "  - $resource"
+    done
+    if [ ${#LEFT[@]} -gt 0 ]; then
+        echo -e "${RED}Not deleted (${#LEFT[@]}):${NC}"
+        for resource in "${LEFT[@]}"; do
+            echo "  - $resource"
+        done
+    fi
+}
+
 # Default resource group error check
 if [ -z "$1" ]; then
     echo -e "${RED}Error: Resource group is required${NC}"
@@ -70,14 +163,11 @@ if resource_exists "$CLUSTERS"; then
     if confirm "Would you like to delete these AKS clusters?"; then
         while IFS= read -r CLUSTER_NAME; do
             if [ -n "$CLUSTER_NAME" ]; then
-                echo "Deleting cluster $CLUSTER_NAME..."
-                az aks delete \
-                    --name "$CLUSTER_NAME" \
-                    --resource-group "$RESOURCE_GROUP" \
-                    --yes \
-                    --no-wait
+                start_deletion cluster "$CLUSTER_NAME" "$RESOURCE_GROUP" delete_cluster "$CLUSTER_NAME"
             fi
         done <<< "$CLUSTERS"
+        # Load balancers and IPs the clusters use can only go once the clusters are gone
+        wait_deletions
     fi
 else
     echo "No AKS clusters found."
@@ -90,15 +180,16 @@ if resource_exists "$LBS"; then
     echo -e "Found load balancers:\n$LBS"
     if confirm "Would you like to delete these Load Balancers?"; then
         while IFS= read -r lb_info; do
-            if [ -n "$lb_info" ] && [[ ! "$lb_info" =~ "Name" ]]; then
+            if [ -n "$lb_info" ] && [[ ! "$lb_info" =~ "Name" ]] && [[ ! "$lb_info" =~ ^- ]]; then
                 LB_NAME=$(echo "$lb_info" | awk '{print $1}')
-                echo "Deleting load balancer: $LB_NAME"
-                az network lb delete \
+                start_deletion "load balancer" "$LB_NAME" "$RESOURCE_GROUP" \
+                    az network lb delete \
                     --name "$LB_NAME" \
-                    --resource-group "$RESOURCE_GROUP" \
-                    --no-wait
+                    --resource-group "$RESOURCE_GROUP"
             fi
         done <<< "$LBS"
+        # Public IPs can't be deleted while a load balancer frontend uses them
+        wait_deletions
     fi
 else
     echo "No Load Balancers found."
@@ -111,13 +202,12 @@ if resource_exists "$PIPS"; then
     echo -e "Found public IPs:\n$PIPS"
     if confirm "Would you like to delete these Public IPs?"; then
         while IFS= read -r pip_info; do
-            if [ -n "$pip_info" ] && [[ ! "$pip_info" =~ "Name" ]]; then
+            if [ -n "$pip_info" ] && [[ ! "$pip_info" =~ "Name" ]] && [[ ! "$pip_info" =~ ^- ]]; then
                 PIP_NAME=$(echo "$pip_info" | awk '{print $1}')
-                echo "Deleting public IP: $PIP_NAME"
-                az network public-ip delete \
+                start_deletion "public IP" "$PIP_NAME" "$RESOURCE_GROUP" \
+                    az network public-ip delete \
                     --name "$PIP_NAME" \
-                    --resource-group "$RESOURCE_GROUP" \
-                    --no-wait
+                    --resource-group "$RESOURCE_GROUP"
             fi
         done <<< "$PIPS"
     fi
@@ -125,20 +215,17 @@ else
     echo "No Public IPs found."
 fi
 
-# Check for Network Security Groups
+# Check for Network Security Groups, deleted after the VNets whose subnets they may be attached to
+DELETE_NSGS=()
 echo -e "\n${YELLOW}Checking for Network Security Groups...${NC}"
 NSGS=$(az network nsg list --resource-group "$RESOURCE_GROUP" --query "[].{name:name}" -o table)
 if resource_exists "$NSGS"; then
     echo -e "Found NSGs:\n$NSGS"
     if confirm "Would you like to delete these Network Security Groups?"; then
         while IFS= read -r nsg_info; do
-            if [ -n "$nsg_info" ] && [[ ! "$nsg_info" =~ "Name" ]]; then
+            if [ -n "$nsg_info" ] && [[ ! "$nsg_info" =~ "Name" ]] && [[ ! "$nsg_info" =~ ^- ]]; then
                 NSG_NAME=$(echo "$nsg_info" | awk '{print $1}')
-                echo "Deleting NSG: $NSG_NAME"
-                az network nsg delete \
-                    --name "$NSG_NAME" \
-                    --resource-group "$RESOURCE_GROUP" \
-                    --no-wait
+                DELETE_NSGS+=("$NSG_NAME")
             fi
         done <<< "$NSGS"
     fi
@@ -154,17 +241,25 @@ if resource_exists "$VNETS"; then
     if confirm "Would you like to delete these Virtual Networks?"; then
         while IFS= read -r VNET_NAME; do
             if [ -n "$VNET_NAME" ]; then
-                echo "Deleting VNet: $VNET_NAME"
-                az network vnet delete \
+                start_deletion VNet "$VNET_NAME" "$RESOURCE_GROUP" \
+                    az network vnet delete \
                     --name "$VNET_NAME" \
-                    --resource-group "$RESOURCE_GROUP" \
-                    --no-wait
+                    --resource-group "$RESOURCE_GROUP"
             fi
         done <<< "$VNETS"
     fi
 else
     echo "No Virtual Networks found."
 fi
+if [ ${#DELETE_NSGS[@]} -gt 0 ]; then
+    wait_deletions
+    for NSG_NAME in "${DELETE_NSGS[@]}"; do
+        start_deletion NSG "$NSG_NAME" "$RESOURCE_GROUP" \
+            az network nsg delete \
+            --name "$NSG_NAME" \
+            --resource-group "$RESOURCE_GROUP"
+    done
+fi
 
 # Check for Managed Identities
 echo -e "\n${YELLOW}Checking for Managed Identities...${NC}"
@@ -173,13 +268,12 @@ if resource_exists "$IDENTITIES"; then
     echo -e "Found Managed Identities:\n$IDENTITIES"
     if confirm "Would you like to delete these Managed Identities?"; then
         while IFS= read -r identity_info; do
-            if [ -n "$identity_info" ] && [[ ! "$identity_info" =~ "Name" ]]; then
+            if [ -n "$identity_info" ] && [[ ! "$identity_info" =~ "Name" ]] && [[ ! "$identity_info" =~ ^- ]]; then
                 IDENTITY_NAME=$(echo "$identity_info" | awk '{print $1}')
-                echo "Deleting Managed Identity: $IDENTITY_NAME"
-                az identity delete \
+                start_deletion "managed identity" "$IDENTITY_NAME" "$RESOURCE_GROUP" \
+                    az identity delete \
                     --name "$IDENTITY_NAME" \
-                    --resource-group "$RESOURCE_GROUP" \
-                    --no-wait
+                    --resource-group "$RESOURCE_GROUP"
             fi
         done <<< "$IDENTITIES"
     fi
@@ -208,11 +302,17 @@ else
     echo "No Role Assignments found."
 fi
 
+# Public IPs, NSGs, VNets and identities were deleted side by side
+wait_deletions
+
 # Optional: Delete the resource group itself
 if confirm "Would you like to delete the entire resource group ${RESOURCE_GROUP}?"; then
-    echo "Deleting resource group ${RESOURCE_GROUP}..."
-    az group delete --name "$RESOURCE_GROUP" --yes --no-wait
+    start_deletion "resource group" "$RESOURCE_GROUP" "" \
+        az group delete --name "$RESOURCE_GROUP" --yes
+    wait_deletions
 fi
 
+print_summary
+
 echo -e "${GREEN}🧹 Cleanup process completed!${NC}"
-echo -e "${YELLOW}Note: Some resources are being deleted asynchronously and may take a few minutes to complete.${NC}"
+[ ${#LEFT[@]} -eq 0 ]
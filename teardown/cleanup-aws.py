@@ -15,8 +15,26 @@
 
 import boto3
 import click
-from typing import List, Dict, Any
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Callable, Iterable, Optional
 import sys
+import threading
+import time
+
+# How long a deletion keeps being retried while a dependency (ENI, listener) is being released
+RETRY_TIMEOUT = 600
+WAITER_CONFIG = {'Delay': 10, 'MaxAttempts': 60}
+TAG_BATCH_SIZE = 20  # Names or ARNs per describe_tags call, the API maximum
+DELETE_BATCH_SIZE = 1000  # Keys per delete_objects call, the API maximum
+PROGRESS_INTERVAL = 5
+# Back off on throttling instead of failing, listings of large accounts make many calls
+CLIENT_CONFIG = Config(retries={'max_attempts': 10, 'mode': 'adaptive'})
+
+def batches(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
 
 class Colors:
     HEADER = '\033[95m'
@@ -39,35 +57,232 @@ def confirm_action(message: str, default: bool = False) -> bool:
         return default
     return response.startswith('y')
 
+_print_lock = threading.Lock()
+
+def print_locked(message: str, color: str) -> None:
+    """print_colored for worker threads, so lines do not interleave."""
+    with _print_lock:
+        print_colored(message, color)
+
+def retry_while(codes: Iterable[str], func: Callable[[], Any], timeout: int = RETRY_TIMEOUT) -> Any:
+    """Calls func, retrying with backoff while AWS answers with one of the given error codes."""
+    deadline = time.time() + timeout
+    delay = 5
+    while True:
+        try:
+            return func()
+        except ClientError as e:
+            if e.response['Error']['Code'] not in codes or time.time() + delay > deadline:
+                raise
+            time.sleep(delay)
+            delay = min(delay * 2, 30)
+
+class DeletionScheduler:
+    """
+    Deletes resources concurrently within a resource type, and starts a type only once the
+    types it depends on are done (e.g. security groups after the load balancers using them).
+    """
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, kind: str, resources: List[Dict[str, Any]], delete: Callable[[Dict[str, Any]], None],
+            label: Callable[[Dict[str, Any]], str], depends_on: Iterable[str] = ()) -> None:
+        """Schedules delete(resource) for every resource; delete must return once the resource is gone."""
+        self.stages[kind] = {'resources': resources, 'delete': delete, 'label': label,
+                             'depends_on': list(depends_on), 'done': threading.Event(),
+                             'deleted': [], 'failed': []}
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """Runs every stage and returns them with their 'deleted' and 'failed' (label, error) lists."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as workers, \
+             ThreadPoolExecutor(max_workers=max(len(self.stages), 1)) as stages:
+            for kind in self.stages:
+                stages.submit(self._run_stage, kind, workers)
+        return self.stages
+
+    def _run_stage(self, kind: str, workers: ThreadPoolExecutor) -> None:
+        stage = self.stages[kind]
+        try:
+            # Only wait for dependencies that were scheduled at all
+            for dependency in stage['depends_on']:
+                if dependency in self.stages:
+                    self.stages[dependency]['done'].wait()
+            print_locked(f"Deleting {len(stage['resources'])} {kind}...", Colors.BLUE)
+            futures = [(resource, workers.submit(stage['delete'], resource)) for resource in stage['resources']]
+            for resource, future in futures:
+                name = stage['label'](resource)
+                try:
+                    future.result()
+                    stage['deleted'].append(name)
+                    print_locked(f"Deleted {kind[:-1]}: {name}", Colors.GREEN)
+                except Exception as e:
+                    stage['failed'].append((name, str(e)))
+                    print_locked(f"Error deleting {kind[:-1]} {name}: {str(e)}", Colors.RED)
+        finally:
+            stage['done'].set()
+
+class BucketPurger:
+    """
+    Empties a bucket, versioned or not: unfinished multipart uploads are aborted, then every
+    object version and delete marker is deleted in batches of DELETE_BATCH_SIZE keys by a pool
+    of workers while the next pages are still being listed.
+    """
+    def __init__(self, s3, bucket: str, workers: int = 16):
+        self.s3 = s3
+        self.bucket = bucket
+        self.workers = workers
+        self.deleted = 0
+        self.errors: List[str] = []
+        self._lock = threading.Lock()
+        self._started = 0.0
+        self._last_report = 0.0
+
+    def purge(self) -> int:
+        """Deletes everything in the bucket and returns the number of keys deleted; raises if some are left."""
+        self._started = self._last_report = time.time()
+        # Bounds the batches waiting for a worker, so listing does not run far ahead of deleting
+        slots = threading.BoundedSemaphore(self.workers * 2)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            paginator = self.s3.get_paginator('list_multipart_uploads')
+            for page in paginator.paginate(Bucket=self.bucket):
+                for upload in page.get('Uploads', []):
+                    pool.submit(self._abort_upload, upload)
+            for batch in self._version_batches():
+                slots.acquire()
+                pool.submit(self._delete_batch, batch).add_done_callback(lambda _: slots.release())
+
+        elapsed = time.time() - self._started
+        print_locked(f"{self.bucket}: {self.deleted} object versions deleted in {elapsed:.0f}s", Colors.BLUE)
+        if self.errors:
+            raise RuntimeError(f"{len(self.errors)} objects could not be deleted from {self.bucket}, "
+                               f"first error: {self.errors[0]}")
+        return self.deleted
+
+    def _version_batches(self) -> Iterable[List[Dict[str, str]]]:
+        batch = []
+        paginator = self.s3.get_paginator('list_object_versions')
+        for page in paginator.paginate(Bucket=self.bucket, PaginationConfig={'PageSize': DELETE_BATCH_SIZE}):
+            for version in page.get('Versions', []) + page.get('DeleteMarkers', []):
+                batch.append({'Key': version['Key'], 'VersionId': version['VersionId']})
+                if len(batch) == DELETE_BATCH_SIZE:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def _delete_batch(self, batch: List[Dict[str, str]]) -> None:
+        try:
+            response = self.s3.delete_objects(Bucket=self.bucket, Delete={'Objects': batch, 'Quiet': True})
+            # With Quiet only the failures are listed
+            errors = [f"{error['Key']}: {error['Message']}" for error in response.get('Errors', [])]
+        except Exception as e:
+            errors = [f"{item['Key']}: {str(e)}" for item in batch]
+        self._count(len(batch) - len(errors), errors)
+
+    def _abort_upload(self, upload: Dict[str, Any]) -> None:
+        try:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=upload['Key'], UploadId=upload['UploadId'])
+            self._count(0, [])
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NoSuchUpload':
+                self._count(0, [f"upload of {upload['Key']}: {str(e)}"])
+
+    def _count(self, deleted: int, errors: List[str]) -> None:
+        with self._lock:
+            self.deleted += deleted
+            self.errors.extend(errors)
+            now = time.time()
+            if now - self._last_report < PROGRESS_INTERVAL:
+                return
+            self._last_report = now
+            rate = self.deleted / max(now - self._started, 1e-3)
+            print_locked(f"{self.bucket}: {self.deleted} object versions deleted ({rate:.0f}/s)", Colors.BLUE)
+
 class AWSResourceCleaner:
-    def __init__(self, profile: str, region: str, cluster_name: str):
+    def __init__(self, profile: str, region: str, cluster_name: str, workers: int = 8, purge_workers: int = 16):
         self.session = boto3.Session(profile_name=profile, region_name=region)
         self.cluster_name = cluster_name
         self.region = region
+        self.workers = workers
+        self.purge_workers = purge_workers
         
         # Initialize AWS clients
-        self.eks = self.session.client('eks')
-        self.ec2 = self.session.client('ec2')
-        self.elb = self.session.client('elb')
-        self.elbv2 = self.session.client('elbv2')
-        self.s3 = self.session.client('s3')
-        self.cloudformation = self.session.client('cloudformation')
-        self.iam = self.session.client('iam')
+        self.eks = self.session.client('eks', config=CLIENT_CONFIG)
+        self.ec2 = self.session.client('ec2', config=CLIENT_CONFIG)
+        self.elb = self.session.client('elb', config=CLIENT_CONFIG)
+        self.elbv2 = self.session.client('elbv2', config=CLIENT_CONFIG)
+        # One connection per purge worker, plus the ones deleting other buckets
+        self.s3 = self.session.client('s3', config=CLIENT_CONFIG.merge(
+            Config(max_pool_connections=purge_workers + workers)))
+        self.cloudformation = self.session.client('cloudformation', config=CLIENT_CONFIG)
+        self.iam = self.session.client('iam', config=CLIENT_CONFIG)
+
+        # Shared by the list_* methods, see get_cluster_vpc and inventory
+        self._vpc_id: Optional[str] = None
+        self._vpc_looked_up = False
+        self._inventory: Optional[Dict[str, List[Dict[str, Any]]]] = None
 
     def get_cluster_vpc(self) -> str:
-        """Get VPC ID associated with the EKS cluster."""
+        """Get VPC ID associated with the EKS cluster, looked up once."""
+        if self._vpc_looked_up:
+            return self._vpc_id
+        self._vpc_looked_up = True
         try:
             response = self.eks.describe_cluster(name=self.cluster_name)
-            return response['cluster']['resourcesVpcConfig']['vpcId']
+            self._vpc_id = response['cluster']['resourcesVpcConfig']['vpcId']
         except self.eks.exceptions.ResourceNotFoundException:
             print_colored(f"Cluster {self.cluster_name} not found!", Colors.RED)
-            return None
         except Exception as e:
             print_colored(f"Error getting cluster VPC: {str(e)}", Colors.RED)
-            return None
+        return self._vpc_id
+
+    def is_cluster_resource(self, tags: List[Dict[str, str]]) -> bool:
+        return any(tag['Key'] == 'kubernetes.io/cluster/' + self.cluster_name for tag in tags)
+
+    def classic_elb_tags(self, names: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Tags of classic ELBs by name, TAG_BATCH_SIZE names per call."""
+        tags = {}
+        for batch in batches(names, TAG_BATCH_SIZE):
+            for description in self.elb.describe_tags(LoadBalancerNames=batch)['TagDescriptions']:
+                tags[description['LoadBalancerName']] = description['Tags']
+        return tags
+
+    def elbv2_tags(self, arns: List[str]) -> Dict[str, List[Dict[str, str]]]:
+        """Tags of ALBs, NLBs or target groups by ARN, TAG_BATCH_SIZE ARNs per call."""
+        tags = {}
+        for batch in batches(arns, TAG_BATCH_SIZE):
+            for description in self.elbv2.describe_tags(ResourceArns=batch)['TagDescriptions']:
+                tags[description['ResourceArn']] = description['Tags']
+        return tags
+
+    def inventory(self, refresh: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Load balancers, target groups and security groups of the cluster. Listed once with
+        paginated calls restricted to the cluster VPC and batched tag lookups; refresh=True
+        lists them again, e.g. to see what is left after deleting.
+        """
+        if self._inventory is None or refresh:
+            self._inventory = {
+                'load_balancers': self._find_load_balancers(),
+                'target_groups': self._find_target_groups(),
+                'security_groups': self._find_security_groups(),
+            }
+        return self._inventory
 
     def list_load_balancers(self) -> List[Dict[str, Any]]:
         """List all load balancers associated with the cluster."""
+        return self.inventory()['load_balancers']
+
+    def list_target_groups(self) -> List[Dict[str, Any]]:
+        """List target groups associated with the cluster."""
+        return self.inventory()['target_groups']
+
+    def list_security_groups(self) -> List[Dict[str, Any]]:
+        """List security groups associated with the cluster."""
+        return self.inventory()['security_groups']
+
+    def _find_load_balancers(self) -> List[Dict[str, Any]]:
         load_balancers = []
         
         # Get cluster VPC
@@ -77,79 +292,76 @@ class AWSResourceCleaner:
 
         # Check Classic ELBs
         try:
-            elbs = self.elb.describe_load_balancers()['LoadBalancerDescriptions']
+            paginator = self.elb.get_paginator('describe_load_balancers')
+            elbs = [elb for page in paginator.paginate() for elb in page['LoadBalancerDescriptions']
+                    if elb.get('VPCId') == vpc_id]
+            # Get tags to verify they are ours
+            tags = self.classic_elb_tags([elb['LoadBalancerName'] for elb in elbs])
             for elb in elbs:
-                if elb['VPCId'] == vpc_id:
-                    # Get tags to verify it's ours
-                    tags = self.elb.describe_tags(LoadBalancerNames=[elb['LoadBalancerName']])['TagDescriptions'][0]['Tags']
-                    if any(tag['Key'] == 'kubernetes.io/cluster/' + self.cluster_name for tag in tags):
-                        load_balancers.append({
-                            'name': elb['LoadBalancerName'],
-                            'type': 'classic',
-                            'dns': elb['DNSName']
-                        })
+                if self.is_cluster_resource(tags.get(elb['LoadBalancerName'], [])):
+                    load_balancers.append({
+                        'name': elb['LoadBalancerName'],
+                        'type': 'classic',
+                        'dns': elb['DNSName']
+                    })
         except Exception as e:
             print_colored(f"Error listing classic ELBs: {str(e)}", Colors.RED)
 
         # Check ALBs/NLBs
         try:
-            albs = self.elbv2.describe_load_balancers()['LoadBalancers']
+            paginator = self.elbv2.get_paginator('describe_load_balancers')
+            albs = [alb for page in paginator.paginate() for alb in page['LoadBalancers']
+                    if alb.get('VpcId') == vpc_id]
+            tags = self.elbv2_tags([alb['LoadBalancerArn'] for alb in albs])
             for alb in albs:
-                if alb['VpcId'] == vpc_id:
-                    # Get tags to verify it's ours
-                    tags = self.elbv2.describe_tags(ResourceArns=[alb['LoadBalancerArn']])['TagDescriptions'][0]['Tags']
-                    if any(tag['Key'] == 'kubernetes.io/cluster/' + self.cluster_name for tag in tags):
-                        load_balancers.append({
-                            'name': alb['LoadBalancerName'],
-                            'type': 'application/network',
-                            'arn': alb['LoadBalancerArn'],
-                            'dns': alb['DNSName']
-                        })
+                if self.is_cluster_resource(tags.get(alb['LoadBalancerArn'], [])):
+                    load_balancers.append({
+                        'name': alb['LoadBalancerName'],
+                        'type': 'application/network',
+                        'arn': alb['LoadBalancerArn'],
+                        'dns': alb['DNSName']
+                    })
         except Exception as e:
             print_colored(f"Error listing ALBs/NLBs: {str(e)}", Colors.RED)
 
         return load_balancers
 
-    def list_target_groups(self) -> List[Dict[str, Any]]:
-        """List target groups associated with the cluster."""
+    def _find_target_groups(self) -> List[Dict[str, Any]]:
         try:
-            target_groups = []
+            # Only the cluster VPC needs its tags checked, when the cluster still exists
+            vpc_id = self.get_cluster_vpc()
             paginator = self.elbv2.get_paginator('describe_target_groups')
-            
-            for page in paginator.paginate():
-                for tg in page['TargetGroups']:
-                    tags = self.elbv2.describe_tags(ResourceArns=[tg['TargetGroupArn']])['TagDescriptions'][0]['Tags']
-                    if any(tag['Key'] == 'kubernetes.io/cluster/' + self.cluster_name for tag in tags):
-                        target_groups.append({
-                            'name': tg['TargetGroupName'],
-                            'arn': tg['TargetGroupArn']
-                        })
-            return target_groups
+            candidates = [tg for page in paginator.paginate() for tg in page['TargetGroups']
+                          if not vpc_id or tg.get('VpcId') == vpc_id]
+            tags = self.elbv2_tags([tg['TargetGroupArn'] for tg in candidates])
+            return [{'name': tg['TargetGroupName'], 'arn': tg['TargetGroupArn']}
+                    for tg in candidates if self.is_cluster_resource(tags.get(tg['TargetGroupArn'], []))]
         except Exception as e:
             print_colored(f"Error listing target groups: {str(e)}", Colors.RED)
             return []
 
-    def list_security_groups(self) -> List[Dict[str, Any]]:
-        """List security groups associated with the cluster."""
+    def _find_security_groups(self) -> List[Dict[str, Any]]:
         vpc_id = self.get_cluster_vpc()
         if not vpc_id:
             return []
 
         try:
             security_groups = []
-            response = self.ec2.describe_security_groups(
+            paginator = self.ec2.get_paginator('describe_security_groups')
+            pages = paginator.paginate(
                 Filters=[
                     {'Name': 'vpc-id', 'Values': [vpc_id]},
                     {'Name': 'tag:kubernetes.io/cluster/' + self.cluster_name, 'Values': ['owned', 'shared']}
                 ]
             )
             
-            for sg in response['SecurityGroups']:
-                security_groups.append({
-                    'id': sg['GroupId'],
-                    'name': sg['GroupName'],
-                    'description': sg['Description']
-                })
+            for page in pages:
+                for sg in page['SecurityGroups']:
+                    security_groups.append({
+                        'id': sg['GroupId'],
+                        'name': sg['GroupName'],
+                        'description': sg['Description']
+                    })
             return security_groups
         except Exception as e:
             print_colored(f"Error listing security groups: {str(e)}", Colors.RED)
@@ -177,10 +389,43 @@ class AWSResourceCleaner:
             print_colored(f"Error listing S3 buckets: {str(e)}", Colors.RED)
             return []
 
+    def delete_load_balancer(self, lb: Dict[str, Any]) -> None:
+        """Deletes a load balancer and waits until it is gone, its network interfaces go with it."""
+        if lb['type'] == 'classic':
+            self.elb.delete_load_balancer(LoadBalancerName=lb['name'])
+            # There is no waiter for classic ELBs, poll until it is no longer listed
+            deadline = time.time() + RETRY_TIMEOUT
+            while time.time() < deadline:
+                try:
+                    self.elb.describe_load_balancers(LoadBalancerNames=[lb['name']])
+                except ClientError as e:
+                    if e.response['Error']['Code'] == 'LoadBalancerNotFound':
+                        return
+                    raise
+                time.sleep(WAITER_CONFIG['Delay'])
+            raise TimeoutError(f"{lb['name']} still exists after {RETRY_TIMEOUT}s")
+        self.elbv2.delete_load_balancer(LoadBalancerArn=lb['arn'])
+        self.elbv2.get_waiter('load_balancers_deleted').wait(LoadBalancerArns=[lb['arn']], WaiterConfig=WAITER_CONFIG)
+
+    def delete_target_group(self, tg: Dict[str, Any]) -> None:
+        # In use until the listeners of its load balancer are gone
+        retry_while(['ResourceInUse'], lambda: self.elbv2.delete_target_group(TargetGroupArn=tg['arn']))
+
+    def delete_security_group(self, sg: Dict[str, Any]) -> None:
+        # Network interfaces of deleted load balancers are released a few minutes after them
+        retry_while(['DependencyViolation'], lambda: self.ec2.delete_security_group(GroupId=sg['id']))
+
+    def delete_bucket(self, bucket: Dict[str, Any]) -> None:
+        """Empties a bucket, including old versions and multipart uploads, deletes it and waits until it is gone."""
+        BucketPurger(self.s3, bucket['name'], self.purge_workers).purge()
+        self.s3.delete_bucket(Bucket=bucket['name'])
+        self.s3.get_waiter('bucket_not_exists').wait(Bucket=bucket['name'], WaiterConfig=WAITER_CONFIG)
+
     def cleanup_resources(self):
-        """Main cleanup method with user confirmation for each resource type."""
+        """Main cleanup method: confirms each resource type, then deletes everything in dependency order."""
         print_colored(f"\n🔍 Analyzing resources for cluster: {self.cluster_name}", Colors.BLUE, bold=True)
-        
+        scheduler = DeletionScheduler(max_workers=self.workers)
+
         # Load Balancers
         lbs = self.list_load_balancers()
         if lbs:
@@ -188,15 +433,7 @@ class AWSResourceCleaner:
             for lb in lbs:
                 print(f"- {lb['name']} ({lb['type']}) - {lb['dns']}")
             if confirm_action("Would you like to delete these load balancers?"):
-                for lb in lbs:
-                    try:
-                        if lb['type'] == 'classic':
-                            self.elb.delete_load_balancer(LoadBalancerName=lb['name'])
-                        else:
-                            self.elbv2.delete_load_balancer(LoadBalancerArn=lb['arn'])
-                        print_colored(f"Deleted load balancer: {lb['name']}", Colors.GREEN)
-                    except Exception as e:
-                        print_colored(f"Error deleting {lb['name']}: {str(e)}", Colors.RED)
+                scheduler.add('load balancers', lbs, self.delete_load_balancer, lambda lb: lb['name'])
 
         # Target Groups
         target_groups = self.list_target_groups()
@@ -205,12 +442,8 @@ class AWSResourceCleaner:
             for tg in target_groups:
                 print(f"- {tg['name']}")
             if confirm_action("Would you like to delete these target groups?"):
-                for tg in target_groups:
-                    try:
-                        self.elbv2.delete_target_group(TargetGroupArn=tg['arn'])
-                        print_colored(f"Deleted target group: {tg['name']}", Colors.GREEN)
-                    except Exception as e:
-                        print_colored(f"Error deleting target group {tg['name']}: {str(e)}", Colors.RED)
+                scheduler.add('target groups', target_groups, self.delete_target_group, lambda tg: tg['name'],
+                              depends_on=['load balancers'])
 
         # Security Groups
         sgs = self.list_security_groups()
@@ -219,12 +452,8 @@ class AWSResourceCleaner:
             for sg in sgs:
                 print(f"- {sg['name']} ({sg['id']}) - {sg['description']}")
             if confirm_action("Would you like to delete these security groups?"):
-                for sg in sgs:
-                    try:
-                        self.ec2.delete_security_group(GroupId=sg['id'])
-                        print_colored(f"Deleted security group: {sg['name']}", Colors.GREEN)
-                    except Exception as e:
-                        print_colored(f"Error deleting security group {sg['name']}: {str(e)}", Colors.RED)
+                scheduler.add('security groups', sgs, self.delete_security_group, lambda sg: f"{sg['name']} ({sg['id']})",
+                              depends_on=['load balancers', 'target groups'])
 
         # S3 Buckets
         buckets = self.list_s3_buckets()
@@ -233,25 +462,49 @@ class AWSResourceCleaner:
             for bucket in buckets:
                 print(f"- {bucket['name']} (Created: {bucket['creation_date']})")
             if confirm_action("Would you like to delete these S3 buckets? THIS IS DESTRUCTIVE!", default=False):
-                for bucket in buckets:
-                    try:
-                        # First empty the bucket
-                        s3_resource = self.session.resource('s3')
-                        bucket_obj = s3_resource.Bucket(bucket['name'])
-                        bucket_obj.objects.all().delete()
-                        # Then delete the bucket
-                        self.s3.delete_bucket(Bucket=bucket['name'])
-                        print_colored(f"Deleted bucket: {bucket['name']}", Colors.GREEN)
-                    except Exception as e:
-                        print_colored(f"Error deleting bucket {bucket['name']}: {str(e)}", Colors.RED)
-
-        print_colored("\n🧹 Cleanup process completed!", Colors.GREEN, bold=True)
+                scheduler.add('buckets', buckets, self.delete_bucket, lambda bucket: bucket['name'])
+
+        if not scheduler.stages:
+            print_colored("\nNothing to delete.", Colors.GREEN, bold=True)
+            return
+
+        print()
+        started = time.time()
+        stages = scheduler.run()
+        self.report(stages, time.time() - started)
+
+    def report(self, stages: Dict[str, Dict[str, Any]], duration: float) -> None:
+        """Prints what was deleted, what failed and what is still left of the cluster."""
+        print_colored(f"\nCleanup report ({duration:.0f}s):", Colors.BLUE, bold=True)
+        for kind, stage in stages.items():
+            color = Colors.RED if stage['failed'] else Colors.GREEN
+            print_colored(f"- {kind}: {len(stage['deleted'])} deleted, {len(stage['failed'])} failed", color)
+            for name, error in stage['failed']:
+                print(f"    {name}: {error}")
+
+        # Look again, deletions can fail silently or new resources may have appeared
+        self.inventory(refresh=True)
+        leftovers = {
+            'load balancers': [lb['name'] for lb in self.list_load_balancers()],
+            'target groups': [tg['name'] for tg in self.list_target_groups()],
+            'security groups': [f"{sg['name']} ({sg['id']})" for sg in self.list_security_groups()],
+            'buckets': [bucket['name'] for bucket in self.list_s3_buckets()],
+        }
+        leftovers = {kind: names for kind, names in leftovers.items() if names}
+        if not leftovers:
+            print_colored("\n🧹 Cleanup process completed, nothing left behind!", Colors.GREEN, bold=True)
+            return
+        print_colored("\nStill left:", Colors.YELLOW, bold=True)
+        for kind, names in leftovers.items():
+            print_colored(f"- {kind}: {', '.join(names)}", Colors.YELLOW)
 
 @click.command()
 @click.option('--profile', default='default', help='AWS profile to use')
 @click.option('--region', required=True, help='AWS region')
 @click.option('--cluster-name', required=True, help='EKS cluster name')
-def main(profile: str, region: str, cluster_name: str):
+@click.option('--workers', default=8, show_default=True, help='Resources deleted in parallel')
+@click.option('--purge-workers', default=16, show_default=True, help='delete_objects calls in parallel per bucket')
+def main(profile: str, region: str, cluster_name: str, workers: int, purge_workers: int):
     """AWS Resource Cleanup Tool for Hopsworks"""
     print_colored("""
     🧹 AWS Hopsworks Cleanup Tool 🧹
@@ -266,7 +519,7 @@ def main(profile: str, region: str, cluster_name: str):
     ):
         sys.exit(0)
 
-    cleaner = AWSResourceCleaner(profile, region, cluster_name)
+    cleaner = AWSResourceCleaner(profile, region, cluster_name, workers, purge_workers)
     cleaner.cleanup_resources()
 
 if __name__ == '__main__':
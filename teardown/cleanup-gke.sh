@@ -44,6 +44,106 @@ resource_exists() {
     fi
 }
 
+# Deletions run as background jobs so independent resources go at the same time.
+# start_deletion <kind> <name> <location> <command...> starts one, wait_deletions waits
+# for all started ones (up to DELETE_TIMEOUT seconds) and checks that each is really gone.
+DELETE_TIMEOUT=${DELETE_TIMEOUT:-1800}
+POLL_INTERVAL=${POLL_INTERVAL:-10}
+JOB_LOGS=$(mktemp -d)
+trap 'rm -rf "$JOB_LOGS"' EXIT
+JOB_COUNT=0
+JOB_PIDS=(); JOB_KINDS=(); JOB_NAMES=(); JOB_LOCATIONS=(); JOB_OUTPUTS=()
+GONE=(); LEFT=()
+
+start_deletion() {
+    local kind="$1" name="$2" location="$3"
+    shift 3
+    JOB_COUNT=$((JOB_COUNT + 1))
+    ("$@") >"$JOB_LOGS/$JOB_COUNT.log" 2>&1 &
+    JOB_PIDS+=("$!"); JOB_KINDS+=("$kind"); JOB_NAMES+=("$name"); JOB_LOCATIONS+=("$location")
+    JOB_OUTPUTS+=("$JOB_LOGS/$JOB_COUNT.log")
+    echo "Deleting $kind $name..."
+}
+
+# Succeeds when the resource can no longer be found
+resource_gone() {
+    local kind="$1" name="$2" location="$3"
+    case "$kind" in
+        cluster) ! gcloud container clusters describe "$name" --zone "$location" --project "$PROJECT_ID" >/dev/null 2>&1;;
+        repository) ! gcloud artifacts repositories describe "$name" --location "$location" --project "$PROJECT_ID" >/dev/null 2>&1;;
+        "service account") ! gcloud iam service-accounts describe "$name" --project "$PROJECT_ID" >/dev/null 2>&1;;
+        # Deleted roles stay describable for a few days, flagged as deleted
+        role) [ "$(gcloud iam roles describe "$name" --project "$PROJECT_ID" --format="value(deleted)" 2>/dev/null)" = "True" ] ||
+              ! gcloud iam roles describe "$name" --project "$PROJECT_ID" >/dev/null 2>&1;;
+        "firewall rule") ! gcloud compute firewall-rules describe "$name" --project "$PROJECT_ID" >/dev/null 2>&1;;
+        "load balancer") ! gcloud compute forwarding-rules describe "$name" --region "$location" --project "$PROJECT_ID" >/dev/null 2>&1;;
+    esac
+}
+
+wait_deletions() {
+    local started=$SECONDS timed_out="" running i pid status
+    while true; do
+        running=0
+        for pid in "${JOB_PIDS[@]}"; do
+            kill -0 "$pid" 2>/dev/null && running=$((running + 1))
+        done
+        [ "$running" -eq 0 ] && break
+        if [ $((SECONDS - started)) -ge "$DELETE_TIMEOUT" ]; then
+            echo -e "${RED}Timed out after ${DELETE_TIMEOUT}s waiting for $running deletion(s)${NC}"
+            timed_out="timed out after ${DELETE_TIMEOUT}s"
+            for pid in "${JOB_PIDS[@]}"; do
+                pkill -P "$pid" 2>/dev/null
+                kill "$pid" 2>/dev/null
+            done
+            break
+        fi
+        echo "Waiting for $running of ${#JOB_PIDS[@]} deletion(s)... ($((SECONDS - started))s)"
+        sleep "$POLL_INTERVAL"
+    done
+
+    for i in "${!JOB_PIDS[@]}"; do
+        status=0
+        wait "${JOB_PIDS[$i]}" 2>/dev/null || status=$?
+        local label="${JOB_KINDS[$i]} ${JOB_NAMES[$i]}"
+        if resource_gone "${JOB_KINDS[$i]}" "${JOB_NAMES[$i]}" "${JOB_LOCATIONS[$i]}"; then
+            GONE+=("$label")
+            echo -e "${GREEN}Deleted $label${NC}"
+        else
+            local reason="still present"
+            [ "$status" -ne 0 ] && reason=$(grep -v '^\s*$' "${JOB_OUTPUTS[$i]}" | tail -n 1)
+            [ "$status" -gt 128 ] && [ -n "$timed_out" ] && reason="$timed_out"
+            LEFT+=("$label: ${reason:-exit code $status}")
+            echo -e "${RED}Could not delete $label: ${reason:-exit code $status}${NC}"
+        fi
+    done
+    JOB_PIDS=(); JOB_KINDS=(); JOB_NAMES=(); JOB_LOCATIONS=(); JOB_OUTPUTS=()
+}
+
+# Starts the deletion and follows its operation, `clusters delete` would block until it is done
+delete_cluster() {
+    local name="$1" zone="$2" operation
+    gcloud container clusters delete "$name" --zone "$zone" --project "$PROJECT_ID" --quiet --async || return 1
+    operation=$(gcloud container operations list --zone "$zone" --project "$PROJECT_ID" \
+        --filter="operationType=DELETE_CLUSTER AND targetLink~/clusters/${name}$ AND status!=DONE" \
+        --format="value(name)" --limit 1)
+    if [ -n "$operation" ]; then
+        gcloud container operations wait "$operation" --zone "$zone" --project "$PROJECT_ID"
+    fi
+}
+
+print_summary() {
+    echo -e "\n${GREEN}Confirmed gone (${#GONE[@]}):${NC}"
+    for resource in "${GONE[@]}"; do
+        echo "  - $resource"
+    done
+    if [ ${#LEFT[@]} -gt 0 ]; then
+        echo -e "${RED}Not deleted (${#LEFT[@]}):${NC}"
+        for resource in "${LEFT[@]}"; do
+            echo "  - $resource"
+        done
+    fi
+}
+
 # Default project ID error check
 if [ -z "$1" ]; then
     echo -e "${RED}Error: Project ID is required${NC}"
@@ -71,13 +171,11 @@ if resource_exists "$CLUSTERS"; then
             if [ -n "$cluster_info" ] && [[ ! "$cluster_info" =~ "NAME" ]]; then
                 CLUSTER_NAME=$(echo "$cluster_info" | awk '{print $1}')
                 ZONE=$(echo "$cluster_info" | awk '{print $2}')
-                echo "Deleting cluster $CLUSTER_NAME in zone $ZONE..."
-                gcloud container clusters delete "$CLUSTER_NAME" \
-                    --zone "$ZONE" \
-                    --project "$PROJECT_ID" \
-                    --quiet
+                start_deletion cluster "$CLUSTER_NAME" "$ZONE" delete_cluster "$CLUSTER_NAME" "$ZONE"
             fi
         done <<< "$CLUSTERS"
+        # The remaining resources are looked up in the clusters left and may belong to the deleted ones
+        wait_deletions
     fi
 else
     echo "No GKE clusters found."
@@ -117,8 +215,8 @@ if resource_exists "$REPOSITORIES"; then
         while IFS= read -r repo_info; do
             if [ -n "$repo_info" ] && [[ ! "$repo_info" =~ "NAME" ]]; then
                 REPO_NAME=$(echo "$repo_info" | awk '{print $1}')
-                echo "Deleting repository $REPO_NAME in $REPO_LOCATION..."
-                gcloud artifacts repositories delete "$REPO_NAME" \
+                start_deletion repository "$REPO_NAME" "$REPO_LOCATION" \
+                    gcloud artifacts repositories delete "$REPO_NAME" \
                     --location="$REPO_LOCATION" \
                     --project="$PROJECT_ID" \
                     --quiet
@@ -137,8 +235,8 @@ if resource_exists "$SERVICE_ACCOUNTS"; then
     if confirm "Would you like to delete these service accounts?"; then
         while IFS= read -r sa_email; do
             if [ -n "$sa_email" ]; then
-                echo "Deleting service account: $sa_email"
-                gcloud iam service-accounts delete "$sa_email" \
+                start_deletion "service account" "$sa_email" "" \
+                    gcloud iam service-accounts delete "$sa_email" \
                     --project "$PROJECT_ID" \
                     --quiet
             fi
@@ -157,8 +255,8 @@ if resource_exists "$CUSTOM_ROLES"; then
         while IFS= read -r role; do
             if [ -n "$role" ]; then
                 ROLE_ID=${role#projects/$PROJECT_ID/roles/}
-                echo "Deleting role: $ROLE_ID"
-                gcloud iam roles delete "$ROLE_ID" \
+                start_deletion role "$ROLE_ID" "" \
+                    gcloud iam roles delete "$ROLE_ID" \
                     --project "$PROJECT_ID" \
                     --quiet
             fi
@@ -176,8 +274,8 @@ if resource_exists "$FIREWALL_RULES"; then
     if confirm "Would you like to delete these GKE-related firewall rules?"; then
         while IFS= read -r rule; do
             if [ -n "$rule" ] && [[ ! "$rule" =~ "NAME" ]]; then
-                echo "Deleting firewall rule: $rule"
-                gcloud compute firewall-rules delete "$rule" --project "$PROJECT_ID" --quiet
+                start_deletion "firewall rule" "$rule" "" \
+                    gcloud compute firewall-rules delete "$rule" --project "$PROJECT_ID" --quiet
             fi
         done <<< "$FIREWALL_RULES"
     fi
@@ -195,8 +293,8 @@ if resource_exists "$FORWARDING_RULES"; then
             if [ -n "$lb_info" ] && [[ ! "$lb_info" =~ "NAME" ]]; then
                 LB_NAME=$(echo "$lb_info" | awk '{print $1}')
                 REGION=$(echo "$lb_info" | awk '{print $2}')
-                echo "Deleting load balancer: $LB_NAME in region $REGION"
-                gcloud compute forwarding-rules delete "$LB_NAME" \
+                start_deletion "load balancer" "$LB_NAME" "$REGION" \
+                    gcloud compute forwarding-rules delete "$LB_NAME" \
                     --region "$REGION" \
                     --project "$PROJECT_ID" \
                     --quiet
@@ -207,4 +305,9 @@ else
     echo "No matching load balancers found."
 fi
 
-echo -e "${GREEN}🧹 Cleanup process completed!${NC}"
\ No newline at end of file
+# Repositories, service accounts, roles, firewall rules and load balancers were deleted side by side
+wait_deletions
+print_summary
+
+echo -e "${GREEN}🧹 Cleanup process completed!${NC}"
+[ ${#LEFT[@]} -eq 0 ]
\ No newline at end of file